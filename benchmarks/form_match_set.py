@@ -0,0 +1,71 @@
+"""
+Measures time of forming ACS2 match sets with and without checking types
+of the match set elements (see `TypedList.from_trusted`).
+
+Usage:
+
+    python benchmarks/form_match_set.py
+"""
+import random
+import timeit
+
+from lcs import Perception
+from lcs.agents.acs2 import Configuration, Classifier, ClassifiersList
+
+POPULATION_SIZE = 2000
+CLASSIFIER_LENGTH = 16
+REPEATS = 200
+
+
+def random_population(cfg: Configuration) -> ClassifiersList:
+    return ClassifiersList(*[
+        Classifier(
+            condition=''.join(random.choice('01##')
+                              for _ in range(cfg.classifier_length)),
+            action=random.randrange(cfg.number_of_possible_actions),
+            cfg=cfg)
+        for _ in range(POPULATION_SIZE)])
+
+
+def form_match_set_checked(population: ClassifiersList,
+                           situation: Perception) -> ClassifiersList:
+    # Equivalent of `form_match_set` validating the match set elements
+    matching = [cl for cl in population if cl.does_match(situation)]
+    return ClassifiersList(*matching)
+
+
+def measure(fun) -> float:
+    # The best of few runs is the least disturbed by other processes
+    return min(timeit.repeat(fun, number=1, repeat=5))
+
+
+def report(name: str, checked: float, trusted: float) -> None:
+    print(f"{name:<16} checked: {checked:.3f}s, trusted: {trusted:.3f}s "
+          f"({100 * (1 - trusted / checked):.1f}% faster)")
+
+
+if __name__ == '__main__':
+    random.seed(42)
+    cfg = Configuration(classifier_length=CLASSIFIER_LENGTH,
+                        number_of_possible_actions=4)
+    population = random_population(cfg)
+    print(f"population: {POPULATION_SIZE}, match sets: {REPEATS}")
+    situations = [Perception(random.choice('01')
+                             for _ in range(CLASSIFIER_LENGTH))
+                  for _ in range(REPEATS)]
+
+    # Building match sets from already matched classifiers
+    matched = [[cl for cl in population if cl.does_match(p)]
+               for p in situations]
+    checked = measure(
+        lambda: [ClassifiersList(*m) for m in matched])
+    trusted = measure(
+        lambda: [ClassifiersList.from_trusted(*m) for m in matched])
+    report('construction', checked, trusted)
+
+    # Whole `form_match_set` (matching dominates)
+    checked = measure(
+        lambda: [form_match_set_checked(population, p) for p in situations])
+    trusted = measure(
+        lambda: [population.form_match_set(p) for p in situations])
+    report('form_match_set', checked, trusted)
@@ -0,0 +1,71 @@
+"""
+Measures time of forming rACS match sets by scanning the population,
+with vectorized interval comparisons and with a spatial index
+(see `IntervalIndex`), for a population of mostly narrow conditions.
+
+Usage:
+
+    python benchmarks/racs_match_set.py
+"""
+import random
+import timeit
+
+from lcs.agents.racs import Configuration, Classifier, ClassifierList, \
+    Condition, EncodedPerception, IntervalIndexedClassifierList, \
+    VectorizedClassifierList
+from lcs.representations import UBR
+from lcs.representations.RealValueEncoder import RealValueEncoder
+
+POPULATION_SIZE = 5000
+CLASSIFIER_LENGTH = 4
+RESOLUTION_BITS = 10
+MAX_WIDTH = 256
+REPEATS = 200
+
+
+def random_classifier(cfg: Configuration) -> Classifier:
+    upper_max = cfg.encoder.range[1]
+    condition = []
+    for _ in range(cfg.classifier_length):
+        if random.random() < 0.2:
+            condition.append(cfg.classifier_wildcard)
+        else:
+            lower = random.randint(0, upper_max)
+            upper = min(lower + random.randint(0, MAX_WIDTH), upper_max)
+            condition.append(UBR(lower, upper))
+
+    return Classifier(condition=Condition(condition, cfg),
+                      action=random.randrange(cfg.number_of_possible_actions),
+                      cfg=cfg)
+
+
+def measure(fun) -> float:
+    # The best of few runs is the least disturbed by other processes
+    return min(timeit.repeat(fun, number=1, repeat=3))
+
+
+if __name__ == '__main__':
+    random.seed(42)
+    cfg = Configuration(classifier_length=CLASSIFIER_LENGTH,
+                        number_of_possible_actions=4,
+                        encoder=RealValueEncoder(RESOLUTION_BITS))
+    classifiers = [random_classifier(cfg) for _ in range(POPULATION_SIZE)]
+    situations = [EncodedPerception([random.random()
+                                     for _ in range(CLASSIFIER_LENGTH)],
+                                    cfg.encoder)
+                  for _ in range(REPEATS)]
+
+    print(f"population: {POPULATION_SIZE}, bits: {RESOLUTION_BITS}, "
+          f"match sets: {REPEATS}")
+
+    results = {}
+    for population_cls in [ClassifierList,
+                           VectorizedClassifierList,
+                           IntervalIndexedClassifierList]:
+        population = population_cls(*classifiers)
+        results[population_cls.__name__] = measure(
+            lambda: [population.form_match_set(p) for p in situations])
+
+    scan = results[ClassifierList.__name__]
+    for name, elapsed in results.items():
+        print(f"{name}: {elapsed:.3f}s ({scan / elapsed:.1f}x faster)")
@@ -0,0 +1,62 @@
+"""
+Measures time of encoding real values with `RealValueEncoder` for
+different resolutions - scanning all the splits (former implementation),
+the constant-time `encode` and the vectorized `encode_batch`.
+
+Usage:
+
+    python benchmarks/real_value_encoder.py
+"""
+import random
+import timeit
+
+import numpy as np
+
+from lcs.representations.RealValueEncoder import RealValueEncoder
+
+VALUES = 10000
+
+
+def encode_with_splits(encoder: RealValueEncoder, val: float) -> int:
+    # Former `encode` iterating over all the splits
+    val = np.clip(val, 0, 1)
+
+    if val == 0:
+        return encoder.range[0]
+
+    if val == 1:
+        return encoder.range[1]
+
+    bucket = -1
+    for i, _ in enumerate(encoder.splits[:-1]):
+        x1 = encoder.splits[i]
+        x2 = encoder.splits[i + 1]
+
+        if x1 <= val < x2:
+            bucket = i
+
+    return bucket
+
+
+def measure(fun) -> float:
+    # The best of few runs is the least disturbed by other processes
+    return min(timeit.repeat(fun, number=1, repeat=3))
+
+
+if __name__ == '__main__':
+    random.seed(42)
+    values = [random.random() for _ in range(VALUES)]
+    array = np.array(values)
+
+    print(f"values: {VALUES}")
+    for bits in range(4, 11):
+        encoder = RealValueEncoder(bits)
+
+        splits = measure(
+            lambda: [encode_with_splits(encoder, v) for v in values])
+        scalar = measure(lambda: [encoder.encode(v) for v in values])
+        batch = measure(lambda: encoder.encode_batch(array))
+
+        print(f"bits: {bits:2d}, splits: {splits:.4f}s, "
+              f"encode: {scalar:.4f}s ({splits / scalar:.0f}x faster), "
+              f"encode_batch: {batch:.5f}s ({splits / batch:.0f}x faster)")
@@ -0,0 +1,68 @@
+"""
+Measures time of the XCS roulette-wheel deletion in a population kept
+at its maximum size, with votes recomputed on every deletion (linear
+scan) and maintained in a sum tree.
+
+Usage:
+
+    python benchmarks/xcs_deletion.py
+"""
+import random
+import timeit
+
+from lcs.agents.xcs import Configuration, Classifier, Condition, \
+    ClassifiersList
+
+POPULATION_SIZE = 10000
+CONDITION_LENGTH = 20
+REPEATS = 200
+
+
+def random_classifier(cfg: Configuration) -> Classifier:
+    cl = Classifier(cfg,
+                    Condition(''.join(random.choice('01#')
+                                      for _ in range(CONDITION_LENGTH))),
+                    random.randrange(cfg.number_of_actions), 0)
+    cl.fitness = random.random()
+    cl.experience = random.randrange(40)
+    cl.action_set_size = random.randrange(1, 20)
+    return cl
+
+
+def delete_linear(population: ClassifiersList) -> None:
+    # Former `delete_from_population` computing votes of all classifiers
+    if population.numerosity > population.cfg.max_population:
+        average_fitness = population.fitness / population.numerosity
+        deletion_votes = [population._deletion_vote(cl, average_fitness)
+                          for cl in population]
+        selector = random.uniform(0, sum(deletion_votes))
+        population._remove_based_on_votes(deletion_votes, selector)
+
+
+def run(delete, population: ClassifiersList, newcomers) -> None:
+    for cl in newcomers:
+        population.insert_in_population(cl)
+        delete(population)
+
+
+def measure(fun) -> float:
+    # The best of few runs is the least disturbed by other processes
+    return min(timeit.repeat(fun, number=1, repeat=5))
+
+
+if __name__ == '__main__':
+    random.seed(42)
+    cfg = Configuration(number_of_actions=4,
+                        max_population=POPULATION_SIZE)
+    population = ClassifiersList(cfg)
+    while len(population) < POPULATION_SIZE:
+        population.insert_in_population(random_classifier(cfg))
+
+    print(f"population: {POPULATION_SIZE}, deletions: {REPEATS}")
+    newcomers = [random_classifier(cfg) for _ in range(REPEATS)]
+
+    linear = measure(lambda: run(delete_linear, population, newcomers))
+    tree = measure(lambda: run(ClassifiersList.delete_from_population,
+                               population, newcomers))
+    print(f"linear: {linear:.3f}s, sum tree: {tree:.3f}s "
+          f"({linear / tree:.1f}x faster)")
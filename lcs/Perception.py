@@ -7,18 +7,26 @@ class Perception(collections.abc.Sequence):
     By default each environment attribute is represented as `str` type.
     """
 
-    __slots__ = ['_items', 'oktypes']
+    __slots__ = ['_items', 'oktypes', '_hash', 'uid']
 
     def __init__(self, observation, oktypes=(str,)):
         assert all(type(e) in oktypes for e in observation)
         self._items = tuple(observation)
+        self.oktypes = oktypes
+        self._hash = None
+
+        # Integer identifier assigned to canonical (interned) perceptions
+        self.uid = None
 
     @classmethod
     def empty(cls):
         return cls([], oktypes=(None,))
 
     def __hash__(self):
-        return hash(self._items)
+        if self._hash is None:
+            self._hash = hash(self._items)
+
+        return self._hash
 
     def __getitem__(self, i):
         return self._items[i]
@@ -30,4 +38,7 @@ class Perception(collections.abc.Sequence):
         return ' '.join(map(str, self))
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
         return all(p0 == p1 for p0, p1 in zip(self, other))
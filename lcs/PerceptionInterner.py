@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from . import Perception
+
+
+class PerceptionInterner:
+    """
+    Returns a canonical `Perception` object for each distinct observation.
+
+    Canonical perceptions are validated once, carry a cached hash and
+    an integer identifier (`uid`) which can be used as a key in other
+    caches. Since equal observations end up as the same object, comparing
+    them boils down to the identity check.
+
+    Only `max_size` recently used perceptions are kept (LRU), so large
+    state spaces do not exhaust the memory. Setting `max_size` to 0
+    disables interning.
+    """
+
+    def __init__(self, max_size: int = 10000) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._cache: Dict[Tuple, Perception] = OrderedDict()
+        self._next_uid = 0
+
+    def __call__(self, observation) -> Perception:
+        """
+        Parameters
+        ----------
+        observation
+            raw observation (or perception)
+
+        Returns
+        -------
+        Perception
+            canonical perception
+        """
+        if self.max_size <= 0:
+            return Perception(observation)
+
+        key = tuple(observation)
+        perception = self._cache.get(key)
+
+        if perception is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return perception
+
+        self.misses += 1
+
+        perception = Perception(key)
+        perception.uid = self._next_uid
+        self._next_uid += 1
+
+        self._cache[key] = perception
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+        return perception
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        self._cache.clear()
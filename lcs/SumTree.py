@@ -0,0 +1,129 @@
+from typing import List
+
+
+class SumTree:
+    """
+    Sequence of non-negative weights supporting prefix sums (Fenwick tree).
+
+    Changing a weight, computing the total and finding the slot in which
+    a cumulative value falls (roulette-wheel selection) take O(log n).
+    Slots are appended at the end; the capacity grows when needed.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        self._capacity = 1
+        while self._capacity < capacity:
+            self._capacity *= 2
+
+        self._weights: List[float] = []
+        self._tree: List[float] = [0.0] * (self._capacity + 1)
+
+    @property
+    def total(self) -> float:
+        """
+        Returns
+        -------
+        float
+            sum of all weights
+        """
+        return self.prefix(len(self._weights))
+
+    def append(self, weight: float) -> int:
+        """
+        Adds new slot at the end.
+
+        Parameters
+        ----------
+        weight: float
+            weight of the slot
+
+        Returns
+        -------
+        int
+            index of the slot
+        """
+        if len(self._weights) == self._capacity:
+            self._grow()
+
+        self._weights.append(0.0)
+        index = len(self._weights) - 1
+        self[index] = weight
+
+        return index
+
+    def prefix(self, end: int) -> float:
+        """
+        Parameters
+        ----------
+        end: int
+            index of the first slot not included
+
+        Returns
+        -------
+        float
+            sum of weights of slots preceding `end`
+        """
+        total, i = 0.0, end
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def find(self, value: float) -> int:
+        """
+        Finds the first slot at which cumulative sum of weights reaches
+        given value.
+
+        Parameters
+        ----------
+        value: float
+            value from (0, total]
+
+        Returns
+        -------
+        int
+            index of the slot, `len(self)` if `value` exceeds the total
+        """
+        index, step = 0, self._capacity
+        while step > 0:
+            nxt = index + step
+            if nxt <= self._capacity and self._tree[nxt] < value:
+                index = nxt
+                value -= self._tree[nxt]
+            step //= 2
+
+        return min(index, len(self._weights))
+
+    def clear(self) -> None:
+        self._weights.clear()
+        self._tree = [0.0] * (self._capacity + 1)
+
+    def __getitem__(self, index: int) -> float:
+        return self._weights[index]
+
+    def __setitem__(self, index: int, weight: float) -> None:
+        assert weight >= 0
+        delta = weight - self._weights[index]
+        self._weights[index] = weight
+
+        i = index + 1
+        while i <= self._capacity:
+            self._tree[i] += delta
+            i += i & -i
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        tree = [0.0] * (self._capacity + 1)
+        for i, weight in enumerate(self._weights, start=1):
+            tree[i] = weight
+
+        # Linear-time Fenwick tree construction
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+
+        self._tree = tree
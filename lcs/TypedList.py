@@ -7,16 +7,45 @@ T = TypeVar('T')
 
 
 class TypedList(collections.abc.MutableSequence, Generic[T]):
-    __slots__ = ['_items', 'oktypes']
+    __slots__ = ['_items', 'oktypes', '_trusted']
 
     def __init__(self, *args, oktypes):
         self._items: List[T] = list()
         self.oktypes = oktypes
 
-        for el in args:
-            check_types(self.oktypes, el)
-
-        self._items.extend(list(args))
+        # Set on this very list before the constructor runs (see
+        # `from_trusted`), so other lists are always checked
+        if not getattr(self, '_trusted', False):
+            for el in args:
+                check_types(self.oktypes, el)
+
+        self._trusted = False
+        self._items.extend(args)
+
+    @classmethod
+    def from_trusted(cls, *args, **kwargs):
+        """
+        Creates the list without checking types of the initial elements.
+        Meant for lists built internally from elements that were already
+        validated (i.e. match sets formed from the population). Elements
+        added later are checked as usual.
+
+        Parameters
+        ----------
+        args
+            constructor arguments
+        kwargs
+            constructor keyword arguments
+
+        Returns
+        -------
+        TypedList
+            new list
+        """
+        lst = cls.__new__(cls)
+        lst._trusted = True
+        lst.__init__(*args, **kwargs)
+        return lst
 
     def insert(self, index: int, o: T) -> None:
         check_types(self.oktypes, o)
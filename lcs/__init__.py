@@ -2,3 +2,5 @@
 from .utils import check_types
 from .Perception import Perception
 from .TypedList import TypedList
+from .PerceptionInterner import PerceptionInterner
+from .SumTree import SumTree
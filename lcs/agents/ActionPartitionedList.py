@@ -0,0 +1,604 @@
+from bisect import bisect_left, insort
+from typing import Callable, Dict, Generic, Hashable, List, Optional, Set, \
+    Sequence, Tuple, TypeVar
+
+from lcs import TypedList
+from lcs.strategies.subsumption import does_subsume, is_subsumer
+
+T = TypeVar('T')
+
+# Smaller lists (i.e. match sets) are just scanned when removing elements
+_REMOVAL_INDEX_MIN_SIZE = 64
+
+# Number of recent changes remembered (see `changes_since`
+# and `refreshed_since`)
+_JOURNAL_SIZE = 1024
+
+
+class _Buckets(Generic[T]):
+    """
+    Elements of the list grouped by the key. Each group preserves
+    the list order. Keys are remembered, so the element can be moved
+    to another group after being modified in place.
+
+    Every added element gets the next sequence number (appends preserve
+    the list order, other modifications rebuild the groups), so its place
+    in another group is found with a binary search.
+    """
+
+    def __init__(self, key: Callable[[T], Hashable], items: Sequence[T]):
+        self._key = key
+        self.groups: Dict[Hashable, List[T]] = {}
+        self._seqs: Dict[Hashable, List[int]] = {}
+        self._keys: Dict[int, Hashable] = {}
+        self._entries: Dict[int, List[int]] = {}
+        self._seq = 0
+
+        for o in items:
+            self.add(o)
+
+    def add(self, o: T) -> None:
+        key = self._key(o)
+        self.groups.setdefault(key, []).append(o)
+        self._seqs.setdefault(key, []).append(self._seq)
+        self._keys[id(o)] = key
+        self._entries.setdefault(id(o), []).append(self._seq)
+        self._seq += 1
+
+    def discard(self, o: T) -> None:
+        key = self._keys[id(o)]
+
+        # Remove the first occurrence (the same object might be stored twice)
+        entries = self._entries[id(o)]
+        self._unplace(key, entries.pop(0))
+
+        if not entries:
+            del self._keys[id(o)]
+            del self._entries[id(o)]
+
+    def refresh(self, o: T) -> bool:
+        """Regroups the element, returns True if its key changed"""
+        old_key = self._keys.get(id(o))
+        if old_key is None:
+            return False
+
+        key = self._key(o)
+        if key == old_key:
+            return False
+
+        for seq in self._entries[id(o)]:
+            self._unplace(old_key, seq)
+
+            group = self.groups.setdefault(key, [])
+            seqs = self._seqs.setdefault(key, [])
+            idx = bisect_left(seqs, seq)
+            group.insert(idx, o)
+            seqs.insert(idx, seq)
+
+        self._keys[id(o)] = key
+        return True
+
+    def _unplace(self, key: Hashable, seq: int) -> None:
+        group, seqs = self.groups[key], self._seqs[key]
+        idx = bisect_left(seqs, seq)
+        del group[idx]
+        del seqs[idx]
+
+        if not group:
+            del self.groups[key]
+            del self._seqs[key]
+
+
+class _Subsumers(Generic[T]):
+    """
+    Classifiers eligible to be subsumers (see `is_subsumer`) grouped by
+    the key. Each group is kept sorted by the condition specificity
+    (most general first), ties are resolved by the insertion sequence.
+    """
+
+    def __init__(self,
+                 key: Callable[[T], Hashable],
+                 theta_exp: int,
+                 items: Sequence[T]):
+        self._key = key
+        self.theta_exp = theta_exp
+        self.groups: Dict[Hashable, List[Tuple[int, int, T]]] = {}
+        self._entries: Dict[int, List[Tuple[int, Hashable, int]]] = {}
+        self._seq = 0
+
+        for o in items:
+            self.add(o)
+
+    def add(self, o: T) -> None:
+        self._place(o, self._seq)
+        self._seq += 1
+
+    def discard(self, o: T) -> None:
+        entries = self._entries[id(o)]
+
+        # Remove the first occurrence (the same object might be stored twice)
+        seq, key, specificity = entries.pop(0)
+        self._unplace(o, seq, key, specificity)
+
+        if not entries:
+            del self._entries[id(o)]
+
+    def refresh_mark(self) -> int:
+        """
+        Starts recording classifiers reported with `refresh` (if not
+        recorded yet).
+
+        Returns
+        -------
+        int
+            current position in the record, classifiers reported
+            afterwards can be retrieved with `refreshed_since`
+        """
+        if self._refreshed is None:
+            self._refreshed = []
+
+        return self._refreshed_start + len(self._refreshed)
+
+    def refreshed_since(self, mark: int) -> Optional[List[T]]:
+        """
+        Returns classifiers reported with `refresh` after given mark.
+
+        Parameters
+        ----------
+        mark: int
+            position returned by `refresh_mark`
+
+        Returns
+        -------
+        Optional[List[T]]
+            refreshed classifiers in the order of reports (possibly
+            repeated), None if they were reported too long ago
+        """
+        if self._refreshed is None or mark < self._refreshed_start:
+            return None
+
+        return self._refreshed[mark - self._refreshed_start:]
+
+    def refresh(self, o: T) -> None:
+        entries = self._entries.pop(id(o), [])
+
+        for seq, key, specificity in entries:
+            self._unplace(o, seq, key, specificity)
+
+        for seq, _, _ in entries:
+            self._place(o, seq)
+
+    def _place(self, o: T, seq: int) -> None:
+        key, specificity = None, None
+
+        if is_subsumer(o, self.theta_exp):
+            key, specificity = self._key(o), o.condition.specificity
+            insort(self.groups.setdefault(key, []), (specificity, seq, o))
+
+        self._entries.setdefault(id(o), []).append((seq, key, specificity))
+
+    def _unplace(self, o: T, seq: int, key: Hashable, specificity) -> None:
+        if specificity is None:
+            return
+
+        group = self.groups[key]
+        del group[bisect_left(group, (specificity, seq))]
+
+        if not group:
+            del self.groups[key]
+
+
+class _Positions(Generic[T]):
+    """
+    Maps elements (by identity) to their positions in the list.
+
+    Each appended element gets the next slot. Removed elements leave
+    tombstones, so a position is the number of live slots preceding
+    the element's slot (kept in a Fenwick tree). Both removal and
+    lookup take O(log n).
+    """
+
+    def __init__(self, items: Sequence[T]):
+        self._slots: Dict[int, List[int]] = {}
+        self._tree: List[int] = [0] * (2 * len(items) + 2)
+        self._used = 0
+        self.alive = 0
+
+        for o in items:
+            self.add(o)
+
+    @property
+    def dead(self) -> int:
+        return self._used - self.alive
+
+    def add(self, o: T) -> None:
+        if self._used + 1 >= len(self._tree):
+            self._grow()
+
+        self._update(self._used, 1)
+        self._slots.setdefault(id(o), []).append(self._used)
+        self._used += 1
+        self.alive += 1
+
+    def index(self, o: T) -> int:
+        # Slots are increasing - the first one is the first occurrence
+        return self._prefix(self._slots[id(o)][0])
+
+    def discard(self, o: T, index: int) -> None:
+        slots = self._slots[id(o)]
+
+        for idx, slot in enumerate(slots):
+            if self._prefix(slot) == index:
+                del slots[idx]
+                self._update(slot, -1)
+                self.alive -= 1
+                break
+
+        if not slots:
+            del self._slots[id(o)]
+
+    def _prefix(self, slot: int) -> int:
+        """Number of live slots before the `slot`"""
+        total, i = 0, slot
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _update(self, slot: int, delta: int) -> None:
+        i = slot + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _grow(self) -> None:
+        live = [0] * (2 * len(self._tree))
+        for slots in self._slots.values():
+            for slot in slots:
+                live[slot + 1] = 1
+
+        # Linear-time Fenwick tree construction
+        for i in range(1, len(live)):
+            parent = i + (i & -i)
+            if parent < len(live):
+                live[parent] += live[i]
+
+        self._tree = live
+
+
+class ActionPartitionedList(TypedList, Generic[T]):
+    """
+    Typed list of classifiers additionally grouping its elements by
+    the `action` attribute, by the condition-action-effect triple
+    (see `find_similar`) and keeping track of potential subsumers
+    (see `find_subsumers`).
+
+    Groups are built on first use and then maintained on every
+    modification of the list. Each group preserves the list order,
+    therefore subset of classifiers advocating given action (i.e. action
+    set) or duplicates of given classifier are available without scanning
+    the whole list.
+
+    Removing elements from larger lists (i.e. population) does not scan
+    the list either - equal element is found with the similarity index,
+    and its position is tracked by identity.
+
+    Each modification that might affect match sets (appending, removing
+    or reordering elements, changing a condition in place) increments
+    the `generation` counter. Recent appends and removals are also
+    journaled, so results derived from the list (i.e. cached match sets)
+    can be patched instead of being recomputed (see `checkpoint`).
+
+    Classifiers modified in place must be reported with `refresh`.
+    Recent reports can be recorded as well, so models derived from
+    the classifiers' properties are updated without scanning the list
+    (see `refresh_mark`).
+    """
+
+    def __init__(self, *args, oktypes) -> None:
+        super().__init__(*args, oktypes=oktypes)
+        self._buckets: Optional[_Buckets[T]] = None
+        self._similar: Optional[_Buckets[T]] = None
+        self._subsumers: Optional[_Subsumers[T]] = None
+        self._positions: Optional[_Positions[T]] = None
+        self._conditions: Optional[_Buckets[T]] = None
+        self._journal: List[Tuple[bool, T]] = []
+        self._journal_start = 0
+        self._refreshed: Optional[List[T]] = None
+        self._refreshed_start = 0
+        self.generation = 0
+
+    @property
+    def actions(self) -> Set[int]:
+        """
+        Returns
+        -------
+        Set[int]
+            actions advocated by at least one classifier in the list
+        """
+        return set(self._partition().keys())
+
+    def by_action(self, action: int) -> List[T]:
+        """
+        Returns classifiers advocating given action (in the list order).
+
+        Parameters
+        ----------
+        action: int
+            action
+
+        Returns
+        -------
+        List[T]
+            classifiers with given action
+        """
+        return list(self._partition().get(action, ()))
+
+    def partition(self) -> Dict[int, List[T]]:
+        """
+        Returns
+        -------
+        Dict[int, List[T]]
+            classifiers grouped by their actions (in the list order)
+        """
+        return {a: list(b) for a, b in self._partition().items()}
+
+    def find_similar(self, o: T) -> List[T]:
+        """
+        Returns classifiers equal to `o` (the same condition, action
+        and effect) in the list order.
+
+        Parameters
+        ----------
+        o: T
+            classifier to compare
+
+        Returns
+        -------
+        List[T]
+            similar classifiers
+        """
+        if self._similar is None:
+            self._similar = _Buckets(self._similarity_key, self._items)
+
+        group = self._similar.groups.get(self._similarity_key(o), ())
+        return [el for el in group if el == o]
+
+    def find_subsumers(self, o: T, theta_exp: int) -> List[T]:
+        """
+        Looks for subsumers of `o`. Only experienced, reliable and not
+        marked classifiers with matching action (and effect) are examined.
+
+        Parameters
+        ----------
+        o: T
+            classifier
+        theta_exp: int
+            subsumption experience threshold
+
+        Returns
+        -------
+        List[T]
+            list of subsumers sorted by specificity (most general are first)
+        """
+        if self._subsumers is None or self._subsumers.theta_exp != theta_exp:
+            self._subsumers = _Subsumers(
+                self._subsumption_key, theta_exp, self._items)
+
+        group = self._subsumers.groups.get(self._subsumption_key(o), ())
+        return [sub for _, _, sub in group
+                if does_subsume(sub, o, theta_exp)]
+
+    def checkpoint(self) -> int:
+        """
+        Starts tracking modifications of the list (if not tracked yet).
+
+        Returns
+        -------
+        int
+            current generation, modifications made afterwards can be
+            retrieved with `changes_since`
+        """
+        if self._conditions is None:
+            # Detects conditions modified in place
+            self._conditions = _Buckets(self._condition_key, self._items)
+
+        return self.generation
+
+    def changes_since(self, generation: int) -> Optional[List[Tuple[bool, T]]]:
+        """
+        Returns modifications of the list made after given checkpoint.
+
+        Parameters
+        ----------
+        generation: int
+            generation returned by `checkpoint`
+
+        Returns
+        -------
+        Optional[List[Tuple[bool, T]]]
+            appended (True) and removed (False) elements in the order
+            of modifications, None if the list was modified in other way
+            (or too long ago) and derived results must be recomputed
+        """
+        if generation < self._journal_start or self._conditions is None:
+            return None
+
+        return self._journal[generation - self._journal_start:]
+
+    def refresh_mark(self) -> int:
+        """
+        Starts recording classifiers reported with `refresh` (if not
+        recorded yet).
+
+        Returns
+        -------
+        int
+            current position in the record, classifiers reported
+            afterwards can be retrieved with `refreshed_since`
+        """
+        if self._refreshed is None:
+            self._refreshed = []
+
+        return self._refreshed_start + len(self._refreshed)
+
+    def refreshed_since(self, mark: int) -> Optional[List[T]]:
+        """
+        Returns classifiers reported with `refresh` after given mark.
+
+        Parameters
+        ----------
+        mark: int
+            position returned by `refresh_mark`
+
+        Returns
+        -------
+        Optional[List[T]]
+            refreshed classifiers in the order of reports (possibly
+            repeated), None if they were reported too long ago
+        """
+        if self._refreshed is None or mark < self._refreshed_start:
+            return None
+
+        return self._refreshed[mark - self._refreshed_start:]
+
+    def refresh(self, o: T) -> None:
+        """
+        Notifies the list that classifier `o` was modified in place
+        (i.e. its condition, effect, experience, quality or mark changed
+        during the ALP) so it can be regrouped. Populations maintaining
+        other auxiliary indexes extend it to keep them in sync.
+
+        Parameters
+        ----------
+        o: T
+            modified classifier (not necessarily a member of the list)
+        """
+        for buckets in self._built():
+            buckets.refresh(o)
+
+        if self._conditions is not None \
+                and self._conditions.refresh(o):
+            self._reset_journal()
+
+        if self._refreshed is not None:
+            self._refreshed.append(o)
+
+            if len(self._refreshed) > _JOURNAL_SIZE:
+                dropped = len(self._refreshed) - _JOURNAL_SIZE // 2
+                del self._refreshed[:dropped]
+                self._refreshed_start += dropped
+
+    def remove(self, o: T) -> None:
+        if self._positions is None \
+                and len(self._items) >= _REMOVAL_INDEX_MIN_SIZE:
+            self._positions = _Positions(self._items)
+
+        similar = []
+        if self._positions is not None and isinstance(o, self.oktypes):
+            similar = self.find_similar(o)
+
+        if similar:
+            del self[self._positions.index(similar[0])]
+        else:
+            super().remove(o)
+
+    def insert(self, index: int, o: T) -> None:
+        appending = index >= len(self._items)
+        super().insert(index, o)
+
+        if appending:
+            for buckets in self._tracking():
+                buckets.add(o)
+            if self._positions is not None:
+                self._positions.add(o)
+            self._record(True, o)
+        else:
+            self._invalidate()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._invalidate()
+
+    def __setitem__(self, i, o):
+        super().__setitem__(i, o)
+        self._invalidate()
+
+    def __delitem__(self, i):
+        if isinstance(i, slice):
+            self._invalidate()
+        else:
+            o = self._items[i]
+            for buckets in self._tracking():
+                buckets.discard(o)
+            if self._positions is not None:
+                self._positions.discard(o, range(len(self._items))[i])
+            self._record(False, o)
+
+        super().__delitem__(i)
+
+        # Compact the tombstones
+        if self._positions is not None and self._positions.dead > \
+                max(self._positions.alive, _REMOVAL_INDEX_MIN_SIZE):
+            self._positions = _Positions(self._items)
+
+    @staticmethod
+    def _similarity_key(o: T) -> Hashable:
+        """
+        Key grouping classifiers that might be equal. Equal classifiers
+        must have equal keys.
+        """
+        return hash(o)
+
+    @staticmethod
+    def _subsumption_key(o: T) -> Hashable:
+        """
+        Key grouping classifiers that might subsume each other.
+        """
+        return o.action
+
+    @staticmethod
+    def _condition_key(o: T) -> Hashable:
+        """
+        Snapshot of the condition, used to detect in-place modifications
+        affecting match sets.
+        """
+        return tuple(o.condition)
+
+    def _partition(self) -> Dict[int, List[T]]:
+        if self._buckets is None:
+            self._buckets = _Buckets(lambda o: o.action, self._items)
+
+        return self._buckets.groups
+
+    def _built(self) -> List[_Buckets[T]]:
+        return [b for b in (self._buckets, self._similar, self._subsumers)
+                if b is not None]
+
+    def _tracking(self) -> List[_Buckets[T]]:
+        if self._conditions is None:
+            return self._built()
+
+        return self._built() + [self._conditions]
+
+    def _record(self, appended: bool, o: T) -> None:
+        self.generation += 1
+        self._journal.append((appended, o))
+
+        if len(self._journal) > _JOURNAL_SIZE:
+            dropped = len(self._journal) - _JOURNAL_SIZE // 2
+            del self._journal[:dropped]
+            self._journal_start += dropped
+
+    def _reset_journal(self) -> None:
+        self.generation += 1
+        self._journal.clear()
+        self._journal_start = self.generation
+
+    def _invalidate(self) -> None:
+        self._buckets = None
+        self._similar = None
+        self._subsumers = None
+        self._positions = None
+        self._conditions = None
+        self._reset_journal()
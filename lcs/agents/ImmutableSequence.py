@@ -1,24 +1,52 @@
 from copy import copy
+from typing import Any, Iterable, Mapping, Optional, Tuple, Union
 
 
 class ImmutableSequence:
+    """
+    Sequence of symbols (i.e. condition or effect part).
+
+    Symbols are kept in a tuple snapshot which can be shared between
+    copies. The first write copies it into a private list buffer, so
+    consecutive writes are cheap. The snapshot (and the hash) is recreated
+    only when needed.
+    """
 
     WILDCARD = '#'
     OK_TYPES = (str, dict)  # PEEs are stored in dict
 
     def __init__(self, observation):
-        obs = tuple(observation)
+        if type(observation) is type(self):
+            # Copy-on-write - share the already validated snapshot
+            obs = observation._items
+        else:
+            obs = tuple(observation)
 
-        assert type(self.WILDCARD) in self.OK_TYPES
-        assert all(isinstance(o, self.OK_TYPES) for o in obs)
+            assert type(self.WILDCARD) in self.OK_TYPES
+            assert all(isinstance(o, self.OK_TYPES) for o in obs)
 
-        self._items = obs
+        self._frozen: Optional[Tuple] = obs
+        self._buffer: Optional[list] = None
+        self._hash: Optional[int] = None
 
     @classmethod
     def empty(cls, length: int):
         ps_str = [copy(cls.WILDCARD) for _ in range(length)]
         return cls(ps_str)
 
+    @property
+    def _items(self) -> Tuple:
+        """
+        Returns
+        -------
+        Tuple
+            hashable snapshot of the symbols
+        """
+        if self._frozen is None:
+            self._frozen = tuple(self._buffer)
+
+        return self._frozen
+
     def subsumes(self, other) -> bool:
         """
         Checks if given perception string subsumes other one.
@@ -35,27 +63,68 @@ class ImmutableSequence:
         """
         raise NotImplementedError()
 
+    def update(self,
+               changes: Union[Mapping[int, Any], Iterable[Tuple[int, Any]]]):
+        """
+        Sets many symbols at once.
+
+        Parameters
+        ----------
+        changes: Union[Mapping[int, Any], Iterable[Tuple[int, Any]]]
+            new symbols keyed by their positions
+        """
+        if isinstance(changes, Mapping):
+            changes = changes.items()
+
+        buffer = self._writable()
+        for index, value in changes:
+            assert isinstance(value, self.OK_TYPES)
+            buffer[index] = value
+
     def __iter__(self):
         return iter(self._items)
 
     def __len__(self) -> int:
-        return len(self._items)
+        return len(self._frozen if self._buffer is None else self._buffer)
 
     def __getitem__(self, index):
-        return self._items[index]
+        if self._buffer is None or isinstance(index, slice):
+            return self._items[index]
+
+        return self._buffer[index]
 
     def __setitem__(self, index, value):
         assert isinstance(value, self.OK_TYPES)
-        lst = list(self._items)
-        lst[index] = value
+        self._writable()[index] = value
+
+    def __copy__(self):
+        result = self.__class__.__new__(self.__class__)
+        result.__dict__.update(self.__dict__)
 
-        self._items = tuple(lst)
+        # Copy shares the snapshot, not the buffer
+        result._frozen = self._items
+        result._buffer = None
+
+        return result
 
     def __eq__(self, other):
         return self._items == other._items
 
     def __hash__(self):
-        return hash(self._items)
+        if self._hash is None:
+            self._hash = hash(self._items)
+
+        return self._hash
 
     def __repr__(self):
         return ''.join(map(str, self._items))
+
+    def _writable(self) -> list:
+        if self._buffer is None:
+            self._buffer = list(self._frozen)
+
+        # Snapshot and hash are outdated from now on
+        self._frozen = None
+        self._hash = None
+
+        return self._buffer
@@ -2,3 +2,4 @@
 from .ImmutableSequence import ImmutableSequence
 from .Agent import Agent
 from .PerceptionString import PerceptionString
+from .ActionPartitionedList import ActionPartitionedList
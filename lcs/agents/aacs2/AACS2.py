@@ -2,9 +2,9 @@ import logging
 
 import numpy as np
 
-from lcs import Perception
+from lcs import Perception, PerceptionInterner
 from lcs.agents.Agent import TrialMetrics
-from lcs.agents.acs2 import ClassifiersList
+from lcs.agents.acs2 import ClassifiersList, MatchSetCache
 from lcs.strategies.action_selection.BestAction import BestAction
 from lcs.strategies.action_selection.RandomAction import RandomAction
 from . import Configuration
@@ -21,7 +21,10 @@ class AACS2(Agent):
                  population: ClassifiersList = None) -> None:
         self.cfg = cfg
         self.rho = estimated_average_reward
-        self.population = population or ClassifiersList()
+        self.population = population \
+            if population is not None else ClassifiersList()
+        self.perceptions = PerceptionInterner(cfg.perception_cache_size)
+        self.match_sets = MatchSetCache(cfg.match_set_cache_size)
 
     def get_population(self):
         return self.population
@@ -46,8 +49,8 @@ class AACS2(Agent):
         was_greedy = False
 
         while not done:
-            state = Perception(state)
-            match_set = self.population.form_match_set(state)
+            state = self.perceptions(state)
+            match_set = self.match_sets(self.population, state)
 
             if steps > 0:
                 # Apply learning in the last action set
@@ -85,11 +88,11 @@ class AACS2(Agent):
             logger.debug("\tExecuting action: [%d]", action)
             action_set = match_set.form_action_set(action)
 
-            prev_state = Perception(state)
+            prev_state = self.perceptions(state)
             prev_M_best_fitness = match_set.get_maximum_fitness()
 
             state, last_reward, done, _ = env.step(action)
-            state = Perception(state)
+            state = self.perceptions(state)
 
             if done:
                 ClassifiersList.apply_alp(
@@ -132,7 +135,7 @@ class AACS2(Agent):
         logger.debug("** Running trial exploit **")
         # Initial conditions
         steps = 0
-        state = Perception(env.reset())
+        state = self.perceptions(env.reset())
 
         last_reward = 0
         action_set = ClassifiersList()
@@ -141,7 +144,7 @@ class AACS2(Agent):
         prev_M_best_fitness = 0
 
         while not done:
-            match_set = self.population.form_match_set(state)
+            match_set = self.match_sets(self.population, state)
 
             if steps > 0:
                 self.apply_reinforcement_learning(
@@ -159,7 +162,7 @@ class AACS2(Agent):
             prev_M_best_fitness = match_set.get_maximum_fitness()
 
             state, last_reward, done, _ = env.step(action)
-            state = Perception(state)
+            state = self.perceptions(state)
 
             if done:
                 self.apply_reinforcement_learning(
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from typing import Optional
 
-from lcs import TypedList, Perception
+from lcs import Perception
+from lcs.agents import ActionPartitionedList
 from lcs.agents.acs import Classifier
 
 
-class ClassifiersList(TypedList):
+class ClassifiersList(ActionPartitionedList):
     """
     Represents overall population, match/action sets
     """
@@ -16,7 +17,7 @@ class ClassifiersList(TypedList):
 
     def form_match_set(self, situation: Perception) -> ClassifiersList:
         matching_ls = [cl for cl in self if cl.does_match(situation)]
-        return ClassifiersList(*matching_ls)
+        return ClassifiersList.from_trusted(*matching_ls)
 
     def get_maximum_fitness(self) -> float:
         """
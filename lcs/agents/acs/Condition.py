@@ -24,9 +24,8 @@ class Condition(ImmutableSequence):
         return sum(1 for attr in self if attr != self.WILDCARD)
 
     def specialize_with_condition(self, other: Condition) -> None:
-        for idx, new_el in enumerate(other):
-            if new_el != self.WILDCARD:
-                self[idx] = new_el
+        self.update((idx, new_el) for idx, new_el in enumerate(other)
+                    if new_el != self.WILDCARD)
 
     def generalize(self, position=None):
         self[position] = self.WILDCARD
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Hashable, Iterator, List, Sequence
+
+from lcs.agents.acs import Condition
+
+# Key under which items are kept in the leaf nodes
+_LEAF = object()
+
+
+class DiscriminationTree:
+    """
+    Discrimination tree (trie) indexing items by ternary strings such as
+    classifier conditions.
+
+    Every level of the tree corresponds to one attribute. Each node has
+    a wildcard branch and a branch for every specific value seen at this
+    position. Items sharing the same string end up in the same leaf.
+
+    Querying with a perception follows only the wildcard branch and the
+    branch of the perceived value, therefore most of the strings are
+    pruned after inspecting just a few attributes.
+    """
+
+    def __init__(self, wildcard: Any = Condition.WILDCARD) -> None:
+        self.wildcard = wildcard
+        self._root: Dict = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, key: Sequence[Hashable], item: Any) -> None:
+        """
+        Stores `item` under the `key` string.
+
+        Parameters
+        ----------
+        key: Sequence[Hashable]
+            ternary string (i.e. condition)
+        item: Any
+            object to be stored
+        """
+        node = self._root
+        for symbol in key:
+            node = node.setdefault(symbol, {})
+
+        node.setdefault(_LEAF, []).append(item)
+        self._size += 1
+
+    def remove(self, key: Sequence[Hashable], item: Any) -> bool:
+        """
+        Removes `item` (compared by identity) stored under the `key` string.
+        Branches left empty are pruned.
+
+        Parameters
+        ----------
+        key: Sequence[Hashable]
+            ternary string the item was added with
+        item: Any
+            object to be removed
+
+        Returns
+        -------
+        bool
+            True if item was found and removed, False otherwise
+        """
+        path = [self._root]
+        for symbol in key:
+            node = path[-1].get(symbol)
+            if node is None:
+                return False
+            path.append(node)
+
+        leaf: List = path[-1].get(_LEAF, [])
+        for idx, other in enumerate(leaf):
+            if other is item:
+                del leaf[idx]
+                break
+        else:
+            return False
+
+        self._size -= 1
+
+        if not leaf:
+            del path[-1][_LEAF]
+
+        # Prune empty branches bottom-up
+        for depth in range(len(key), 0, -1):
+            if path[depth]:
+                break
+            del path[depth - 1][key[depth - 1]]
+
+        return True
+
+    def clear(self) -> None:
+        self._root = {}
+        self._size = 0
+
+    def query(self, perception: Sequence[Hashable]) -> Iterator[Any]:
+        """
+        Yields items whose strings match the perception. The string matches
+        if on every position it has either a wildcard or the perceived value.
+        A wildcard in the perception matches anything.
+
+        Parameters
+        ----------
+        perception: Sequence[Hashable]
+            perception (or any other string) to be matched
+
+        Returns
+        -------
+        Iterator[Any]
+            matching items (order is not specified)
+        """
+        stack = [(self._root, 0)]
+        length = len(perception)
+
+        while stack:
+            node, depth = stack.pop()
+
+            if depth == length:
+                yield from node.get(_LEAF, ())
+                continue
+
+            symbol = perception[depth]
+            if symbol == self.wildcard:
+                stack.extend((child, depth + 1)
+                             for branch, child in node.items()
+                             if branch is not _LEAF)
+                continue
+
+            child = node.get(self.wildcard)
+            if child is not None:
+                stack.append((child, depth + 1))
+
+            child = node.get(symbol)
+            if child is not None:
+                stack.append((child, depth + 1))
@@ -9,6 +9,9 @@ class PMark(TypedList):
     def __init__(self, cfg: Configuration) -> None:
         self.cfg = cfg
         initial: List = [set() for _ in range(self.cfg.classifier_length)]
+
+        # Elements are created right here, there is no need to check them
+        self._trusted = True
         super().__init__(*initial, oktypes=(set,))
 
     def is_marked(self) -> bool:
@@ -78,9 +81,8 @@ class PMark(TypedList):
             rand_idx = random.choice(possible_idx)
             diff[rand_idx] = p0[rand_idx]
         elif nr2 > 0:
-            for idx, item in enumerate(self):
-                if len(item) > 1:
-                    diff[idx] = p0[idx]
+            diff.update((idx, p0[idx]) for idx, item in enumerate(self)
+                        if len(item) > 1)
 
         return diff
 
@@ -1,5 +1,6 @@
 from .Configuration import Configuration
 from .Condition import Condition
+from .DiscriminationTree import DiscriminationTree
 from .Effect import Effect
 from .PMark import PMark
 from .Classifier import Classifier
@@ -28,7 +28,7 @@ def handle_expected_case(cl: Classifier):
 
 def handle_correctable_case(p0: Perception, p1: Perception, cl: Classifier, population: ClassifiersList):
     new_cl = Classifier.build_corrected(cl, p0, p1)
-    existing = [cl for cl in population if cl == new_cl]
+    existing = population.find_similar(new_cl)
 
     if len(existing) == 0:
         population.append(new_cl)
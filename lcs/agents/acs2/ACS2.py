@@ -1,12 +1,13 @@
 import logging
 from typing import Tuple
 
-from lcs import Perception
+from lcs import Perception, PerceptionInterner
 from lcs.agents.Agent import TrialMetrics
 from lcs.strategies.action_planning.action_planning import \
     search_goal_sequence, suitable_cl_exists
+from lcs.strategies.action_planning.transition_graph import TransitionGraph
 from lcs.strategies.action_selection.BestAction import BestAction
-from . import ClassifiersList, Configuration
+from . import ClassifiersList, Configuration, MatchSetCache
 from ...agents import Agent
 
 logger = logging.getLogger(__name__)
@@ -18,7 +19,11 @@ class ACS2(Agent):
                  cfg: Configuration,
                  population: ClassifiersList = None) -> None:
         self.cfg = cfg
-        self.population = population or ClassifiersList()
+        self.population = population \
+            if population is not None else ClassifiersList()
+        self.perceptions = PerceptionInterner(cfg.perception_cache_size)
+        self.match_sets = MatchSetCache(cfg.match_set_cache_size)
+        self.transition_graph = TransitionGraph()
 
     def get_population(self):
         return self.population
@@ -50,10 +55,10 @@ class ACS2(Agent):
                                               last_reward)
                 steps += steps_ap
 
-            state = Perception(state)
+            state = self.perceptions(state)
             assert len(state) == self.cfg.classifier_length
 
-            match_set = self.population.form_match_set(state)
+            match_set = self.match_sets(self.population, state)
 
             if steps > 0:
                 # Apply learning in the last action set
@@ -92,9 +97,9 @@ class ACS2(Agent):
             logger.debug("\tExecuting action: [%d]", action)
             action_set = match_set.form_action_set(action)
 
-            prev_state = Perception(state)
+            prev_state = self.perceptions(state)
             raw_state, last_reward, done, _ = env.step(action)
-            state = Perception(raw_state)
+            state = self.perceptions(raw_state)
 
             if done:
                 ClassifiersList.apply_alp(
@@ -137,14 +142,14 @@ class ACS2(Agent):
         logger.debug("** Running trial exploit **")
         # Initial conditions
         steps = 0
-        state = Perception(env.reset())
+        state = self.perceptions(env.reset())
 
         last_reward = 0
         action_set = ClassifiersList()
         done = False
 
         while not done:
-            match_set = self.population.form_match_set(state)
+            match_set = self.match_sets(self.population, state)
 
             if steps > 0:
                 ClassifiersList.apply_reinforcement_learning(
@@ -159,7 +164,7 @@ class ACS2(Agent):
             action_set = match_set.form_action_set(action)
 
             state, last_reward, done, _ = env.step(action)
-            state = Perception(state)
+            state = self.perceptions(state)
 
             if done:
                 ClassifiersList.apply_reinforcement_learning(
@@ -210,6 +215,9 @@ class ACS2(Agent):
         """
         logging.debug("** Running action planning **")
 
+        # Planning might start before the observation was interned
+        state = self.perceptions(state)
+
         if not hasattr(env.env, "get_goal_state"):
             logging.debug("Action planning stopped - "
                           "no function get_goal_state in env")
@@ -224,8 +232,9 @@ class ACS2(Agent):
             if goal_situation is None:
                 break
 
-            act_sequence = search_goal_sequence(self.population, state,
-                                                goal_situation)
+            act_sequence = search_goal_sequence(
+                self.population, state, goal_situation,
+                self.transition_graph, self.cfg.action_planning_max_depth)
 
             # Execute the found sequence and learn during executing
             i = 0
@@ -233,7 +242,7 @@ class ACS2(Agent):
                 if act == -1:
                     break
 
-                match_set = self.population.form_match_set(state)
+                match_set = self.match_sets(self.population, state)
 
                 if action_set is not None and len(prev_state) != 0:
                     ClassifiersList.apply_alp(
@@ -271,7 +280,7 @@ class ACS2(Agent):
 
                 prev_state = state
                 state, last_reward, done, _ = env.step(action)
-                state = Perception(state)
+                state = self.perceptions(state)
 
                 if not suitable_cl_exists(action_set, prev_state,
                                           action, state):
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import random
 from itertools import chain
-from typing import Optional, List
+from typing import Optional, List, Sequence
 
 import lcs.agents.acs as acs
 import lcs.agents.acs2.alp as alp_acs2
@@ -12,7 +12,26 @@ import lcs.strategies.genetic_algorithms as ga
 import lcs.strategies.reinforcement_learning as rl
 from lcs import Perception
 from lcs.agents.acs2 import Configuration
-from . import Classifier
+from . import Classifier, ProbabilityEnhancedAttribute
+
+
+def _effect_key(cl: Classifier):
+    # Enhanced effect attributes are equal when they specify the same
+    # symbols (probabilities are not considered, see
+    # `ProbabilityEnhancedAttribute.is_similar`)
+    return tuple(_enhanced_attribute_key(e)
+                 if isinstance(e, ProbabilityEnhancedAttribute) else e
+                 for e in cl.effect)
+
+
+def _enhanced_attribute_key(attr: ProbabilityEnhancedAttribute):
+    symbols = attr.symbols_specified()
+
+    # Attribute specifying a single symbol is equal to this symbol
+    if len(symbols) == 1:
+        return next(iter(symbols))
+
+    return frozenset(symbols)
 
 
 class ClassifiersList(acs.ClassifiersList):
@@ -22,17 +41,50 @@ class ClassifiersList(acs.ClassifiersList):
 
     def form_match_set(self, situation: Perception) -> ClassifiersList:
         matching_ls = [cl for cl in self if cl.does_match(situation)]
-        return ClassifiersList(*matching_ls)
+        return ClassifiersList.from_trusted(*matching_ls)
 
     def form_action_set(self, action: int) -> ClassifiersList:
-        matching = [cl for cl in self if cl.action == action]
-        return ClassifiersList(*matching)
+        return ClassifiersList.from_trusted(*self.by_action(action))
+
+    def form_match_sets(self,
+                        situations: Sequence[Perception]
+                        ) -> List[ClassifiersList]:
+        """
+        Forms match sets for many situations in a single pass over
+        the population.
+
+        Parameters
+        ----------
+        situations: Sequence[Perception]
+            situations
+
+        Returns
+        -------
+        List[ClassifiersList]
+            match sets (in the order of situations)
+        """
+        matching: List[List[Classifier]] = [[] for _ in situations]
+        for cl in self:
+            for situation, match_set in zip(situations, matching):
+                if cl.does_match(situation):
+                    match_set.append(cl)
+
+        return [ClassifiersList.from_trusted(*m) for m in matching]
 
     def form_match_set_backwards(self,
                                  situation: Perception) -> ClassifiersList:
 
         matching = [cl for cl in self if cl.does_match_backwards(situation)]
-        return ClassifiersList(*matching)
+        return ClassifiersList.from_trusted(*matching)
+
+    @staticmethod
+    def _similarity_key(cl: Classifier):
+        return tuple(cl.condition), cl.action, _effect_key(cl)
+
+    @staticmethod
+    def _subsumption_key(cl: Classifier):
+        # Effect subsumes only the equal effect
+        return cl.action, _effect_key(cl)
 
     def expand(self) -> List[Classifier]:
         """
@@ -51,7 +103,9 @@ class ClassifiersList(acs.ClassifiersList):
                                          new_list: ClassifiersList,
                                          previous_situation: Perception,
                                          time: int,
-                                         cfg: Configuration):
+                                         cfg: Configuration,
+                                         population: Optional[
+                                             ClassifiersList] = None):
         # Create a list of candidates.
         # Every enhanceable classifier is a candidate.
         candidates = [classifier for classifier in action_set
@@ -76,8 +130,11 @@ class ClassifiersList(acs.ClassifiersList):
                                                       time)
                 if new_classifier is not None:
                     candidate.reverse_increase_quality()
+                    others = [population] if population is not None else []
+                    for lst in [action_set, *others]:
+                        lst.refresh(candidate)
                     alp.add_classifier(new_classifier, action_set, new_list,
-                                       cfg.theta_exp)
+                                       cfg.theta_exp, others)
 
         return new_list
 
@@ -136,21 +193,28 @@ class ClassifiersList(acs.ClassifiersList):
                     for lst in lists:
                         lst.safe_remove(cl)
 
+            for lst in [population, match_set, action_set]:
+                if lst is not None:
+                    lst.refresh(cl)
+
             if new_cl is not None:
                 new_cl.tga = time
-                alp.add_classifier(new_cl, action_set, new_list, theta_exp)
+                alp.add_classifier(new_cl, action_set, new_list, theta_exp,
+                                   [population])
 
         if cfg.do_pee:
             ClassifiersList.apply_enhanced_effect_part_check(action_set,
                                                              new_list,
                                                              p0,
                                                              time,
-                                                             cfg)
+                                                             cfg,
+                                                             population)
 
         # No classifier anticipated correctly - generate new one
         if not was_expected_case:
             new_cl = alp_acs2.cover(p0, action, p1, time, cfg)
-            alp.add_classifier(new_cl, action_set, new_list, theta_exp)
+            alp.add_classifier(new_cl, action_set, new_list, theta_exp,
+                               [population])
 
         # Merge classifiers from new_list into self and population
         action_set.extend(new_list)
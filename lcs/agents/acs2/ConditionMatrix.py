@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from typing import Dict, Hashable, Iterable, Optional, Sequence
+
+import numpy as np
+
+import lcs.agents.acs as acs
+
+
+class ConditionMatrix:
+    """
+    Structure-of-arrays storage of classifier conditions.
+
+    Each condition is kept as a row of integer symbol codes (wildcard is
+    stored as a sentinel value). Rows are aligned with positions of
+    classifiers in the population, so the whole match set can be obtained
+    with a single masked comparison against the encoded perception.
+
+    Every row carries also an integer tag (i.e. `id` of the classifier)
+    allowing to locate it without scanning the population in Python.
+    """
+    WILDCARD_CODE = -1
+    UNKNOWN_CODE = -2
+
+    def __init__(self, length: int, capacity: int = 64) -> None:
+        self.length = length
+        self._symbols: Dict[Hashable, int] = {}
+        self._rows = np.empty((max(capacity, 1), length), dtype=np.int32)
+        self._tags = np.empty(max(capacity, 1), dtype=np.int64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def rows(self) -> np.ndarray:
+        """
+        Returns
+        -------
+        np.ndarray
+            view on the encoded conditions (one row per classifier)
+        """
+        return self._rows[:self._size]
+
+    def encode(self, condition: Iterable) -> np.ndarray:
+        """
+        Encodes condition attributes into integer codes. Symbols not seen
+        so far get registered.
+
+        Parameters
+        ----------
+        condition: Iterable
+            condition attributes
+
+        Returns
+        -------
+        np.ndarray
+            vector of symbol codes
+        """
+        row = np.empty(self.length, dtype=np.int32)
+        for idx, symbol in enumerate(condition):
+            if symbol == acs.Condition.WILDCARD:
+                row[idx] = self.WILDCARD_CODE
+            else:
+                row[idx] = self._symbols.setdefault(symbol,
+                                                    len(self._symbols))
+        return row
+
+    def encode_perception(self, perception: Iterable) -> np.ndarray:
+        """
+        Encodes perception into integer codes. Symbols that never appeared
+        in any condition are mapped to `UNKNOWN_CODE` (they can be matched
+        only by a wildcard).
+
+        Parameters
+        ----------
+        perception: Iterable
+            environmental perception
+
+        Returns
+        -------
+        np.ndarray
+            vector of symbol codes
+        """
+        row = np.empty(self.length, dtype=np.int32)
+        for idx, symbol in enumerate(perception):
+            if symbol == acs.Condition.WILDCARD:
+                row[idx] = self.WILDCARD_CODE
+            else:
+                row[idx] = self._symbols.get(symbol, self.UNKNOWN_CODE)
+        return row
+
+    def insert(self, idx: int, condition: Iterable, tag: int = 0) -> None:
+        self._ensure_capacity(self._size + 1)
+        n = self._size
+        self._rows[idx + 1:n + 1] = self._rows[idx:n]
+        self._tags[idx + 1:n + 1] = self._tags[idx:n]
+        self._rows[idx] = self.encode(condition)
+        self._tags[idx] = tag
+        self._size += 1
+
+    def set(self, idx: int, condition: Iterable, tag: int = 0) -> None:
+        self._rows[idx] = self.encode(condition)
+        self._tags[idx] = tag
+
+    def delete(self, idx: int) -> None:
+        n = self._size
+        self._rows[idx:n - 1] = self._rows[idx + 1:n]
+        self._tags[idx:n - 1] = self._tags[idx + 1:n]
+        self._size -= 1
+
+    def clear(self) -> None:
+        self._size = 0
+
+    def find(self, tag: int) -> Optional[int]:
+        """
+        Returns the first row having given tag, None if there is no such row.
+        """
+        found = np.flatnonzero(self._tags[:self._size] == tag)
+        return int(found[0]) if len(found) > 0 else None
+
+    def match(self, perception: Iterable) -> np.ndarray:
+        """
+        Vectorized counterpart of `Condition.does_match`.
+
+        Parameters
+        ----------
+        perception: Iterable
+            environmental perception
+
+        Returns
+        -------
+        np.ndarray
+            boolean mask telling which rows match the perception
+        """
+        p = self.encode_perception(perception)
+        rows = self.rows
+
+        attr_ok = (rows == p) | (rows == self.WILDCARD_CODE)
+        attr_ok |= (p == self.WILDCARD_CODE)
+
+        return attr_ok.all(axis=1)
+
+    def match_many(self, perceptions: Sequence[Iterable]) -> np.ndarray:
+        """
+        Matches all the rows against many perceptions at once
+        (see `match`).
+
+        Parameters
+        ----------
+        perceptions: Sequence[Iterable]
+            environmental perceptions
+
+        Returns
+        -------
+        np.ndarray
+            boolean mask (one row per perception)
+        """
+        p = np.array([self.encode_perception(perception)
+                      for perception in perceptions],
+                     dtype=np.int32).reshape(-1, 1, self.length)
+        rows = self.rows[np.newaxis]
+
+        attr_ok = (rows == p) | (rows == self.WILDCARD_CODE)
+        attr_ok |= (p == self.WILDCARD_CODE)
+
+        return attr_ok.all(axis=2)
+
+    def _ensure_capacity(self, size: int) -> None:
+        capacity = len(self._tags)
+        if size <= capacity:
+            return
+
+        while capacity < size:
+            capacity *= 2
+
+        rows = np.empty((capacity, self.length), dtype=np.int32)
+        tags = np.empty(capacity, dtype=np.int64)
+        rows[:self._size] = self._rows[:self._size]
+        tags[:self._size] = self._tags[:self._size]
+        self._rows, self._tags = rows, tags
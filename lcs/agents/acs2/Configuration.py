@@ -29,6 +29,21 @@ class Configuration(acs.Configuration):
         self.action_planning_frequency: int = kwargs.get(
             'action_planning_frequency', 50)
 
+        # number of steps searched from both the start and the goal
+        # (i.e. plans have at most twice as many actions)
+        self.action_planning_max_depth: int = kwargs.get(
+            'action_planning_max_depth', 6)
+
+        # number of distinct perceptions kept by the agent
+        # (see `PerceptionInterner`), 0 disables interning
+        self.perception_cache_size: int = kwargs.get(
+            'perception_cache_size', 10000)
+
+        # number of match sets remembered by the agent
+        # (see `MatchSetCache`), 0 disables caching
+        self.match_set_cache_size: int = kwargs.get(
+            'match_set_cache_size', 1000)
+
         # initial quality assigned to classifiers
         self.initial_q: float = kwargs.get('initial_q', 0.5)
 
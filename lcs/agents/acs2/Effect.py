@@ -113,11 +113,12 @@ class Effect(acs.Effect):
         :param perception: Perception
         :return:
         """
-        # TODO: implement the rest after PEEs are implemented
-        # ('getBestChar' function)
         ant = list(perception)
         for idx, item in enumerate(self):
-            if item != self.WILDCARD:
+            if isinstance(item, ProbabilityEnhancedAttribute):
+                # 'getBestChar' function
+                ant[idx] = item.get_best_symbol()
+            elif item != self.WILDCARD:
                 ant[idx] = item
         return Perception(ant)
 
@@ -0,0 +1,159 @@
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+from lcs import Perception
+from . import Classifier, ClassifiersList
+
+
+class _Entry:
+    __slots__ = ['generation', 'classifiers']
+
+    def __init__(self, generation: int, classifiers: List[Classifier]):
+        self.generation = generation
+        self.classifiers = classifiers
+
+
+class MatchSetCache:
+    """
+    Remembers match sets formed for recently seen perceptions.
+
+    Each match set is stamped with the `generation` of the population.
+    When the population has changed since then, the match set is patched
+    with the classifiers appended (if they match) or removed meanwhile.
+    It is formed from scratch only when the population was modified
+    otherwise (i.e. a condition was generalized in place).
+
+    Only `max_size` recently used match sets are kept (LRU). Setting
+    `max_size` to 0 disables caching.
+
+    Returned match sets are fresh `ClassifiersList` objects, so they can
+    be freely modified by the caller.
+    """
+
+    def __init__(self, max_size: int = 1000) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.patches = 0
+        self.misses = 0
+        self._population: Optional[ClassifiersList] = None
+        self._cache: Dict[Perception, _Entry] = OrderedDict()
+
+    def __call__(self,
+                 population: ClassifiersList,
+                 situation: Perception) -> ClassifiersList:
+        """
+        Parameters
+        ----------
+        population: ClassifiersList
+            population of classifiers
+        situation: Perception
+            perception (preferably interned, see `PerceptionInterner`)
+
+        Returns
+        -------
+        ClassifiersList
+            match set, equal to `population.form_match_set(situation)`
+        """
+        if self.max_size <= 0:
+            return population.form_match_set(situation)
+
+        if population is not self._population:
+            self.clear()
+            self._population = population
+
+        entry = self._cache.get(situation)
+        if entry is not None and self._update(entry, situation):
+            self._cache.move_to_end(situation)
+        else:
+            self.misses += 1
+            entry = self._store(situation,
+                                population.checkpoint(),
+                                population.form_match_set(situation))
+
+        return ClassifiersList.from_trusted(*entry.classifiers)
+
+    def prefetch(self,
+                 population: ClassifiersList,
+                 situations: Sequence[Perception]) -> None:
+        """
+        Forms match sets of all the situations which are not cached
+        in a single pass over the population (see `form_match_sets`).
+        Following calls will take them from the cache.
+
+        Parameters
+        ----------
+        population: ClassifiersList
+            population of classifiers
+        situations: Sequence[Perception]
+            perceptions (preferably interned, see `PerceptionInterner`)
+        """
+        if self.max_size <= 0:
+            return
+
+        if population is not self._population:
+            self.clear()
+            self._population = population
+
+        missing = []
+        for situation in dict.fromkeys(situations):
+            entry = self._cache.get(situation)
+            if entry is None or \
+                    population.changes_since(entry.generation) is None:
+                missing.append(situation)
+
+        if not missing:
+            return
+
+        self.misses += len(missing)
+        generation = population.checkpoint()
+        for situation, match_set in zip(
+                missing, population.form_match_sets(missing)):
+            self._store(situation, generation, match_set)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def _store(self,
+               situation: Perception,
+               generation: int,
+               match_set: ClassifiersList) -> _Entry:
+        entry = _Entry(generation, list(match_set))
+
+        self._cache[situation] = entry
+        self._cache.move_to_end(situation)
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+        return entry
+
+    def _update(self, entry: _Entry, situation: Perception) -> bool:
+        """Brings the match set up to date, returns False if impossible"""
+        population = self._population
+
+        if entry.generation == population.generation:
+            self.hits += 1
+            return True
+
+        changes = population.changes_since(entry.generation)
+
+        # Scanning the population is cheaper
+        if changes is None or len(changes) > len(population):
+            return False
+
+        classifiers = entry.classifiers
+        for appended, cl in changes:
+            if appended:
+                if cl.does_match(situation):
+                    classifiers.append(cl)
+            else:
+                for idx, el in enumerate(classifiers):
+                    if el is cl:
+                        del classifiers[idx]
+                        break
+
+        entry.generation = population.generation
+        self.patches += 1
+        return True
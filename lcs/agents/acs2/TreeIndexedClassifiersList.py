@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from typing import Dict, List, Sequence, Tuple
+
+import lcs.agents.acs as acs
+from lcs import Perception
+from . import Classifier, ClassifiersList, ProbabilityEnhancedAttribute
+
+# Placeholder for effect attributes that can never match a perceived
+# value (enhanced effect attributes, see `Effect.does_match`)
+_UNMATCHABLE = object()
+
+
+class TreeIndexedClassifiersList(ClassifiersList):
+    """
+    Population of classifiers indexed by two discrimination trees - one
+    over conditions (forward matching) and one over backwards anticipation
+    strings (backwards matching). Match sets are formed without scanning
+    the whole population, i.e.
+
+        ACS2(cfg, population=TreeIndexedClassifiersList())
+
+    Returned match sets are plain `ClassifiersList` objects preserving
+    the population order.
+    """
+
+    def __init__(self, *args, oktypes=(Classifier,)) -> None:
+        self._forward = acs.DiscriminationTree()
+        self._backward = acs.DiscriminationTree()
+        self._keys: Dict[int, Tuple[Tuple, Tuple]] = {}
+        self._order: Dict[int, int] = {}
+        self._refs: Dict[int, int] = {}
+        self._counter = 0
+        super().__init__(*args, oktypes=oktypes)
+        self._rebuild()
+
+    def form_match_set(self, situation: Perception) -> ClassifiersList:
+        return self._ordered(self._forward.query(situation))
+
+    def form_match_sets(self,
+                        situations: Sequence[Perception]
+                        ) -> List[ClassifiersList]:
+        # Querying the tree is cheaper than scanning the population
+        return [self.form_match_set(situation) for situation in situations]
+
+    def form_match_set_backwards(self,
+                                 situation: Perception) -> ClassifiersList:
+        return self._ordered(self._backward.query(situation))
+
+    def refresh(self, cl: Classifier) -> None:
+        super().refresh(cl)
+
+        keys = self._keys.get(id(cl))
+        if keys is not None and keys != self._index_keys(cl):
+            position, count = self._order[id(cl)], self._refs[id(cl)]
+            for _ in range(count):
+                self._unindex(cl)
+            for _ in range(count):
+                self._index(cl, position)
+
+    def insert(self, index: int, o: Classifier) -> None:
+        size = len(self._items)
+        super().insert(index, o)
+
+        if index >= size:
+            self._index(o, self._counter)
+            self._counter += 1
+        else:
+            # Positions of other classifiers got shifted
+            self._rebuild()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._rebuild()
+
+    def __setitem__(self, i, o):
+        if isinstance(i, slice):
+            super().__setitem__(i, o)
+            self._rebuild()
+        else:
+            old = self._items[i]
+            super().__setitem__(i, o)
+            position = self._order[id(old)]
+            self._unindex(old)
+            self._index(o, position)
+
+    def __delitem__(self, i):
+        if isinstance(i, slice):
+            super().__delitem__(i)
+            self._rebuild()
+        else:
+            cl = self._items[i]
+            super().__delitem__(i)
+            self._unindex(cl)
+
+    def _ordered(self, classifiers) -> ClassifiersList:
+        order = self._order
+        return ClassifiersList.from_trusted(
+            *sorted(classifiers, key=lambda cl: order[id(cl)]))
+
+    def _index(self, cl: Classifier, position: int) -> None:
+        keys = self._index_keys(cl)
+        self._forward.add(keys[0], cl)
+        self._backward.add(keys[1], cl)
+
+        # The same object might be stored more than once, then it's ordered
+        # by the first occurrence
+        self._order[id(cl)] = min(position,
+                                  self._order.get(id(cl), position))
+        self._refs[id(cl)] = self._refs.get(id(cl), 0) + 1
+        self._keys[id(cl)] = keys
+
+    def _unindex(self, cl: Classifier) -> None:
+        forward_key, backward_key = self._keys[id(cl)]
+        self._forward.remove(forward_key, cl)
+        self._backward.remove(backward_key, cl)
+
+        self._refs[id(cl)] -= 1
+        if self._refs[id(cl)] == 0:
+            del self._refs[id(cl)]
+            del self._keys[id(cl)]
+            del self._order[id(cl)]
+
+    def _rebuild(self) -> None:
+        self._forward.clear()
+        self._backward.clear()
+        self._keys.clear()
+        self._order.clear()
+        self._refs.clear()
+
+        for position, cl in enumerate(self._items):
+            self._index(cl, position)
+
+        self._counter = len(self._items)
+
+    @staticmethod
+    def _index_keys(cl: Classifier) -> Tuple[Tuple, Tuple]:
+        """
+        Computes strings under which the classifier is indexed.
+
+        Backwards matching (see `Classifier.does_match_backwards`) accepts
+        the situation when on every position the effect specifies perceived
+        value, or the effect is a pass-through and the condition is
+        a wildcard or the perceived value. Therefore it is equivalent to
+        forward matching of a string composed of specified effect symbols
+        with the condition symbols filling the pass-through positions.
+        """
+        wildcard = acs.Condition.WILDCARD
+        backward = []
+
+        for c, e in zip(cl.condition, cl.effect):
+            if isinstance(e, ProbabilityEnhancedAttribute):
+                backward.append(_UNMATCHABLE)
+            elif e == wildcard:
+                backward.append(c)
+            else:
+                backward.append(e)
+
+        return tuple(cl.condition), tuple(backward)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from lcs import Perception
+from . import Classifier, ClassifiersList
+from .ConditionMatrix import ConditionMatrix
+
+
+class VectorizedClassifiersList(ClassifiersList):
+    """
+    Population of classifiers keeping all the conditions in a NumPy
+    matrix (see `ConditionMatrix`) next to `Classifier` objects.
+
+    Matching the whole population is performed as a single vectorized
+    comparison. It can be used as a drop-in replacement for the ACS2
+    population, i.e.
+
+        ACS2(cfg, population=VectorizedClassifiersList())
+
+    Match sets and action sets formed from it are plain `ClassifiersList`
+    objects.
+    """
+
+    def __init__(self, *args, oktypes=(Classifier,)) -> None:
+        self._matrix: Optional[ConditionMatrix] = None
+        super().__init__(*args, oktypes=oktypes)
+        self._rebuild()
+
+    def form_match_set(self, situation: Perception) -> ClassifiersList:
+        if self._matrix is None:
+            return ClassifiersList()
+
+        mask = self._matrix.match(situation)
+        items = self._items
+        return ClassifiersList.from_trusted(
+            *[items[i] for i in np.flatnonzero(mask)])
+
+    def form_match_sets(self,
+                        situations: Sequence[Perception]
+                        ) -> List[ClassifiersList]:
+        if self._matrix is None or len(situations) == 0:
+            return [ClassifiersList() for _ in situations]
+
+        items = self._items
+        return [ClassifiersList.from_trusted(
+                    *[items[i] for i in np.flatnonzero(mask)])
+                for mask in self._matrix.match_many(situations)]
+
+    def refresh(self, cl: Classifier) -> None:
+        super().refresh(cl)
+
+        if self._matrix is None:
+            return
+
+        idx = self._matrix.find(id(cl))
+        if idx is not None:
+            self._matrix.set(idx, cl.condition, id(cl))
+
+    def insert(self, index: int, o: Classifier) -> None:
+        size = len(self._items)
+        super().insert(index, o)
+
+        if self._matrix is None:
+            self._matrix = ConditionMatrix(len(o.condition))
+
+        # Normalize index the same way `list.insert` does
+        if index < 0:
+            index = max(0, size + index)
+        index = min(index, size)
+
+        self._matrix.insert(index, o.condition, id(o))
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._rebuild()
+
+    def __setitem__(self, i, o):
+        super().__setitem__(i, o)
+        if isinstance(i, slice):
+            self._rebuild()
+        else:
+            idx = range(len(self._items))[i]
+            self._matrix.set(idx, o.condition, id(o))
+
+    def __delitem__(self, i):
+        if isinstance(i, slice):
+            super().__delitem__(i)
+            self._rebuild()
+        else:
+            idx = range(len(self._items))[i]
+            super().__delitem__(i)
+            self._matrix.delete(idx)
+
+    def _rebuild(self) -> None:
+        """
+        Re-encodes all the conditions from scratch
+        """
+        if len(self._items) == 0:
+            if self._matrix is not None:
+                self._matrix.clear()
+            return
+
+        self._matrix = ConditionMatrix(len(self._items[0].condition),
+                                       capacity=len(self._items))
+        for idx, cl in enumerate(self._items):
+            self._matrix.insert(idx, cl.condition, id(cl))
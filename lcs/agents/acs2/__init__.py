@@ -4,4 +4,8 @@ from .Configuration import Configuration
 from .Effect import Effect
 from .Classifier import Classifier
 from .ClassifiersList import ClassifiersList
+from .ConditionMatrix import ConditionMatrix
+from .VectorizedClassifiersList import VectorizedClassifiersList
+from .TreeIndexedClassifiersList import TreeIndexedClassifiersList
+from .MatchSetCache import MatchSetCache
 from .ACS2 import ACS2
@@ -1,11 +1,13 @@
 import logging
-import random
-from lcs import Perception
+from lcs import Perception, PerceptionInterner
 from lcs.agents.Agent import TrialMetrics
+from lcs.agents.acs2er.PrioritizedReplayMemory import \
+    PrioritizedReplayMemory
 from lcs.agents.acs2er.ReplayMemory import ReplayMemory
 from lcs.agents.acs2er.ReplayMemorySample import ReplayMemorySample
+from lcs.agents.acs2er.TransitionMemory import TransitionMemory
 from lcs.strategies.action_selection.BestAction import BestAction
-from lcs.agents.acs2 import ClassifiersList
+from lcs.agents.acs2 import ClassifiersList, MatchSetCache
 from lcs.agents.acs2 import Configuration
 from lcs.agents.Agent import Agent
 
@@ -18,8 +20,23 @@ class ACS2ER(Agent):
                  cfg: Configuration,
                  population: ClassifiersList = None) -> None:
         self.cfg = cfg
-        self.population = population or ClassifiersList()
-        self.replay_memory = ReplayMemory(max_size=cfg.er_buffer_size)
+        self.population = population \
+            if population is not None else ClassifiersList()
+        self.perceptions = PerceptionInterner(cfg.perception_cache_size)
+        self.match_sets = MatchSetCache(cfg.match_set_cache_size)
+        if cfg.er_deduplicate:
+            self.replay_memory = TransitionMemory(
+                max_size=cfg.er_buffer_size,
+                weighting=cfg.er_weighting,
+                recency_rate=cfg.er_recency_rate,
+                perceptions=self.perceptions)
+        else:
+            memory = PrioritizedReplayMemory if cfg.er_prioritized \
+                else ReplayMemory
+            self.replay_memory = memory(
+                max_size=cfg.er_buffer_size,
+                perception_length=cfg.classifier_length,
+                perceptions=self.perceptions)
 
     def get_population(self):
         return self.population
@@ -38,36 +55,42 @@ class ACS2ER(Agent):
         last_reward = 0
         prev_state = Perception.empty()
         done = False
+        prioritized = isinstance(self.replay_memory, PrioritizedReplayMemory)
 
         while not done:
-            state = Perception(state)
+            state = self.perceptions(state)
             assert len(state) == self.cfg.classifier_length
 
-            match_set = self.population.form_match_set(state)
+            match_set = self.match_sets(self.population, state)
             action = self.cfg.action_selector(match_set)
             logger.debug("\tExecuting action: [%d]", action)
 
-            prev_state = Perception(state)
+            prev_state = self.perceptions(state)
             raw_state, last_reward, done, _ = env.step(action)
-            state = Perception(raw_state)
+            state = self.perceptions(raw_state)
 
             # Add new sample to the buffer, potenially remove if exceed max size
             self.replay_memory.update(ReplayMemorySample(
                 prev_state, action, last_reward, state, done))
 
-            if len(self.replay_memory) >= self.cfg.er_min_samples:
-
-                # Rand samples indexes from the replay memory buffer
-                samples = random.sample(
-                    range(0, len(self.replay_memory)), self.cfg.er_samples_number)
-                for sample_index in samples:
-                    sample: ReplayMemorySample = self.replay_memory[sample_index]
-                    er_match_set = self.population.form_match_set(
-                        sample.state)
+            if self.replay_memory.observations >= self.cfg.er_min_samples:
+
+                # Rand samples from the replay memory buffer
+                slots, samples = self.replay_memory.draw(
+                    self.cfg.er_samples_number)
+                if self.cfg.er_batch_replay:
+                    slots, samples = self._prepare_batch(slots, samples)
+                priorities = []
+                for sample in samples:
+                    er_match_set = self.match_sets(
+                        self.population, sample.state)
                     er_action_set = er_match_set.form_action_set(
                         sample.action)
-                    er_next_match_set = self.population.form_match_set(
-                        sample.next_state)
+                    if prioritized:
+                        priorities.append(
+                            self._priority(er_action_set, sample))
+                    er_next_match_set = self.match_sets(
+                        self.population, sample.next_state)
                     # Apply learning in the replied action set
                     ClassifiersList.apply_alp(
                         self.population,
@@ -100,24 +123,65 @@ class ACS2ER(Agent):
                             self.cfg.do_subsumption,
                             self.cfg.theta_exp)
 
+                if prioritized:
+                    self.replay_memory.update_priorities(slots, priorities)
+
             steps += 1
 
         return TrialMetrics(steps, last_reward)
 
+    def _prepare_batch(self, slots, samples):
+        """
+        Drops repeated (state, action, next state) transitions and forms
+        match sets of all the remaining ones in a single pass over
+        the population. Samples are then replayed in the order they were
+        drawn, match sets are patched after each of them
+        (see `MatchSetCache`).
+        """
+        unique = {}
+        for slot, sample in zip(slots, samples):
+            key = (sample.state, sample.action, sample.next_state)
+            unique.setdefault(key, (slot, sample))
+
+        slots = [slot for slot, _ in unique.values()]
+        samples = [sample for _, sample in unique.values()]
+
+        self.match_sets.prefetch(
+            self.population,
+            [s.state for s in samples] + [s.next_state for s in samples])
+
+        return slots, samples
+
+    def _priority(self,
+                  action_set: ClassifiersList,
+                  sample: ReplayMemorySample) -> float:
+        """
+        Priority of the replayed sample - samples not anticipated correctly
+        by any reliable classifier are preferred.
+        """
+        anticipated = any(
+            cl.is_reliable() and
+            cl.does_anticipate_correctly(sample.state, sample.next_state)
+            for cl in action_set)
+        error = 0 if anticipated else 1
+
+        return (error + self.cfg.er_priority_epsilon) \
+            ** self.cfg.er_priority_exponent
+
     def _run_trial_exploit(self, env, time=None, current_trial=None) \
             -> TrialMetrics:
 
         logger.debug("** Running trial exploit **")
         # Initial conditions
         steps = 0
-        state = Perception(env.reset())
+        state = self.perceptions(env.reset())
 
         last_reward = 0
         action_set = ClassifiersList()
         done = False
 
         while not done:
-            match_set = self.population.form_match_set(state)
+            match_set = self.match_sets(self.population, state)
 
             if steps > 0:
                 ClassifiersList.apply_reinforcement_learning(
@@ -133,7 +197,7 @@ class ACS2ER(Agent):
             action_set = match_set.form_action_set(action)
 
             state, last_reward, done, _ = env.step(action)
-            state = Perception(state)
+            state = self.perceptions(state)
 
             if done:
                 ClassifiersList.apply_reinforcement_learning(
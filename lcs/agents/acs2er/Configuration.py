@@ -14,5 +14,27 @@ class Configuration(acs2.Configuration):
         # ER replay memory samples number
         self.er_samples_number = kwargs.get('er_samples_number', 3)
 
+        # store each distinct transition once (see `TransitionMemory`),
+        # then the buffer size limits the number of distinct transitions
+        self.er_deduplicate = kwargs.get('er_deduplicate', False)
+
+        # weights of distinct transitions - 'count', 'recency' or 'uniform'
+        self.er_weighting = kwargs.get('er_weighting', 'count')
+        # decay rate of 'recency' weights (per observed sample)
+        self.er_recency_rate = kwargs.get('er_recency_rate', 0.01)
+
+        # replay distinct samples only, forming their match sets at once
+        self.er_batch_replay = kwargs.get('er_batch_replay', False)
+
+        # draw replay samples proportionally to their priorities
+        # (see `PrioritizedReplayMemory`)
+        self.er_prioritized = kwargs.get('er_prioritized', False)
+
+        # priority exponent (0 is uniform sampling)
+        self.er_priority_exponent = kwargs.get('er_priority_exponent', 0.6)
+
+        # priority of samples which are already anticipated correctly
+        self.er_priority_epsilon = kwargs.get('er_priority_epsilon', 0.01)
+
     def __str__(self) -> str:
         return str(vars(self))
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import random
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+from lcs import SumTree
+from lcs.agents.acs2er.ReplayMemory import ReplayMemory
+from lcs.agents.acs2er.ReplayMemorySample import ReplayMemorySample
+
+
+class PrioritizedReplayMemory(ReplayMemory):
+    """
+    Replay memory drawing samples with probability proportional to their
+    priorities (kept in a sum tree, so both drawing and updating
+    priorities take O(log n)).
+
+    New samples get the highest priority observed so far, so each of them
+    is likely to be replayed at least once. Priorities of replayed samples
+    are then updated with `update_priorities`.
+    """
+
+    def __init__(self, *args, max_size: int, **kwargs) -> None:
+        self._priorities = SumTree(max_size)
+        for _ in range(max_size):
+            self._priorities.append(0.0)
+
+        self.max_priority = 1.0
+        super().__init__(*args, max_size=max_size, **kwargs)
+
+    def draw(self, k: int) -> Tuple[np.ndarray, List[ReplayMemorySample]]:
+        """
+        Draws samples proportionally to their priorities. The total
+        priority is split into `k` equal segments and one sample is drawn
+        from each of them (the same sample might be drawn more than once).
+
+        Parameters
+        ----------
+        k: int
+            number of samples
+
+        Returns
+        -------
+        Tuple[np.ndarray, List[ReplayMemorySample]]
+            slots and samples
+        """
+        segment = self._priorities.total / k
+        slots = np.array([
+            self._find(random.uniform(segment * i, segment * (i + 1)))
+            for i in range(k)], dtype=np.int64)
+
+        return slots, self._decode_rows(slots)
+
+    def update_priorities(self,
+                          slots: Iterable[int],
+                          priorities: Iterable[float]) -> None:
+        """
+        Parameters
+        ----------
+        slots: Iterable[int]
+            slots of samples (see `draw`)
+        priorities: Iterable[float]
+            new (positive) priorities of the samples
+        """
+        for slot, priority in zip(slots, priorities):
+            self._priorities[int(slot)] = priority
+            self.max_priority = max(self.max_priority, priority)
+
+    def _put(self, slot: int, sample: ReplayMemorySample) -> None:
+        super()._put(slot, sample)
+        self._priorities[slot] = self.max_priority
+
+    def _drop(self, slot: int) -> None:
+        self._priorities[slot] = 0.0
+
+    def _find(self, value: float) -> int:
+        slot = self._priorities.find(value)
+
+        # Rounding errors might point past the last sample
+        if slot >= self.max_size or self._priorities[slot] == 0:
+            slot = (self._start + len(self) - 1) % self.max_size
+
+        return slot
@@ -1,20 +1,236 @@
 from __future__ import annotations
 
-from lcs import TypedList
+import collections.abc
+import random
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from lcs import Perception, check_types
 from lcs.agents.acs2er.ReplayMemorySample import ReplayMemorySample
 
 
-class ReplayMemory(TypedList):
+class ReplayMemory(collections.abc.MutableSequence):
     """
-    Represents the replay memory buffer
+    Represents the replay memory buffer.
+
+    Samples are kept in a circular buffer of preallocated NumPy columns
+    (states, actions, rewards, next states and done flags). Perceptions
+    are stored as rows of integer codes of their symbols, so the memory
+    footprint is fixed once the perception length is known. When
+    the buffer is full, new sample overwrites the oldest one in O(1).
+
+    Samples are indexed from the oldest one and decoded on access.
+    Decoded perceptions are passed through `perceptions` (i.e.
+    `PerceptionInterner`), so they can be canonical objects.
+
+    Samples can be replaced in place, but only appended (dropping
+    the oldest one when the buffer is full, like `update`) and removed
+    from either end of the buffer. Other positional modifications
+    raise `NotImplementedError`.
     """
 
-    def __init__(self, *args, max_size: int, oktypes=(ReplayMemorySample,)) -> None:
-        super().__init__(*args, oktypes=oktypes)
+    def __init__(self,
+                 *args,
+                 max_size: int,
+                 perception_length: Optional[int] = None,
+                 perceptions: Callable[[Any], Perception] = Perception,
+                 oktypes=(ReplayMemorySample,)
+                 ) -> None:
         self.max_size = max_size
+        self.oktypes = oktypes
+        self._perceptions = perceptions
+
+        self._codes: Dict[Any, int] = {}
+        self._symbols: List[Any] = []
+
+        self._states: Optional[np.ndarray] = None
+        self._next_states: Optional[np.ndarray] = None
+        self._actions = np.zeros(max_size, dtype=np.int64)
+        self._rewards = np.zeros(max_size, dtype=np.float64)
+        self._dones = np.zeros(max_size, dtype=np.bool_)
+
+        if perception_length is not None:
+            self._allocate(perception_length)
+
+        self._start = 0
+        self._size = 0
+
+        for sample in args:
+            check_types(self.oktypes, sample)
+            self.update(sample)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns
+        -------
+        int
+            number of bytes occupied by the buffer columns
+        """
+        columns = [self._states, self._next_states,
+                   self._actions, self._rewards, self._dones]
+        return sum(c.nbytes for c in columns if c is not None)
+
+    @property
+    def observations(self) -> int:
+        """
+        Returns
+        -------
+        int
+            number of observed samples represented by the memory
+        """
+        return len(self)
 
     def update(self, sample: ReplayMemorySample) -> None:
-        if len(self) >= self.max_size:
-            self.pop(0)
+        self._write(sample)
+
+    def insert(self, index: int, sample: ReplayMemorySample) -> None:
+        check_types(self.oktypes, sample)
+
+        if index < len(self):
+            raise NotImplementedError(
+                'replay memory only supports appending samples')
+
+        self._write(sample)
+
+    def safe_remove(self, sample: ReplayMemorySample) -> None:
+        try:
+            self.remove(sample)
+        except ValueError:
+            pass
+
+    def sample(self, k: int) -> List[ReplayMemorySample]:
+        """
+        Draws samples without replacement.
+
+        Parameters
+        ----------
+        k: int
+            number of samples
+
+        Returns
+        -------
+        List[ReplayMemorySample]
+            random samples
+        """
+        return self.draw(k)[1]
+
+    def draw(self, k: int) -> Tuple[np.ndarray, List[ReplayMemorySample]]:
+        """
+        Draws samples (see `sample`) together with their buffer slots.
+
+        Parameters
+        ----------
+        k: int
+            number of samples
+
+        Returns
+        -------
+        Tuple[np.ndarray, List[ReplayMemorySample]]
+            slots and samples
+        """
+        indexes = random.sample(range(0, len(self)), k)
+        slots = (self._start + np.asarray(indexes, dtype=np.int64)) \
+            % self.max_size
+        return slots, self._decode_rows(slots)
+
+    def _write(self, sample: ReplayMemorySample) -> int:
+        if self._states is None:
+            self._allocate(len(sample.state))
+
+        if self._size < self.max_size:
+            idx = (self._start + self._size) % self.max_size
+            self._size += 1
+        else:
+            # Overwrite the oldest sample
+            idx = self._start
+            self._start = (self._start + 1) % self.max_size
+
+        self._put(idx, sample)
+        return idx
+
+    def _put(self, slot: int, sample: ReplayMemorySample) -> None:
+        self._states[slot] = self._encode(sample.state)
+        self._next_states[slot] = self._encode(sample.next_state)
+        self._actions[slot] = sample.action
+        self._rewards[slot] = sample.reward
+        self._dones[slot] = sample.done
+
+    def _drop(self, slot: int) -> None:
+        """Called when the sample in `slot` is removed"""
+
+    def _slot(self, i: int) -> int:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('replay memory index out of range')
+
+        return (self._start + i) % self.max_size
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+
+        return self._decode_rows(np.array([self._slot(i)]))[0]
+
+    def __setitem__(self, i, sample: ReplayMemorySample) -> None:
+        if isinstance(i, slice):
+            raise NotImplementedError(
+                'replay memory does not support slice assignment')
+
+        check_types(self.oktypes, sample)
+        self._put(self._slot(i), sample)
+
+    def __delitem__(self, i) -> None:
+        if isinstance(i, slice):
+            raise NotImplementedError(
+                'replay memory does not support slice deletion')
+
+        slot = self._slot(i)
+        if slot == self._start:
+            self._start = (self._start + 1) % self.max_size
+        elif slot != (self._start + len(self) - 1) % self.max_size:
+            raise NotImplementedError(
+                'replay memory only supports removing the oldest '
+                'or the newest sample')
+
+        self._size -= 1
+        self._drop(slot)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _allocate(self, perception_length: int) -> None:
+        shape = (self.max_size, perception_length)
+        self._states = np.zeros(shape, dtype=np.int32)
+        self._next_states = np.zeros(shape, dtype=np.int32)
+
+    def _encode(self, perception: Perception) -> List[int]:
+        codes = self._codes
+        row = []
+
+        for symbol in perception:
+            code = codes.get(symbol)
+            if code is None:
+                code = codes[symbol] = len(self._symbols)
+                self._symbols.append(symbol)
+            row.append(code)
+
+        return row
+
+    def _decode(self, row: List[int]) -> Perception:
+        symbols = self._symbols
+        return self._perceptions(tuple(symbols[c] for c in row))
+
+    def _decode_rows(self, idx: np.ndarray) -> List[ReplayMemorySample]:
+        # Gather the rows of all requested samples at once
+        states = self._states[idx].tolist()
+        next_states = self._next_states[idx].tolist()
+        actions = self._actions[idx].tolist()
+        rewards = self._rewards[idx].tolist()
+        dones = self._dones[idx].tolist()
 
-        self.append(sample)
+        return [ReplayMemorySample(self._decode(s), a, r, self._decode(ns), d)
+                for s, a, r, ns, d
+                in zip(states, actions, rewards, next_states, dones)]
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import collections.abc
+import math
+import random
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from lcs import Perception, SumTree
+from lcs.agents.acs2er.ReplayMemorySample import ReplayMemorySample
+
+WEIGHTINGS = ('count', 'recency', 'uniform')
+
+# Recency weights are rebased (and the sum tree rebuilt) before their
+# range grows large enough to lose precision
+_MAX_EXPONENT = 20.0
+
+
+class TransitionMemory(collections.abc.Collection):
+    """
+    Replay memory storing each distinct transition (state, action, reward,
+    next state, done) once, together with the number of its occurrences
+    and the time it was observed for the last time.
+
+    Samples are drawn (with replacement) proportionally to their weights:
+    - `count` - number of occurrences,
+    - `recency` - decaying exponentially (at `recency_rate`) with the time
+      elapsed since the last observation,
+    - `uniform` - all distinct transitions are equally likely.
+
+    At most `max_size` distinct transitions are kept, the least recently
+    observed one is dropped when the memory is full. Perceptions are
+    passed through `perceptions` (i.e. `PerceptionInterner`).
+    """
+
+    def __init__(self,
+                 *args,
+                 max_size: int,
+                 weighting: str = 'count',
+                 recency_rate: float = 0.01,
+                 perceptions: Callable[[Any], Perception] = Perception
+                 ) -> None:
+        if weighting not in WEIGHTINGS:
+            raise ValueError(f"Unknown weighting: {weighting}")
+
+        self.max_size = max_size
+        self.weighting = weighting
+        self.recency_rate = recency_rate
+        self.time = 0
+        self._time_base = 0
+        self._perceptions = perceptions
+
+        self._weights = SumTree(max_size)
+        self._samples: List[Optional[ReplayMemorySample]] = []
+        self._counts: List[int] = []
+        self._last_seen: List[int] = []
+        self._slots: Dict[Tuple, int] = OrderedDict()
+        self._free: List[int] = []
+        self._observations = 0
+
+        for sample in args:
+            self.update(sample)
+
+    @property
+    def observations(self) -> int:
+        """
+        Returns
+        -------
+        int
+            number of observed samples represented by the memory
+        """
+        return self._observations
+
+    def update(self, sample: ReplayMemorySample) -> None:
+        self.time += 1
+        if self.weighting == 'recency' and \
+                (self.time - self._time_base) * self.recency_rate \
+                > _MAX_EXPONENT:
+            self._rebase()
+
+        sample = ReplayMemorySample(self._perceptions(sample.state),
+                                    sample.action,
+                                    sample.reward,
+                                    self._perceptions(sample.next_state),
+                                    sample.done)
+        key = self._key(sample)
+
+        slot = self._slots.get(key)
+        if slot is None:
+            if len(self._slots) >= self.max_size:
+                self._evict()
+            slot = self._allocate(sample)
+            self._slots[key] = slot
+        else:
+            self._slots.move_to_end(key)
+
+        self._counts[slot] += 1
+        self._last_seen[slot] = self.time
+        self._observations += 1
+        self._weights[slot] = self._weight(slot)
+
+    def count(self, sample: ReplayMemorySample) -> int:
+        """
+        Returns
+        -------
+        int
+            number of occurrences of the transition (0 if not stored)
+        """
+        slot = self._slots.get(self._key(sample))
+        return 0 if slot is None else self._counts[slot]
+
+    def last_seen(self, sample: ReplayMemorySample) -> Optional[int]:
+        """
+        Returns
+        -------
+        Optional[int]
+            time of the last observation of the transition
+            (None if not stored)
+        """
+        slot = self._slots.get(self._key(sample))
+        return None if slot is None else self._last_seen[slot]
+
+    def sample(self, k: int) -> List[ReplayMemorySample]:
+        """
+        Draws weighted samples (with replacement).
+
+        Parameters
+        ----------
+        k: int
+            number of samples
+
+        Returns
+        -------
+        List[ReplayMemorySample]
+            random samples
+        """
+        return self.draw(k)[1]
+
+    def draw(self, k: int) -> Tuple[np.ndarray, List[ReplayMemorySample]]:
+        """
+        Draws samples (see `sample`) together with their slots.
+
+        Parameters
+        ----------
+        k: int
+            number of samples
+
+        Returns
+        -------
+        Tuple[np.ndarray, List[ReplayMemorySample]]
+            slots and samples
+        """
+        total = self._weights.total
+        slots = np.array([self._find(random.uniform(0, total))
+                          for _ in range(k)], dtype=np.int64)
+
+        return slots, [self._samples[slot] for slot in slots]
+
+    def __contains__(self, sample) -> bool:
+        return self._key(sample) in self._slots
+
+    def __iter__(self) -> Iterator[ReplayMemorySample]:
+        # From the least recently observed
+        return (self._samples[slot] for slot in self._slots.values())
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @staticmethod
+    def _key(sample: ReplayMemorySample) -> Tuple:
+        return (sample.state, sample.action, sample.reward,
+                sample.next_state, sample.done)
+
+    def _weight(self, slot: int) -> float:
+        if self.weighting == 'count':
+            return self._counts[slot]
+        if self.weighting == 'recency':
+            # Proportional to exp(-rate * (time - last seen))
+            return math.exp(self.recency_rate *
+                            (self._last_seen[slot] - self._time_base))
+        return 1.0
+
+    def _rebase(self) -> None:
+        self._time_base = self.time
+        weights = [0.0 if sample is None else self._weight(slot)
+                   for slot, sample in enumerate(self._samples)]
+
+        self._weights.clear()
+        for weight in weights:
+            self._weights.append(weight)
+
+    def _allocate(self, sample: ReplayMemorySample) -> int:
+        if self._free:
+            slot = self._free.pop()
+            self._samples[slot] = sample
+            self._counts[slot] = 0
+            return slot
+
+        self._samples.append(sample)
+        self._counts.append(0)
+        self._last_seen.append(0)
+        return self._weights.append(0.0)
+
+    def _evict(self) -> None:
+        _, slot = self._slots.popitem(last=False)
+        self._observations -= self._counts[slot]
+        self._weights[slot] = 0.0
+        self._samples[slot] = None
+        self._free.append(slot)
+
+    def _find(self, value: float) -> int:
+        slot = self._weights.find(value)
+
+        # Rounding errors might point past the last transition
+        if slot >= len(self._samples) or self._samples[slot] is None:
+            slot = next(reversed(self._slots.values()))
+
+        return slot
@@ -2,4 +2,6 @@
 from .Configuration import Configuration
 from .ACS2ER import ACS2ER
 from .ReplayMemory import ReplayMemory
+from .PrioritizedReplayMemory import PrioritizedReplayMemory
+from .TransitionMemory import TransitionMemory
 from .ReplayMemorySample import ReplayMemorySample
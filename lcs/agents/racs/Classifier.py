@@ -8,6 +8,7 @@ import numpy as np
 from lcs import Perception
 from lcs.representations import UBR
 from . import Condition, Effect, Mark, Configuration
+from .EncodedPerception import encode
 
 
 class Classifier:
@@ -80,11 +81,15 @@ class Classifier:
             self.condition, self.action, self.effect, self.num, self.fitness)
 
     @classmethod
-    def copy_from(cls, old_cls: Classifier, time: int):
+    def copy_from(cls,
+                  old_cls: Classifier,
+                  time: int,
+                  condition: Optional[List[UBR]] = None,
+                  effect: Optional[List[UBR]] = None):
         """
         Copies old classifier with given time (tga, talp).
         Old tav gets replaced with new value.
-        New classifier also has no mark.
+        New classifier also has no mark and its own copies of intervals.
 
         Parameters
         ----------
@@ -92,16 +97,29 @@ class Classifier:
             classifier to copy from
         time: int
             time of creation / current epoch
+        condition: Optional[List[UBR]]
+            intervals of the new condition (copied from the old classifier
+            if not provided)
+        effect: Optional[List[UBR]]
+            intervals of the new effect (copied from the old classifier
+            if not provided)
 
         Returns
         -------
         Classifier
             copied classifier
         """
+        # Intervals are copied, so they can be modified in place (i.e.
+        # mutated) without affecting the old classifier
+        if condition is None:
+            condition = [UBR(ubr.x1, ubr.x2) for ubr in old_cls.condition]
+        if effect is None:
+            effect = [UBR(ubr.x1, ubr.x2) for ubr in old_cls.effect]
+
         new_cls = cls(
-            condition=Condition(old_cls.condition, old_cls.cfg),
+            condition=condition,
             action=old_cls.action,
-            effect=old_cls.effect,
+            effect=effect,
             quality=old_cls.q,
             reward=old_cls.r,
             immediate_reward=old_cls.ir,
@@ -162,8 +180,8 @@ class Classifier:
             Requires the effect attribute to be a wildcard to specialize it.
             By default false
         """
-        p0_enc = list(map(self.cfg.encoder.encode, p0))
-        p1_enc = list(map(self.cfg.encoder.encode, p1))
+        p0_enc = encode(p0, self.cfg.encoder)
+        p1_enc = encode(p1, self.cfg.encoder)
 
         for idx, item in enumerate(p1):
             if leave_specialized:
@@ -227,8 +245,8 @@ class Classifier:
         bool
             True if anticipation is correct, False otherwise
         """
-        p0_enc = list(map(self.cfg.encoder.encode, previous_situation))
-        p1_enc = list(map(self.cfg.encoder.encode, situation))
+        p0_enc = encode(previous_situation, self.cfg.encoder)
+        p1_enc = encode(situation, self.cfg.encoder)
 
         for idx, eitem in enumerate(self.effect):
             if eitem == self.cfg.classifier_wildcard:
@@ -4,28 +4,40 @@ import random
 from itertools import chain
 from typing import Optional, List
 
+import numpy as np
+
 import lcs.agents.racs.components.alp as alp_racs
+import lcs.agents.racs.components.genetic_algorithm as rga
 import lcs.strategies.anticipatory_learning_process as alp
 import lcs.strategies.genetic_algorithms as ga
 import lcs.strategies.reinforcement_learning as rl
-from lcs import TypedList, Perception
-from lcs.agents.racs import Configuration
-from lcs.agents.racs.components.genetic_algorithm import mutate, crossover
+from lcs import Perception
+from lcs.agents import ActionPartitionedList
+from lcs.agents.racs import Configuration, EncodedPerception
 from . import Classifier
 
 
-class ClassifierList(TypedList):
+class ClassifierList(ActionPartitionedList):
 
     def __init__(self, *args) -> None:
         super().__init__(*args, oktypes=(Classifier,))
 
     def form_match_set(self, situation: Perception) -> ClassifierList:
+        if len(self) > 0:
+            # Encode the situation once for all classifiers
+            situation = EncodedPerception.of(situation, self[0].cfg.encoder)
+
         matching = [cl for cl in self if cl.condition.does_match(situation)]
-        return ClassifierList(*matching)
+        return ClassifierList.from_trusted(*matching)
 
     def form_action_set(self, action: int) -> ClassifierList:
-        matching = [cl for cl in self if cl.action == action]
-        return ClassifierList(*matching)
+        return ClassifierList.from_trusted(*self.by_action(action))
+
+    @staticmethod
+    def _condition_key(cl: Classifier):
+        # Intervals might be modified in place
+        return tuple((ubr.lower_bound, ubr.upper_bound)
+                     for ubr in cl.condition)
 
     def expand(self) -> List[Classifier]:
         """
@@ -69,6 +81,9 @@ class ClassifierList(TypedList):
                   theta_exp: int,
                   cfg: Configuration) -> None:
 
+        p0 = EncodedPerception.of(p0, cfg.encoder)
+        p1 = EncodedPerception.of(p1, cfg.encoder)
+
         new_list = ClassifierList()
         new_cl: Optional[Classifier] = None
         was_expected_case = False
@@ -91,14 +106,20 @@ class ClassifierList(TypedList):
                     for lst in lists:
                         lst.safe_remove(cl)
 
+            for lst in [population, match_set, action_set]:
+                if lst is not None:
+                    lst.refresh(cl)
+
             if new_cl is not None:
                 new_cl.tga = time
-                alp.add_classifier(new_cl, action_set, new_list, theta_exp)
+                alp.add_classifier(new_cl, action_set, new_list, theta_exp,
+                                   [population])
 
         # No classifier anticipated correctly - generate new one
         if not was_expected_case:
             new_cl = alp_racs.cover(p0, action, p1, time, cfg)
-            alp.add_classifier(new_cl, action_set, new_list, theta_exp)
+            alp.add_classifier(new_cl, action_set, new_list, theta_exp,
+                               [population])
 
         # Merge classifiers from new_list into self and population
         action_set.extend(new_list)
@@ -138,28 +159,39 @@ class ClassifierList(TypedList):
             parent1, parent2 = ga.roulette_wheel_selection(
                 action_set, lambda cl: pow(cl.q, 3) * cl.num)
 
-            child1 = Classifier.copy_from(parent1, time)
-            child2 = Classifier.copy_from(parent2, time)
+            # Offspring is bred as integer genomes
+            genome1 = rga.genome(parent1)
+            genome2 = rga.genome(parent2)
 
             # Execute mutation
-            mutate(child1, mu)
-            mutate(child2, mu)
+            rga.mutate_genome(genome1, parent1.cfg, mu)
+            rga.mutate_genome(genome2, parent2.cfg, mu)
+
+            q1, q2 = parent1.q, parent2.q
+            r1, r2 = parent1.r, parent2.r
 
             # Execute cross-over
             if random.random() < chi:
-                if child1.effect == child2.effect:
-                    crossover(child1, child2)
+                if np.array_equal(_effect_bounds(genome1),
+                                  _effect_bounds(genome2)):
+                    rga.crossover_genomes(genome1, genome2)
 
                     # Update quality and reward
-                    child1.q = child2.q = float(sum([child1.q, child2.q]) / 2)
-                    child2.r = child2.r = float(sum([child1.r, child2.r]) / 2)
-
-            child1.q /= 2
-            child2.q /= 2
+                    q1 = q2 = float(sum([q1, q2]) / 2)
+                    # As before, only the second child gets averaged reward
+                    r2 = float(sum([r1, r2]) / 2)
 
             # We are interested only in classifiers with specialized condition
-            unique_children = {cl for cl in [child1, child2]
-                               if cl.condition.specificity > 0}
+            # - only those get materialized
+            children = []
+            for parent, genome, q, r in [(parent1, genome1, q1, r1),
+                                         (parent2, genome2, q2, r2)]:
+                if rga.specificity(genome, parent.cfg) > 0:
+                    child = rga.materialize(genome, parent, time)
+                    child.q, child.r = q / 2, r
+                    children.append(child)
+
+            unique_children = set(children)
 
             ga.delete_classifiers(
                 population, match_set, action_set,
@@ -170,3 +202,9 @@ class ClassifierList(TypedList):
                 ga.add_classifier(child, p,
                                   population, match_set, action_set,
                                   do_subsumption, theta_exp)
+
+
+def _effect_bounds(genome: np.ndarray) -> np.ndarray:
+    # Effects are compared by their intervals (regardless of bounds order)
+    x1, x2 = genome[1, 0::2], genome[1, 1::2]
+    return np.stack([np.minimum(x1, x2), np.maximum(x1, x2)])
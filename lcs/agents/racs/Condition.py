@@ -8,6 +8,7 @@ from typing import Callable
 from lcs import Perception
 from lcs.representations.visualization import visualize
 from . import Configuration
+from .EncodedPerception import encode
 from .. import PerceptionString
 
 
@@ -93,7 +94,7 @@ class Condition(PerceptionString):
             self.generalize(ridx)
 
     def does_match(self, perception: Perception):
-        encoded_perception = map(self.cfg.encoder.encode, perception)
+        encoded_perception = encode(perception, self.cfg.encoder)
         return all(p in ubr for p, ubr in zip(encoded_perception, self))
 
     def subsumes(self, other: Condition):
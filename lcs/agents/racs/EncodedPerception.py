@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from lcs import Perception
+
+
+class EncodedPerception(Perception):
+    """
+    Real-valued perception carrying also its encoded form (see
+    `RealValueEncoder`).
+
+    The perception is encoded only once, when it is created, so all
+    the operations on classifiers (matching, anticipation, marking)
+    can consume the cached integer vector instead of encoding raw values
+    for every classifier again.
+    """
+
+    __slots__ = ['encoded', 'encoder']
+
+    def __init__(self, observation, encoder) -> None:
+        items = tuple(observation)
+
+        # Raw values (of any numeric type) are validated by the encoder
+        super().__init__(items, oktypes=tuple(dict.fromkeys(map(type, items))))
+
+        self.encoder = encoder
+        self.encoded = tuple(map(encoder.encode, self._items))
+
+    @classmethod
+    def of(cls, perception, encoder) -> EncodedPerception:
+        """
+        Encodes the perception, unless it was already encoded with
+        given encoder.
+
+        Parameters
+        ----------
+        perception
+            raw or encoded perception
+        encoder
+            real-value encoder
+
+        Returns
+        -------
+        EncodedPerception
+            encoded perception
+        """
+        if isinstance(perception, EncodedPerception) and \
+                perception.encoder is encoder:
+            return perception
+
+        return cls(perception, encoder)
+
+
+def encode(perception, encoder) -> Sequence[int]:
+    """
+    Returns encoded values of the perception - the cached ones if
+    the perception was already encoded with given encoder.
+
+    Parameters
+    ----------
+    perception
+        raw or encoded perception
+    encoder
+        real-value encoder
+
+    Returns
+    -------
+    Sequence[int]
+        encoded perception attributes
+    """
+    if isinstance(perception, EncodedPerception) and \
+            perception.encoder is encoder:
+        return perception.encoded
+
+    return [encoder.encode(p) for p in perception]
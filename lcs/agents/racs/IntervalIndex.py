@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+# Bounds of the hyper-rectangle - (lower, upper) pair for each dimension
+Bounds = Tuple[Tuple[int, int], ...]
+
+
+class IntervalIndex:
+    """
+    Spatial index of hyper-rectangles (i.e. rACS conditions) answering
+    point queries (which rectangles contain the given encoded perception).
+
+    Every dimension has its own segment tree over the encoded values.
+    A rectangle is stored in O(log r) canonical nodes of each tree
+    (r - number of encoded values), so inserting and removing is cheap.
+    All the rectangles containing a point lie in the nodes on the path
+    from the point's leaf to the root. The query walks the path in every
+    dimension, takes the one with the fewest candidates and checks
+    the remaining dimensions of these candidates only.
+    """
+
+    def __init__(self, length: int, value_range: Tuple[int, int]) -> None:
+        self.length = length
+        self._offset = value_range[0]
+
+        self._leaves = 1
+        while self._leaves < value_range[1] - value_range[0] + 1:
+            self._leaves *= 2
+
+        self._trees: List[List[Optional[Set[int]]]] = \
+            [[None] * (2 * self._leaves) for _ in range(length)]
+        self._items: Dict[int, Any] = {}
+        self._bounds: Dict[int, Bounds] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, bounds: Bounds, item: Any) -> None:
+        """
+        Indexes the item (by its `id`) under given bounds.
+
+        Parameters
+        ----------
+        bounds: Bounds
+            (lower, upper) pair for each dimension
+        item: Any
+            indexed object
+        """
+        key = id(item)
+        if key in self._items:
+            self.remove(item)
+
+        for tree, (lower, upper) in zip(self._trees, bounds):
+            for node in self._canonical_nodes(lower, upper):
+                if tree[node] is None:
+                    tree[node] = set()
+                tree[node].add(key)
+
+        self._items[key] = item
+        self._bounds[key] = bounds
+
+    def bounds(self, item: Any) -> Optional[Bounds]:
+        """
+        Returns
+        -------
+        Optional[Bounds]
+            bounds under which the item is indexed (None if not indexed)
+        """
+        return self._bounds.get(id(item))
+
+    def remove(self, item: Any) -> None:
+        key = id(item)
+        bounds = self._bounds.pop(key)
+        del self._items[key]
+
+        for tree, (lower, upper) in zip(self._trees, bounds):
+            for node in self._canonical_nodes(lower, upper):
+                tree[node].discard(key)
+
+    def clear(self) -> None:
+        for tree in self._trees:
+            tree[:] = [None] * len(tree)
+
+        self._items.clear()
+        self._bounds.clear()
+
+    def query(self, point: Sequence[int]) -> List[Any]:
+        """
+        Finds items whose bounds contain the point (in arbitrary order).
+
+        Parameters
+        ----------
+        point: Sequence[int]
+            encoded value for each dimension
+
+        Returns
+        -------
+        List[Any]
+            items containing the point
+        """
+        if not self._items:
+            return []
+
+        best_dim, best_path, best_size = -1, [], len(self._items) + 1
+        for dim, (tree, value) in enumerate(zip(self._trees, point)):
+            path = [s for s in self._path(tree, value) if s]
+            size = sum(len(s) for s in path)
+            if size < best_size:
+                best_dim, best_path, best_size = dim, path, size
+
+        other_dims = [(dim, value) for dim, value in enumerate(point)
+                      if dim != best_dim]
+        bounds, items = self._bounds, self._items
+        found = []
+
+        for nodes in best_path:
+            for key in nodes:
+                key_bounds = bounds[key]
+                if all(key_bounds[dim][0] <= value <= key_bounds[dim][1]
+                       for dim, value in other_dims):
+                    found.append(items[key])
+
+        return found
+
+    def _path(self, tree: List[Optional[Set[int]]], value: int):
+        node = value - self._offset + self._leaves
+        while node > 0:
+            yield tree[node]
+            node //= 2
+
+    def _canonical_nodes(self, lower: int, upper: int) -> List[int]:
+        """
+        Nodes of the segment tree jointly covering [lower, upper]
+        """
+        nodes = []
+        left = lower - self._offset + self._leaves
+        right = upper - self._offset + self._leaves + 1
+
+        while left < right:
+            if left & 1:
+                nodes.append(left)
+                left += 1
+            if right & 1:
+                right -= 1
+                nodes.append(right)
+            left //= 2
+            right //= 2
+
+        return nodes
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+from lcs import Perception
+from . import Classifier, ClassifierList, EncodedPerception
+from .IntervalIndex import Bounds, IntervalIndex
+
+
+class IntervalIndexedClassifierList(ClassifierList):
+    """
+    Population of classifiers indexed by the hyper-rectangles of their
+    conditions (see `IntervalIndex`). Match sets are formed from
+    the candidates returned by a point query instead of scanning the whole
+    population, which pays off when most of the conditions are narrow
+    (i.e. with high encoder resolution), i.e.
+
+        RACS(cfg, population=IntervalIndexedClassifierList())
+
+    The index is updated incrementally - when classifiers are added or
+    removed, and when their conditions are modified in place (ALP)
+    and the population is notified with `refresh`. Returned match sets are
+    plain `ClassifierList` objects preserving the population order.
+    """
+
+    def __init__(self, *args) -> None:
+        self._index: Optional[IntervalIndex] = None
+        self._order: Dict[int, int] = {}
+        self._refs: Dict[int, int] = {}
+        self._counter = 0
+        super().__init__(*args)
+        self._rebuild()
+
+    def form_match_set(self, situation: Perception) -> ClassifierList:
+        if self._index is None or len(self._items) == 0:
+            return ClassifierList()
+
+        encoder = self._items[0].cfg.encoder
+        encoded = EncodedPerception.of(situation, encoder).encoded
+
+        order = self._order
+        return ClassifierList.from_trusted(*sorted(
+            self._index.query(encoded), key=lambda cl: order[id(cl)]))
+
+    def refresh(self, cl: Classifier) -> None:
+        super().refresh(cl)
+
+        if id(cl) in self._refs and \
+                self._index.bounds(cl) != self._bounds(cl):
+            # Re-indexing keeps the classifier position
+            self._index.add(self._bounds(cl), cl)
+
+    def insert(self, index: int, o: Classifier) -> None:
+        size = len(self._items)
+        super().insert(index, o)
+
+        if index >= size:
+            self._add(o, self._counter)
+            self._counter += 1
+        else:
+            # Positions of other classifiers got shifted
+            self._rebuild()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._rebuild()
+
+    def __setitem__(self, i, o):
+        if isinstance(i, slice):
+            super().__setitem__(i, o)
+            self._rebuild()
+        else:
+            old = self._items[i]
+            super().__setitem__(i, o)
+            position = self._order[id(old)]
+            self._discard(old)
+            self._add(o, position)
+
+    def __delitem__(self, i):
+        if isinstance(i, slice):
+            super().__delitem__(i)
+            self._rebuild()
+        else:
+            cl = self._items[i]
+            super().__delitem__(i)
+            self._discard(cl)
+
+    @staticmethod
+    def _bounds(cl: Classifier) -> Bounds:
+        return tuple((ubr.lower_bound, ubr.upper_bound)
+                     for ubr in cl.condition)
+
+    def _add(self, cl: Classifier, position: int) -> None:
+        if self._index is None:
+            self._index = IntervalIndex(len(cl.condition),
+                                        cl.cfg.encoder.range)
+
+        # The same object might be stored more than once, then it's indexed
+        # once and ordered by the first occurrence
+        if id(cl) not in self._refs:
+            self._index.add(self._bounds(cl), cl)
+
+        self._order[id(cl)] = min(position,
+                                  self._order.get(id(cl), position))
+        self._refs[id(cl)] = self._refs.get(id(cl), 0) + 1
+
+    def _discard(self, cl: Classifier) -> None:
+        self._refs[id(cl)] -= 1
+        if self._refs[id(cl)] == 0:
+            del self._refs[id(cl)]
+            del self._order[id(cl)]
+            self._index.remove(cl)
+
+    def _rebuild(self) -> None:
+        if self._index is not None:
+            self._index.clear()
+        self._order.clear()
+        self._refs.clear()
+
+        for position, cl in enumerate(self._items):
+            self._add(cl, position)
+
+        self._counter = len(self._items)
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from lcs.representations import UBR
+
+
+class IntervalMatrix:
+    """
+    Structure-of-arrays storage of real-valued (UBR) classifier conditions.
+
+    Lower and upper bounds of all the intervals are kept in two integer
+    matrices (one row per condition), aligned with positions of classifiers
+    in the population. Matching, interval inclusion and coverage of the
+    whole population are then computed with vectorized comparisons.
+
+    Every row carries also an integer tag (i.e. `id` of the classifier)
+    allowing to locate it without scanning the population in Python.
+    """
+
+    def __init__(self, length: int, capacity: int = 64) -> None:
+        self.length = length
+        self._lower = np.empty((max(capacity, 1), length), dtype=np.int64)
+        self._upper = np.empty((max(capacity, 1), length), dtype=np.int64)
+        self._tags = np.empty(max(capacity, 1), dtype=np.int64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def lower(self) -> np.ndarray:
+        """
+        Returns
+        -------
+        np.ndarray
+            view on the lower bounds (one row per classifier)
+        """
+        return self._lower[:self._size]
+
+    @property
+    def upper(self) -> np.ndarray:
+        """
+        Returns
+        -------
+        np.ndarray
+            view on the upper bounds (one row per classifier)
+        """
+        return self._upper[:self._size]
+
+    def interval(self, idx: int, attribute: int) -> UBR:
+        """
+        Returns
+        -------
+        UBR
+            interval stored at given row and attribute
+        """
+        return UBR(int(self._lower[idx, attribute]),
+                   int(self._upper[idx, attribute]))
+
+    @staticmethod
+    def bounds(condition: Iterable[UBR]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Parameters
+        ----------
+        condition: Iterable[UBR]
+            condition attributes
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            vectors of lower and upper bounds
+        """
+        pairs = [(ubr.lower_bound, ubr.upper_bound) for ubr in condition]
+        lower, upper = zip(*pairs) if pairs else ((), ())
+        return np.array(lower, dtype=np.int64), \
+            np.array(upper, dtype=np.int64)
+
+    def insert(self, idx: int, condition: Iterable[UBR], tag: int = 0) -> None:
+        self._ensure_capacity(self._size + 1)
+        n = self._size
+        for m in (self._lower, self._upper, self._tags):
+            m[idx + 1:n + 1] = m[idx:n]
+        self._size += 1
+        self.set(idx, condition, tag)
+
+    def set(self, idx: int, condition: Iterable[UBR], tag: int = 0) -> None:
+        self._lower[idx], self._upper[idx] = self.bounds(condition)
+        self._tags[idx] = tag
+
+    def delete(self, idx: int) -> None:
+        n = self._size
+        for m in (self._lower, self._upper, self._tags):
+            m[idx:n - 1] = m[idx + 1:n]
+        self._size -= 1
+
+    def clear(self) -> None:
+        self._size = 0
+
+    def find(self, tag: int) -> Optional[int]:
+        """
+        Returns the first row having given tag, None if there is no such row.
+        """
+        found = np.flatnonzero(self._tags[:self._size] == tag)
+        return int(found[0]) if len(found) > 0 else None
+
+    def match(self, encoded: Sequence[int]) -> np.ndarray:
+        """
+        Vectorized counterpart of `Condition.does_match`.
+
+        Parameters
+        ----------
+        encoded: Sequence[int]
+            encoded perception (see `EncodedPerception`)
+
+        Returns
+        -------
+        np.ndarray
+            boolean mask telling which rows match the perception
+        """
+        p = np.asarray(encoded, dtype=np.int64)
+        return ((self.lower <= p) & (p <= self.upper)).all(axis=1)
+
+    def incorporating(self, condition: Iterable[UBR]) -> np.ndarray:
+        """
+        Vectorized counterpart of `Condition.subsumes` - finds rows
+        incorporating all the intervals of given condition.
+
+        Parameters
+        ----------
+        condition: Iterable[UBR]
+            condition attributes
+
+        Returns
+        -------
+        np.ndarray
+            boolean mask telling which rows incorporate the condition
+        """
+        lower, upper = self.bounds(condition)
+        return ((self.lower <= lower) & (self.upper >= upper)).all(axis=1)
+
+    def incorporated_by(self, condition: Iterable[UBR]) -> np.ndarray:
+        """
+        Finds rows having all the intervals incorporated by given condition
+        (see `incorporating`).
+
+        Parameters
+        ----------
+        condition: Iterable[UBR]
+            condition attributes
+
+        Returns
+        -------
+        np.ndarray
+            boolean mask telling which rows are incorporated
+        """
+        lower, upper = self.bounds(condition)
+        return ((lower <= self.lower) & (upper >= self.upper)).all(axis=1)
+
+    def cover_ratios(self, maximum_span: int) -> np.ndarray:
+        """
+        Vectorized counterpart of `Condition.cover_ratio`.
+
+        Parameters
+        ----------
+        maximum_span: int
+            number of all encoded values
+
+        Returns
+        -------
+        np.ndarray
+            cover ratio of each row
+        """
+        spans = self.upper - self.lower + 1
+        return (spans / maximum_span).mean(axis=1)
+
+    def region_counts(self, value_range: Tuple[int, int]) -> Dict[int, int]:
+        """
+        Vectorized counterpart of `Classifier.get_interval_proportions`
+        summed over all the rows.
+
+        Parameters
+        ----------
+        value_range: Tuple[int, int]
+            range of encoded values
+
+        Returns
+        -------
+        Dict[int, int]
+            A dictionary with interval region counts
+        """
+        at_min = self.lower == value_range[0]
+        at_max = self.upper == value_range[1]
+
+        return {
+            1: int((~at_min & ~at_max).sum()),
+            2: int((at_min & ~at_max).sum()),
+            3: int((~at_min & at_max).sum()),
+            4: int((at_min & at_max).sum()),
+        }
+
+    def _ensure_capacity(self, size: int) -> None:
+        capacity = len(self._tags)
+        if size <= capacity:
+            return
+
+        while capacity < size:
+            capacity *= 2
+
+        lower = np.empty((capacity, self.length), dtype=np.int64)
+        upper = np.empty((capacity, self.length), dtype=np.int64)
+        tags = np.empty(capacity, dtype=np.int64)
+        lower[:self._size] = self._lower[:self._size]
+        upper[:self._size] = self._upper[:self._size]
+        tags[:self._size] = self._tags[:self._size]
+        self._lower, self._upper, self._tags = lower, upper, tags
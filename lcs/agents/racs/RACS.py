@@ -4,7 +4,8 @@ from lcs import Perception
 from lcs.agents.Agent import TrialMetrics
 from lcs.agents.racs.action_selection import choose_action
 from ...agents import Agent
-from ...agents.racs import Configuration, ClassifierList
+from ...agents.racs import Configuration, ClassifierList, \
+    EncodedPerception
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +17,8 @@ class RACS(Agent):
                  cfg: Configuration,
                  population: ClassifierList = None) -> None:
         self.cfg = cfg
-        self.population = population or ClassifierList()
+        self.population = population \
+            if population is not None else ClassifierList()
 
     def get_population(self):
         return self.population
@@ -43,7 +45,7 @@ class RACS(Agent):
 
         # Initial conditions
         steps = 0
-        state = env.reset()
+        state = self._encode(env.reset())
 
         action = env.action_space.sample()
         reward = 0
@@ -97,7 +99,7 @@ class RACS(Agent):
 
             prev_state = state
             raw_state, reward, done, _ = env.step(action)
-            state = raw_state
+            state = self._encode(raw_state)
 
             if done:
                 ClassifierList.apply_alp(
@@ -138,7 +140,7 @@ class RACS(Agent):
         logger.debug("** Running trial exploit **")
 
         steps = 0
-        state = env.reset()
+        state = self._encode(env.reset())
 
         reward = 0
         action_set = ClassifierList()
@@ -164,6 +166,7 @@ class RACS(Agent):
             action_set = match_set.form_action_set(action)
 
             state, reward, done, _ = env.step(action)
+            state = self._encode(state)
 
             if done:
                 ClassifierList.apply_reinforcement_learning(
@@ -176,3 +179,7 @@ class RACS(Agent):
             steps += 1
 
         return TrialMetrics(steps, reward)
+
+    def _encode(self, state) -> EncodedPerception:
+        # Raw perception is encoded once per step
+        return EncodedPerception(state, self.cfg.encoder)
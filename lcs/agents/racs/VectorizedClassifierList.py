@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from lcs import Perception
+from . import Classifier, ClassifierList, Condition, EncodedPerception
+from .IntervalMatrix import IntervalMatrix
+
+
+class VectorizedClassifierList(ClassifierList):
+    """
+    Population of classifiers keeping lower and upper bounds of all
+    the condition intervals in NumPy matrices (see `IntervalMatrix`) next
+    to `Classifier` objects, whose `UBR` conditions remain available for
+    the existing API.
+
+    Matching, interval inclusion and coverage of the whole population are
+    performed as vectorized interval comparisons. It can be used as
+    a drop-in replacement for the rACS population, i.e.
+
+        RACS(cfg, population=VectorizedClassifierList())
+
+    Match sets and action sets formed from it are plain `ClassifierList`
+    objects.
+    """
+
+    def __init__(self, *args) -> None:
+        self._matrix: Optional[IntervalMatrix] = None
+        super().__init__(*args)
+        self._rebuild()
+
+    def form_match_set(self, situation: Perception) -> ClassifierList:
+        if self._matrix is None or len(self._items) == 0:
+            return ClassifierList()
+
+        encoder = self._items[0].cfg.encoder
+        mask = self._matrix.match(
+            EncodedPerception.of(situation, encoder).encoded)
+        return self._select(mask)
+
+    def find_incorporating(self, condition: Condition) -> ClassifierList:
+        """
+        Finds classifiers whose conditions incorporate all the intervals
+        of given condition (see `Condition.subsumes`).
+
+        Parameters
+        ----------
+        condition: Condition
+            condition to be incorporated
+
+        Returns
+        -------
+        ClassifierList
+            classifiers (in population order)
+        """
+        if self._matrix is None:
+            return ClassifierList()
+
+        return self._select(self._matrix.incorporating(condition))
+
+    def find_incorporated(self, condition: Condition) -> ClassifierList:
+        """
+        Finds classifiers whose conditions are incorporated by given
+        condition.
+
+        Parameters
+        ----------
+        condition: Condition
+            incorporating condition
+
+        Returns
+        -------
+        ClassifierList
+            classifiers (in population order)
+        """
+        if self._matrix is None:
+            return ClassifierList()
+
+        return self._select(self._matrix.incorporated_by(condition))
+
+    def cover_ratios(self) -> np.ndarray:
+        """
+        Returns
+        -------
+        np.ndarray
+            cover ratio of each classifier condition
+            (see `Condition.cover_ratio`)
+        """
+        if self._matrix is None or len(self._items) == 0:
+            return np.empty(0)
+
+        maximum_span = self._items[0].cfg.encoder.range[1] + 1
+        return self._matrix.cover_ratios(maximum_span)
+
+    def region_counts(self) -> Dict[int, int]:
+        """
+        Returns
+        -------
+        Dict[int, int]
+            interval region counts of all the conditions
+            (see `Classifier.get_interval_proportions`)
+        """
+        if self._matrix is None or len(self._items) == 0:
+            return {1: 0, 2: 0, 3: 0, 4: 0}
+
+        return self._matrix.region_counts(self._items[0].cfg.encoder.range)
+
+    def refresh(self, cl: Classifier) -> None:
+        super().refresh(cl)
+
+        if self._matrix is None:
+            return
+
+        idx = self._matrix.find(id(cl))
+        if idx is not None:
+            self._matrix.set(idx, cl.condition, id(cl))
+
+    def insert(self, index: int, o: Classifier) -> None:
+        size = len(self._items)
+        super().insert(index, o)
+
+        if self._matrix is None:
+            self._matrix = IntervalMatrix(len(o.condition))
+
+        # Normalize index the same way `list.insert` does
+        if index < 0:
+            index = max(0, size + index)
+        index = min(index, size)
+
+        self._matrix.insert(index, o.condition, id(o))
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._rebuild()
+
+    def __setitem__(self, i, o):
+        super().__setitem__(i, o)
+        if isinstance(i, slice):
+            self._rebuild()
+        else:
+            idx = range(len(self._items))[i]
+            self._matrix.set(idx, o.condition, id(o))
+
+    def __delitem__(self, i):
+        if isinstance(i, slice):
+            super().__delitem__(i)
+            self._rebuild()
+        else:
+            idx = range(len(self._items))[i]
+            super().__delitem__(i)
+            self._matrix.delete(idx)
+
+    def _select(self, mask: np.ndarray) -> ClassifierList:
+        items = self._items
+        return ClassifierList.from_trusted(
+            *[items[i] for i in np.flatnonzero(mask)])
+
+    def _rebuild(self) -> None:
+        """
+        Re-reads all the intervals from scratch
+        """
+        if len(self._items) == 0:
+            if self._matrix is not None:
+                self._matrix.clear()
+            return
+
+        self._matrix = IntervalMatrix(len(self._items[0].condition),
+                                      capacity=len(self._items))
+        for idx, cl in enumerate(self._items):
+            self._matrix.insert(idx, cl.condition, id(cl))
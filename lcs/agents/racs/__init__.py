@@ -1,8 +1,11 @@
 # flake8: noqa
 from .Configuration import Configuration
+from .EncodedPerception import EncodedPerception
 from .Condition import Condition
 from .Effect import Effect
 from .Mark import Mark
 from .Classifier import Classifier
 from .ClassifierList import ClassifierList
+from .VectorizedClassifierList import VectorizedClassifierList
+from .IntervalIndexedClassifierList import IntervalIndexedClassifierList
 from .RACS import RACS
@@ -1,17 +1,36 @@
 import itertools
 import logging
-from typing import List
+from typing import List, Tuple
 
 import numpy as np
 
 from lcs.agents import PerceptionString
-from lcs.agents.racs import Classifier, Condition, Effect
+from lcs.agents.racs import Classifier, Configuration
 from lcs.representations import UBR
-from lcs.representations.RealValueEncoder import RealValueEncoder
 
 logger = logging.getLogger(__name__)
 
 
+def genome(cl: Classifier) -> np.ndarray:
+    """
+    Flat integer genome of the classifier - the first row holds
+    the interval bounds (x1, x2 of each attribute) of the condition,
+    the second one of the effect.
+
+    Parameters
+    ----------
+    cl: Classifier
+        classifier
+
+    Returns
+    -------
+    np.ndarray
+        (2, 2 * classifier length) array of encoded bounds
+    """
+    return np.array([_flatten(cl.condition), _flatten(cl.effect)],
+                    dtype=np.int64)
+
+
 def mutate(cl: Classifier, mu: float) -> None:
     """
     Tries to alternate (widen) the classifier condition and effect part.
@@ -24,64 +43,134 @@ def mutate(cl: Classifier, mu: float) -> None:
     mu: float
         probability of executing mutation on single interval bound
     """
-    encoder = cl.cfg.encoder
-    noise_max = cl.cfg.mutation_noise
-    wildcard = cl.cfg.classifier_wildcard
+    g = genome(cl)
+    mutate_genome(g, cl.cfg, mu)
+
+    # Only specified intervals might have been changed
+    for ps, bounds in zip([cl.condition, cl.effect], g.tolist()):
+        for idx, ubr in enumerate(ps):
+            x1, x2 = bounds[2 * idx], bounds[2 * idx + 1]
+            if ubr.x1 != x1 or ubr.x2 != x2:
+                ubr.x1, ubr.x2 = x1, x2
 
-    for c, e in zip(cl.condition, cl.effect):
-        if c != wildcard and e != wildcard:
-            _widen_attribute(c, encoder, noise_max, mu)
-            _widen_attribute(e, encoder, noise_max, mu)
+
+def mutate_genome(g: np.ndarray, cfg: Configuration, mu: float) -> None:
+    """
+    Mutates the genome (see `genome`) in place. Attributes specified both
+    in condition and effect are widened - each of their bounds with `mu`
+    probability is decoded, disturbed with uniform noise (see
+    `mutation_noise`) and encoded again. Noise for all the bounds is drawn
+    at once.
+
+    Parameters
+    ----------
+    g: np.ndarray
+        classifier genome
+    cfg: Configuration
+        algorithm configuration
+    mu: float
+        probability of executing mutation on single interval bound
+    """
+    x1, x2 = g[:, 0::2], g[:, 1::2]
+    wildcard = cfg.classifier_wildcard
+    is_wildcard = (np.minimum(x1, x2) == wildcard.lower_bound) & \
+        (np.maximum(x1, x2) == wildcard.upper_bound)
+
+    # Both bounds of attributes specified in condition and effect
+    specified = np.repeat(~is_wildcard.any(axis=0), 2)
+
+    mutated = (np.random.random(g.shape) < mu) & specified
+    noise = np.random.uniform(-cfg.mutation_noise, cfg.mutation_noise,
+                              g.shape)
+
+    if mutated.any():
+        encoder = cfg.encoder
+        g[mutated] = encoder.encode_batch(
+            encoder.decode_batch(g[mutated]), noise[mutated])
 
 
 def crossover(parent: Classifier, donor: Classifier):
     assert parent.cfg.classifier_length == donor.cfg.classifier_length
 
-    # flatten parent and donor perception strings
-    p_cond_flat = _flatten(parent.condition)
-    d_cond_flat = _flatten(donor.condition)
-    p_effect_flat = _flatten(parent.effect)
-    d_effect_flat = _flatten(donor.effect)
+    p_genome, d_genome = genome(parent), genome(donor)
+    left, right = crossover_genomes(p_genome, d_genome)
+
+    # Replace the exchanged intervals
+    for cl, g in [(parent, p_genome), (donor, d_genome)]:
+        for ps, bounds in zip([cl.condition, cl.effect], g.tolist()):
+            for idx in range(left // 2, (right + 1) // 2):
+                ps[idx] = UBR(bounds[2 * idx], bounds[2 * idx + 1])
+
 
+def crossover_genomes(p_genome: np.ndarray,
+                      d_genome: np.ndarray) -> Tuple[int, int]:
+    """
+    Executes two-point crossover of genomes (see `genome`) in place.
+    The same part of both condition and effect gets exchanged.
+
+    Parameters
+    ----------
+    p_genome: np.ndarray
+        genome of the parent
+    d_genome: np.ndarray
+        genome of the donor
+
+    Returns
+    -------
+    Tuple[int, int]
+        crossing points
+    """
     # select crossing points
     left, right = sorted(np.random.choice(
-        range(0, len(p_cond_flat) + 1), 2, replace=False))
+        range(0, p_genome.shape[1] + 1), 2, replace=False))
 
     assert left < right
 
-    # extract chromosomes
-    p_cond_chromosome = p_cond_flat[left:right]
-    d_cond_chromosome = d_cond_flat[left:right]
-    p_effect_chromosome = p_effect_flat[left:right]
-    d_effect_chromosome = d_effect_flat[left:right]
-
-    # Flip everything
-    p_cond_flat[left:right] = d_cond_chromosome
-    d_cond_flat[left:right] = p_cond_chromosome
-    p_effect_flat[left:right] = d_effect_chromosome
-    d_effect_flat[left:right] = p_effect_chromosome
-
-    # Rebuild proper perception strings
-    parent.condition = Condition(_unflatten(p_cond_flat), cfg=parent.cfg)
-    donor.condition = Condition(_unflatten(d_cond_flat), cfg=donor.cfg)
-    parent.effect = Effect(_unflatten(p_effect_flat), cfg=parent.cfg)
-    donor.effect = Effect(_unflatten(d_effect_flat), cfg=parent.cfg)
-
-
-def _widen_attribute(ubr: UBR, encoder: RealValueEncoder,
-                     noise_max: float, mu: float):
-
-    # TODO: we should modify both condition and effect parts with the
-    # same noise.
-    if np.random.random() < mu:
-        noise = np.random.uniform(-noise_max, noise_max)
-        x1p = encoder.decode(ubr.x1)
-        ubr.x1 = encoder.encode(x1p, noise)
-
-    if np.random.random() < mu:
-        noise = np.random.uniform(-noise_max, noise_max)
-        x2p = encoder.decode(ubr.x2)
-        ubr.x2 = encoder.encode(x2p, noise)
+    # swap chromosomes
+    chromosome = p_genome[:, left:right].copy()
+    p_genome[:, left:right] = d_genome[:, left:right]
+    d_genome[:, left:right] = chromosome
+
+    return left, right
+
+
+def specificity(g: np.ndarray, cfg: Configuration) -> int:
+    """
+    Returns
+    -------
+    int
+        number of specified condition attributes of the genome
+        (see `Condition.specificity`)
+    """
+    x1, x2 = g[0, 0::2], g[0, 1::2]
+    wildcard = cfg.classifier_wildcard
+    return int(((np.minimum(x1, x2) != wildcard.lower_bound) |
+                (np.maximum(x1, x2) != wildcard.upper_bound)).sum())
+
+
+def materialize(g: np.ndarray, parent: Classifier, time: int) -> Classifier:
+    """
+    Creates the classifier from the genome (see `genome`), copying other
+    properties from its parent (see `Classifier.copy_from`).
+
+    Parameters
+    ----------
+    g: np.ndarray
+        classifier genome
+    parent: Classifier
+        classifier the genome originates from
+    time: int
+        time of creation / current epoch
+
+    Returns
+    -------
+    Classifier
+        new classifier
+    """
+    condition, effect = g.tolist()
+    return Classifier.copy_from(parent, time,
+                                condition=_unflatten(condition),
+                                effect=_unflatten(effect))
 
 
 def _flatten(ps: PerceptionString) -> List[int]:
@@ -1,31 +1,198 @@
-from typing import Optional
+from typing import Dict, List, Optional
 
 import numpy as np
 import random
 import logging
 
-from lcs import TypedList, Perception
+from lcs import Perception, SumTree
+from lcs.agents import ActionPartitionedList
 from lcs.agents.xcs import Classifier, Condition, Configuration
 
 logger = logging.getLogger(__name__)
 
 
-class ClassifiersList(TypedList):
+class _Totals:
+    """
+    Running sums of numerosity and fitness of the list elements.
+    Parameters of each element are remembered, so the sums can be
+    corrected when the element is modified in place.
+    """
+
+    def __init__(self, items: List[Classifier]):
+        self.numerosity = 0
+        self.fitness = 0.0
+        self._params: Dict[int, List] = {}
+
+        for cl in items:
+            self.add(cl)
+
+    def add(self, cl: Classifier) -> None:
+        params = self._params.get(id(cl))
+        if params is None:
+            # numerosity, fitness, occurrences in the list
+            params = self._params[id(cl)] = [cl.numerosity, cl.fitness, 0]
+
+        params[2] += 1
+        self.numerosity += params[0]
+        self.fitness += params[1]
+
+    def discard(self, cl: Classifier) -> None:
+        params = self._params[id(cl)]
+        params[2] -= 1
+        self.numerosity -= params[0]
+        self.fitness -= params[1]
+
+        if params[2] == 0:
+            del self._params[id(cl)]
+
+    def refresh(self, cl: Classifier) -> None:
+        params = self._params.get(id(cl))
+        if params is None:
+            return
+
+        numerosity, fitness, count = params
+        self.numerosity += (cl.numerosity - numerosity) * count
+        self.fitness += (cl.fitness - fitness) * count
+        params[0], params[1] = cl.numerosity, cl.fitness
+
+
+class _DeletionVotes:
+    """
+    Deletion votes of the list elements kept in a sum tree (in the list
+    order), so the roulette-wheel deletion takes O(log n).
+
+    Votes depend on the average fitness in the population, they are
+    computed using the value observed when the tree was built.
+    """
+
+    def __init__(self, population, average_fitness: float):
+        self.average_fitness = average_fitness
+        self._population = population
+        self._tree = SumTree(len(population))
+        self._classifiers: List[Optional[Classifier]] = []
+        self._slots: Dict[int, List[int]] = {}
+
+        for cl in population:
+            self.add(cl)
+
+    @property
+    def dead(self) -> int:
+        return len(self._classifiers) - len(self._population)
+
+    def add(self, cl: Classifier) -> None:
+        slot = self._tree.append(self._vote(cl))
+        self._classifiers.append(cl)
+        self._slots.setdefault(id(cl), []).append(slot)
+
+    def discard(self, cl: Classifier) -> None:
+        # Remove the first occurrence (the same object might be stored twice)
+        slots = self._slots[id(cl)]
+        slot = slots.pop(0)
+        self._tree[slot] = 0.0
+        self._classifiers[slot] = None
+
+        if not slots:
+            del self._slots[id(cl)]
+
+    def refresh(self, cl: Classifier) -> None:
+        for slot in self._slots.get(id(cl), ()):
+            self._tree[slot] = self._vote(cl)
+
+    def select(self) -> Optional[Classifier]:
+        selector = random.uniform(0, self._tree.total)
+
+        if selector <= 0:
+            return next((cl for cl in self._classifiers if cl is not None),
+                        None)
+
+        slot = self._tree.find(selector)
+        if slot < len(self._classifiers):
+            return self._classifiers[slot]
+
+        return None
+
+    def _vote(self, cl: Classifier) -> float:
+        return self._population._deletion_vote(cl, self.average_fitness)
+
+
+class ClassifiersList(ActionPartitionedList):
+    """
+    Total numerosity and fitness of the classifiers are kept up to date
+    on every modification of the list. Classifiers which numerosity or
+    fitness was changed in place must be reported with `refresh`.
+
+    Deletion votes (see `delete_from_population`) are maintained in a sum
+    tree once the population exceeds its maximum size. The tree is rebuilt
+    when the average fitness drifts from the value used to compute votes
+    by more than `cfg.deletion_fitness_tolerance` (relatively).
+    """
+
     def __init__(self,
                  cfg: Configuration,
                  *args,
                  oktypes=(Classifier,),
                  ) -> None:
         self.cfg = cfg
+        self._totals: Optional[_Totals] = None
+        self._votes: Optional[_DeletionVotes] = None
         super().__init__(*args, oktypes=oktypes)
 
     def insert_in_population(self, cl: Classifier):
-        for c in self:
-            if c == cl:
-                c.numerosity += 1
-                return 
+        similar = self.find_similar(cl)
+        if similar:
+            similar[0].numerosity += 1
+            self.refresh(similar[0])
+            return
         self.append(cl)
 
+    def refresh(self, cl: Classifier) -> None:
+        super().refresh(cl)
+        if self._totals is not None:
+            self._totals.refresh(cl)
+        if self._votes is not None:
+            self._votes.refresh(cl)
+
+    def insert(self, index: int, cl: Classifier) -> None:
+        appending = index >= len(self._items)
+        super().insert(index, cl)
+        if self._totals is not None:
+            self._totals.add(cl)
+        if self._votes is not None:
+            if appending:
+                self._votes.add(cl)
+            else:
+                self._votes = None
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._votes = None
+
+    def __setitem__(self, i, cl):
+        super().__setitem__(i, cl)
+        self._totals = None
+        self._votes = None
+
+    def __delitem__(self, i):
+        if isinstance(i, slice) or self._totals is None:
+            self._totals = None
+        else:
+            self._totals.discard(self._items[i])
+
+        if isinstance(i, slice):
+            self._votes = None
+        elif self._votes is not None:
+            self._votes.discard(self._items[i])
+
+        super().__delitem__(i)
+
+        # Compact the tombstones
+        if self._votes is not None and self._votes.dead > len(self._items):
+            self._votes = None
+
+    @staticmethod
+    def _similarity_key(cl: Classifier):
+        return tuple(cl.condition), cl.action
+
     def generate_covering_classifier(self, situation, action, time_stamp):
         # both Perception and string has __getitem__
         # this way allows situation to be either str or Perception
@@ -51,12 +218,18 @@ class ClassifiersList(TypedList):
     # TODO: use strategies
     def delete_from_population(self):
         if self.numerosity > self.cfg.max_population:
-            average_fitness = sum(cl.fitness for cl in self) / self.numerosity
-            deletion_votes = []
-            for cl in self:
-                deletion_votes.append(self._deletion_vote(cl, average_fitness))
-            selector = random.uniform(0, sum(deletion_votes))
-            self._remove_based_on_votes(deletion_votes, selector)
+            average_fitness = self.fitness / self.numerosity
+            if self._votes is None or self._has_drifted(average_fitness):
+                self._votes = _DeletionVotes(self, average_fitness)
+
+            cl = self._votes.select()
+            if cl is not None:
+                self._remove_micro_classifier(cl)
+
+    def _has_drifted(self, average_fitness):
+        reference = self._votes.average_fitness
+        return abs(average_fitness - reference) > \
+            self.cfg.deletion_fitness_tolerance * abs(reference)
 
     def _deletion_vote(self, cl, average_fitness):
         vote = cl.action_set_size * cl.numerosity
@@ -66,36 +239,43 @@ class ClassifiersList(TypedList):
             vote *= average_fitness / (cl.fitness / cl.numerosity)
         return vote
 
-    def _remove_based_on_votes(self, deletion_votes, selector):
-        for cl, vote in zip(self, deletion_votes):
-            selector -= vote
-            if selector <= 0:
-                if cl.numerosity > 1:
-                    cl.numerosity -= 1
-                else:
-                    self.safe_remove(cl)
-                return None
+    def _remove_micro_classifier(self, cl):
+        if cl.numerosity > 1:
+            cl.numerosity -= 1
+            self.refresh(cl)
+        else:
+            self.safe_remove(cl)
 
     def generate_match_set(self, situation: Perception, time_stamp):
         matching_ls = [cl for cl in self if cl.does_match(situation)]
-        while len(matching_ls) < self.cfg.number_of_actions:
-            action = self._find_not_present_action(matching_ls)
+        match_set = ClassifiersList.from_trusted(self.cfg, *matching_ls)
+        while len(match_set) < self.cfg.number_of_actions:
+            action = self._find_not_present_action(match_set)
             cl = self._generate_covering_and_insert(situation, action, time_stamp)
-            matching_ls.append(cl)
-        return ClassifiersList(self.cfg, *matching_ls)
+            match_set.append(cl)
+        return match_set
 
     def _find_not_present_action(self, matching_set):
+        present = matching_set.actions
         for action in range(0, self.cfg.number_of_actions):
-            if all(cl.action != action for cl in matching_set):
+            if action not in present:
                 return action
 
     def generate_action_set(self, action):
-        action_ls = [cl for cl in self if cl.action == action]
-        return ClassifiersList(self.cfg, *action_ls)
+        return ClassifiersList.from_trusted(self.cfg, *self.by_action(action))
 
     @property
     def numerosity(self):
-        return sum(cl.numerosity for cl in self)
+        return self._get_totals().numerosity
+
+    @property
+    def fitness(self):
+        return self._get_totals().fitness
+
+    def _get_totals(self) -> _Totals:
+        if self._totals is None:
+            self._totals = _Totals(self._items)
+        return self._totals
 
     @property
     def best_prediction(self):
@@ -104,13 +284,14 @@ class ClassifiersList(TypedList):
     @property
     def prediction_array(self):
         prediction_array = [0 for _ in range(self.cfg.number_of_actions)]
-        fitness_sum_array = [0 for _ in range(self.cfg.number_of_actions)]
-        for cl in self:
-            prediction_array[cl.action] += cl.prediction * cl.fitness
-            fitness_sum_array[cl.action] += cl.fitness
-        for i in range(self.cfg.number_of_actions):
-            if fitness_sum_array[i] != 0:
-                prediction_array[i] /= fitness_sum_array[i]
+        for action, cls in self.partition().items():
+            prediction, fitness_sum = 0, 0
+            for cl in cls:
+                prediction += cl.prediction * cl.fitness
+                fitness_sum += cl.fitness
+            if fitness_sum != 0:
+                prediction /= fitness_sum
+            prediction_array[action] = prediction
         return prediction_array
 
     def update_set(self, p):
@@ -151,3 +332,5 @@ class ClassifiersList(TypedList):
                 self.cfg.learning_rate *
                 (k * cl.numerosity / accuracy_sum - cl.fitness)
             )
+        # Fitness of every classifier has changed
+        self._totals = None
@@ -27,7 +27,8 @@ class Configuration(object):
                  metrics_trial_frequency: int = 5,
                  user_metrics_collector_fcn: Callable = None,
                  use_mlflow: bool = False,
-                 model_checkpoint_freq: int = 50) -> None:
+                 model_checkpoint_freq: int = 50,
+                 deletion_fitness_tolerance: float = 0.01) -> None:
         """
         :param classifier_wildcard: Wildcard symbol
         :param max_population: maximum size of the population
@@ -50,6 +51,7 @@ class Configuration(object):
         :param number_of_actions: minimal number of actions in match_set
         :param do_ga_subsumption: specifies if offspring are to be tested for logical subsumption
         :param do_action_set_subsumption: specifies if action sets are to be tested for subsuming classifiers
+        :param deletion_fitness_tolerance: relative change of the mean fitness in P after which deletion votes are recomputed
         """
         self.classifier_wildcard = classifier_wildcard
         self.max_population = max_population
@@ -63,6 +65,7 @@ class Configuration(object):
         self.mutation_chance = mutation_chance
         self.deletion_threshold = deletion_threshold
         self.delta = delta
+        self.deletion_fitness_tolerance = deletion_fitness_tolerance
         self.subsumption_threshold = subsumption_threshold
         self.covering_wildcard_chance = covering_wildcard_chance
         self.initial_prediction = initial_prediction
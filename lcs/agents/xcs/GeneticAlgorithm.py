@@ -46,16 +46,20 @@ def _perform_insertion_or_subsumption(cfg: Configuration, population: Classifier
     if cfg.do_GA_subsumption:
         if parent1.does_subsume(child1):
             parent1.numerosity += 1
+            population.refresh(parent1)
         elif parent2.does_subsume(child1):
             parent2.numerosity += 1
+            population.refresh(parent2)
         else:
             population.insert_in_population(child1)
         population.delete_from_population()
 
         if parent1.does_subsume(child2):
             parent1.numerosity += 1
+            population.refresh(parent1)
         elif parent2.does_subsume(child2):
             parent2.numerosity += 1
+            population.refresh(parent2)
         else:
             population.insert_in_population(child2)
         population.delete_from_population()
@@ -69,6 +73,9 @@ def _perform_insertion_or_subsumption(cfg: Configuration, population: Classifier
 def _make_children(parent1, parent2):
     child1 = copy(parent1)
     child2 = copy(parent2)
+    # conditions are modified in place, they can't be shared with parents
+    child1.condition = copy(parent1.condition)
+    child2.condition = copy(parent2.condition)
     child1.numerosity = 1
     child2.numerosity = 1
     child1.experience = 0
@@ -92,6 +92,8 @@ class XCS(Agent):
     def _distribute_and_update(self, action_set, situation, p):
         if action_set is not None and len(action_set) > 0:
             action_set.update_set(p)
+            for cl in action_set:
+                self.population.refresh(cl)
             if self.cfg.do_action_set_subsumption:
                 self.do_action_set_subsumption(action_set)
             GeneticAlgorithm.run_ga(self.population,
@@ -124,3 +126,4 @@ class XCS(Agent):
                     cl.numerosity += c.numerosity
                     action_set.safe_remove(c)
                     self.population.safe_remove(c)
+                    self.population.refresh(cl)
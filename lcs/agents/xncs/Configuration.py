@@ -31,7 +31,8 @@ class Configuration(xcs.Configuration):
                  do_ga_subsumption: bool = False,
                  do_action_set_subsumption: bool = False,
                  metrics_trial_frequency: int = 5,
-                 user_metrics_collector_fcn: Callable = None
+                 user_metrics_collector_fcn: Callable = None,
+                 deletion_fitness_tolerance: float = 0.01
                  ) -> None:
         self.lmc = lmc
         self.lem = lem
@@ -47,6 +48,7 @@ class Configuration(xcs.Configuration):
         self.mutation_chance = mutation_chance
         self.deletion_threshold = deletion_threshold
         self.delta = delta
+        self.deletion_fitness_tolerance = deletion_fitness_tolerance
         self.subsumption_threshold = subsumption_threshold
         self.covering_wildcard_chance = covering_wildcard_chance
         self.initial_prediction = initial_prediction
@@ -266,11 +266,11 @@ class ClassifiersList(TypedList[Classifier]):
 
     def form_match_set(self, situation: Perception) -> ClassifiersList:
         matching = [cl for cl in self if cl.does_match(situation)]
-        return ClassifiersList(*matching)
+        return ClassifiersList.from_trusted(*matching)
 
     def form_action_set(self, action: int) -> ClassifiersList:
         matching = [cl for cl in self if cl.action == action]
-        return ClassifiersList(*matching)
+        return ClassifiersList.from_trusted(*matching)
 
 
 class LatentLearning:
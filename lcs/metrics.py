@@ -21,3 +21,11 @@ def population_metrics(population, environment):
             metrics['reliable'] += 1
 
     return metrics
+
+
+def match_set_cache_metrics(match_sets, environment):
+    return {
+        'match_set_hits': match_sets.hits,
+        'match_set_patches': match_sets.patches,
+        'match_set_misses': match_sets.misses,
+    }
@@ -18,6 +18,7 @@ class RealValueEncoder:
     def __init__(self, resolution_bits: int) -> None:
         resolution = pow(2, resolution_bits)
         step = 1 / resolution
+        self.resolution = resolution
         self.upper_max = resolution - 1
         self.splits = [x * step for x in range(0, resolution + 1)]
 
@@ -35,8 +36,8 @@ class RealValueEncoder:
 
     def encode(self, val: float, noise: float = 0.0) -> int:
         """
-        Encodes the float value into `[0, 2^bits]` states.
-        This results in `2^bits + 1` different states.
+        Encodes the float value into `[0, 2^bits - 1]` states
+        in constant time.
 
         Parameters
         ----------
@@ -54,27 +55,38 @@ class RealValueEncoder:
             raise ValueError("Value not in correct [0, 1] range")
 
         # Disturb value and limit it within range
-        val = np.clip(val + noise, 0, 1)
+        val = min(max(val + noise, 0), 1)
 
-        # Check boundary conditions
-        if val == 0:
-            return self.range[0]
+        # Splits are multiples of 2^-bits, so scaling by the resolution is
+        # exact and the bucket is the integer part (1 falls into the last)
+        return min(int(val * self.resolution), self.upper_max)
 
-        if val == 1:
-            return self.range[1]
+    def encode_batch(self, values: np.ndarray, noise: float = 0.0) \
+            -> np.ndarray:
+        """
+        Vectorized counterpart of `encode`.
 
-        # In other cases iterate over splits to find correct bucket
-        bucket = -1
-        for i, _ in enumerate(self.splits[:-1]):
-            x1 = self.splits[i]
-            x2 = self.splits[i + 1]
+        Parameters
+        ----------
+        values : np.ndarray
+            real-valued numbers in range [0,1]
+        noise: float
+            noise that is appended to each value
 
-            if x1 <= val < x2:
-                bucket = i
+        Returns
+        -------
+        np.ndarray
+            discrete states within resolution (the same shape as `values`)
+        """
+        values = np.asarray(values, dtype=np.float64)
+
+        if np.any((values < 0) | (values > 1)):
+            raise ValueError("Value not in correct [0, 1] range")
 
-        assert bucket != -1
+        values = np.clip(values + noise, 0, 1)
+        encoded = np.floor(values * self.resolution).astype(np.int64)
 
-        return bucket
+        return np.minimum(encoded, self.upper_max)
 
     def decode(self, encoded_val: int) -> float:
         """
@@ -96,3 +108,25 @@ class RealValueEncoder:
             raise ValueError("Value is not from possible resolution range")
 
         return encoded_val / self.upper_max
+
+    def decode_batch(self, encoded_values: np.ndarray) -> np.ndarray:
+        """
+        Vectorized counterpart of `decode`.
+
+        Parameters
+        ----------
+        encoded_values : np.ndarray
+            encoded values
+
+        Returns
+        -------
+        np.ndarray
+            real-valued numbers from [0,1] range
+        """
+        encoded_values = np.asarray(encoded_values)
+
+        if np.any((encoded_values < 0) |
+                  (encoded_values > self.upper_max)):
+            raise ValueError("Value is not from possible resolution range")
+
+        return encoded_values / self.upper_max
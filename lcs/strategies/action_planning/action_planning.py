@@ -1,9 +1,10 @@
-from typing import List
+from typing import List, Optional
 
 from lcs import Perception
 from lcs.agents.acs2 import ClassifiersList
 from lcs.strategies.action_planning.goal_sequence_searcher \
     import GoalSequenceSearcher
+from lcs.strategies.action_planning.transition_graph import TransitionGraph
 
 
 def suitable_cl_exists(classifiers: ClassifiersList,
@@ -40,7 +41,9 @@ def suitable_cl_exists(classifiers: ClassifiersList,
 
 def search_goal_sequence(classifiers: ClassifiersList,
                          p0: Perception,
-                         p1: Perception) -> List:
+                         p1: Perception,
+                         graph: Optional[TransitionGraph] = None,
+                         max_depth: int = 6) -> List:
     """
     Searches a path from start to goal using a bidirectional method in the
     environmental model (i.e. the list of reliable classifiers).
@@ -52,13 +55,21 @@ def search_goal_sequence(classifiers: ClassifiersList,
         start state
     p1: Perception
         destination state
+    graph: Optional[TransitionGraph]
+        model cached between the searches, updated with the reliable
+        classifiers from the list. Temporary one is used if not provided
+    max_depth: int
+        number of steps searched from both the start and the goal
 
     Returns
     -------
     list
         sequence of actions
     """
-    reliable = [cl for cl in classifiers if cl.is_reliable()]
-    gs = GoalSequenceSearcher()
+    if graph is None:
+        graph = TransitionGraph()
 
-    return gs.search_goal_sequence(ClassifiersList(*reliable), p0, p1)
+    graph.update(classifiers)
+    gs = GoalSequenceSearcher(max_depth)
+
+    return gs.search_goal_sequence(graph, p0, p1)
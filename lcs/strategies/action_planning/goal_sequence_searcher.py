@@ -1,30 +1,47 @@
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 from lcs import Perception
-from lcs.agents.acs2 import Classifier
 from lcs.agents.acs2.ClassifiersList import ClassifiersList
+from lcs.strategies.action_planning.transition_graph import Transition, \
+    TransitionGraph
+
+# Environmental model - reliable classifiers or the graph built from them
+Model = Union[ClassifiersList, TransitionGraph]
+
+# Visited perception and the step leading to it from the search origin
+# (neighbouring perception and action), None for the origin itself
+Parents = Dict[Perception, Optional[Tuple[Perception, int]]]
+
+# Maximum number of perceptions visited in one direction
+MAX_VISITED = 10001
 
 
 class GoalSequenceSearcher:
 
-    def __init__(self):
-        self.forward_classifiers = []
-        self.backward_classifiers = []
-        self.forward_perceptions = []
-        self.backward_perceptions = []
+    def __init__(self, max_depth: int = 6):
+        self.max_depth = max_depth
+        self.forward_parents: Parents = {}
+        self.backward_parents: Parents = {}
 
     def search_goal_sequence(self,
-                             reliable_classifiers: ClassifiersList,
+                             reliable_classifiers: Model,
                              start: Perception,
                              goal: Perception) -> list:
         """
         Searches a path from start to goal using a bidirectional method in the
         environmental model (i.e. the list of reliable classifiers).
 
+        Both searches advance one level at a time (up to `max_depth` levels
+        each). Visited perceptions are kept in maps pointing to their
+        parents, so checking whether the other search already reached
+        the perception takes constant time and the sequence is formed
+        by following the pointers from the meeting point.
+
         Parameters
         ----------
         reliable_classifiers
-            list of reliable classifiers
+            list of reliable classifiers (or the `TransitionGraph`
+            formed by them)
         start: Perception
         goal: Perception
 
@@ -36,38 +53,25 @@ class GoalSequenceSearcher:
         if len(reliable_classifiers) < 1:
             return []
 
-        max_depth = 6
-        forward_size = 1
-        backward_size = 1
-        forward_point = 0
-        backward_point = 0
-        action_sequence = None
+        start, goal = Perception(start), Perception(goal)
 
-        self.forward_classifiers.clear()
-        self.backward_classifiers.clear()
-        self.forward_perceptions.clear()
-        self.backward_perceptions.clear()
+        self.forward_parents = {start: None}
+        self.backward_parents = {goal: None}
 
-        self.forward_perceptions.append(Perception(start))
-        self.backward_perceptions.append(Perception(goal))
+        forward_frontier = [start]
+        backward_frontier = [goal]
 
-        for depth in range(0, max_depth):
-            # forward step
-            action_sequence, forward_size_new = \
+        for _ in range(0, self.max_depth):
+            action_sequence, forward_frontier = \
                 self._search_one_forward_step(reliable_classifiers,
-                                              forward_size, forward_point)
-            forward_point = forward_size
-            forward_size = forward_size_new
+                                              forward_frontier)
 
             if action_sequence is not None:
                 return action_sequence
 
-            # backwards step
-            action_sequence, backward_size_new = \
+            action_sequence, backward_frontier = \
                 self._search_one_backward_step(reliable_classifiers,
-                                               backward_size, backward_point)
-            backward_point = backward_size
-            backward_size = backward_size_new
+                                               backward_frontier)
 
             if action_sequence is not None:
                 return action_sequence
@@ -76,205 +80,144 @@ class GoalSequenceSearcher:
         return []
 
     def _search_one_forward_step(self,
-                                 reliable_classifiers: ClassifiersList,
-                                 forward_size: int,
-                                 forward_point: int) -> Tuple[Optional[list],
-                                                              int]:
+                                 reliable_classifiers: Model,
+                                 frontier: List[Perception]) \
+            -> Tuple[Optional[list], List[Perception]]:
         """
-        Searches one step forward in the reliable_classifiers classifier list.
-        Returns None if nothing was found so far, a sequence with a -1 element
-        if the search failed completely
-        (which is the case if the allowed array size of 10000 is reached),
-        or the sequence if one was found.
-        :param reliable_classifiers: ClassifiersList
-        :param forward_size: int
-        :param forward_point: int
-        :return: act sequence and new forward_size
+        Expands perceptions reached in the previous forward step.
+
+        Parameters
+        ----------
+        reliable_classifiers: Model
+            environmental model
+        frontier: List[Perception]
+            perceptions reached in the previous step
+
+        Returns
+        -------
+        Tuple[Optional[list], List[Perception]]
+            None if nothing was found so far, an empty sequence if the search
+            failed completely (too many perceptions were visited),
+            or the sequence if one was found; and the perceptions reached
+            in this step
         """
-        size = forward_size
-        for i in range(forward_point, forward_size):
-            match_forward = reliable_classifiers. \
-                form_match_set(situation=self.forward_perceptions[i])
-            for match_set_element in match_forward:
-                anticipation = match_set_element. \
-                    get_best_anticipation(self.forward_perceptions[i])
-                if self.get_state_idx(self.forward_perceptions,
-                                      anticipation) is None:
-                    # state not detected forward -> search in backwards
-                    backward_sequence_idx = self. \
-                        get_state_idx(self.backward_perceptions,
-                                      anticipation)
-                    if backward_sequence_idx is None:
-                        # state neither detected backwards
-                        self.forward_perceptions.append(anticipation)
-                        self.forward_classifiers.append(
-                            self._form_new_classifiers(
-                                self.forward_classifiers, i,
-                                match_set_element))
-                        size += 1
-                        if size > 10001:
-                            # logging.debug("Arrays are full")
-                            return [], size
-                    else:
-                        # sequence found
-                        return self._form_sequence_forwards(
-                            i, backward_sequence_idx, match_set_element), size
-        return None, size
+        forward, backward = self.forward_parents, self.backward_parents
+        new_frontier = []
+
+        for perception in frontier:
+            for cl, anticipation in self._transitions_forward(
+                    reliable_classifiers, perception):
+                if anticipation in forward:
+                    continue
+
+                if anticipation in backward:
+                    # sequence found
+                    return self._path_forwards(perception) + [cl.action] + \
+                        self._path_backwards(anticipation), new_frontier
+
+                forward[anticipation] = (perception, cl.action)
+                new_frontier.append(anticipation)
+
+                if len(forward) > MAX_VISITED:
+                    return [], new_frontier
+
+        return None, new_frontier
 
     def _search_one_backward_step(self,
-                                  reliable_classifiers: ClassifiersList,
-                                  backward_size: int,
-                                  backward_point: int) -> Tuple[Optional[list],
-                                                                int]:
+                                  reliable_classifiers: Model,
+                                  frontier: List[Perception]) \
+            -> Tuple[Optional[list], List[Perception]]:
         """
-        Searches one step backward in the reliable_classifiers classifiers list
-        Returns None if nothing was found so far, a sequence with a -1 element
-        if the search failed completely
-        (which is the case if the allowed array size of 10000 is reached),
-        or the sequence if one was found.
-        :param reliable_classifiers: ClassifiersList
-        :param backward_size: int
-        :param backward_point: int
-        :return: act sequence and new backward_size
-        """
-        size = backward_size
-        for i in range(backward_point, backward_size):
-            match_backward = reliable_classifiers.form_match_set_backwards(
-                situation=self.backward_perceptions[i])
-            for match_set_el in match_backward:
-                anticipation = match_set_el. \
-                    get_backwards_anticipation(self.backward_perceptions[i])
-                if anticipation is not None and self. \
-                        get_state_idx(self.backward_perceptions,
-                                      anticipation) is None:
-                    # Backwards anticipation was formable but
-                    # not detected backwards
-                    forward_sequence_idx = self.\
-                        get_state_idx(self.forward_perceptions,
-                                      anticipation)
-                    if forward_sequence_idx is None:
-                        self.backward_perceptions.append(anticipation)
-                        self.backward_classifiers.append(
-                            self._form_new_classifiers(
-                                self.backward_classifiers, i, match_set_el))
-                        size += 1
-                        if size > 10001:
-                            # logging.debug("Arrays are full")
-                            return [], size
-                    else:
-                        return self._form_sequence_backwards(
-                            i, forward_sequence_idx, match_set_el), size
-        return None, size
+        Expands perceptions reached in the previous backward step
+        (see `_search_one_forward_step`).
 
-    @staticmethod
-    def _form_new_classifiers(classifiers_lists: List[ClassifiersList],
-                              i: int,
-                              match_set_el: Classifier) -> ClassifiersList:
-        """
-        Executes actions after sequence was not detected.
-        :param classifiers_lists: list of ClassifiersLists
-        :param i: int
-        :param match_set_el: Classifier
-        :return: new size of classifiers
+        Parameters
+        ----------
+        reliable_classifiers: Model
+            environmental model
+        frontier: List[Perception]
+            perceptions reached in the previous step
+
+        Returns
+        -------
+        Tuple[Optional[list], List[Perception]]
+            action sequence (if the search is over) and the perceptions
+            reached in this step
         """
-        if i > 0:
-            new_classifiers = ClassifiersList()
-            new_classifiers.extend(classifiers_lists[i - 1])
-        else:
-            new_classifiers = ClassifiersList()
-        new_classifiers.append(match_set_el)
-        return new_classifiers
-
-    def _form_sequence_forwards(self, i: int,
-                                backward_sequence_idx: int,
-                                match_set_el: Classifier) -> list:
+        forward, backward = self.forward_parents, self.backward_parents
+        new_frontier = []
+
+        for perception in frontier:
+            for cl, anticipation in self._transitions_backward(
+                    reliable_classifiers, perception):
+                if anticipation in backward:
+                    continue
+
+                if anticipation in forward:
+                    # sequence found
+                    return self._path_forwards(anticipation) + [cl.action] + \
+                        self._path_backwards(perception), new_frontier
+
+                backward[anticipation] = (perception, cl.action)
+                new_frontier.append(anticipation)
+
+                if len(backward) > MAX_VISITED:
+                    return [], new_frontier
+
+        return None, new_frontier
+
+    def _path_forwards(self, perception: Perception) -> list:
         """
-        Forms sequence when it was found forwards.
-        :param i:
-        :param backward_sequence_idx:
-        :param match_set_el: Classifier
-        :return: act sequence
+        Returns
+        -------
+        list
+            actions leading from the start to the perception
         """
-        # count sequence size
-        sequence_size = 0
-        if i > 0:
-            sequence_size += len(self.forward_classifiers[i - 1])
-        if backward_sequence_idx > 0:
-            sequence_size += len(self.backward_classifiers[
-                                 backward_sequence_idx - 1])
-        sequence_size += 1
-
-        # construct sequence
-        act_seq: list = [-1] * sequence_size
-        j = 0
-        if i > 0:
-            for j, cl in enumerate(self.forward_classifiers[i - 1]):
-                act_seq[len(self.forward_classifiers[i - 1]) - j - 1] \
-                    = cl.action
-            j += 1
-
-        act_seq[j] = match_set_el.action
-        j += 1
-        if backward_sequence_idx > 0:
-            for k, cl in enumerate(self.backward_classifiers[
-                                   backward_sequence_idx - 1]):
-                act_seq[k + j] = cl.action
-        return act_seq
-
-    def _form_sequence_backwards(self, i: int,
-                                 forward_sequence_idx: int,
-                                 match_set_el: Classifier) -> list:
+        actions = []
+        parent = self.forward_parents[perception]
+        while parent is not None:
+            perception, action = parent
+            actions.append(action)
+            parent = self.forward_parents[perception]
+
+        actions.reverse()
+        return actions
+
+    def _path_backwards(self, perception: Perception) -> list:
         """
-        Forms sequence when it was found backwards.
-        :param i: int
-        :param forward_sequence_idx: int
-        :param match_set_el: Classifier
-        :return: act sequence
+        Returns
+        -------
+        list
+            actions leading from the perception to the goal
         """
-        # count sequence size
-        sequence_size = 0
-        if i > 0:
-            sequence_size += len(self.backward_classifiers[i - 1])
-        if forward_sequence_idx > 0:
-            sequence_size += len(
-                self.forward_classifiers[forward_sequence_idx - 1])
-        sequence_size += 1
-
-        # construct sequence
-        act_seq: list = [-1] * sequence_size
-        j = 0
-        if forward_sequence_idx > 0:
-            for j, cl in enumerate(self.forward_classifiers[
-                                   forward_sequence_idx - 1]):
-                act_seq[len(self.forward_classifiers[
-                            forward_sequence_idx - 1]) - j - 1] = cl.action
-            j += 1
-        act_seq[j] = match_set_el.action
-        j += 1
-        if i > 0:
-            for k, cl in enumerate(self.backward_classifiers[i - 1]):
-                act_seq[k + j] = cl.action
-        return act_seq
+        actions = []
+        parent = self.backward_parents[perception]
+        while parent is not None:
+            perception, action = parent
+            actions.append(action)
+            parent = self.backward_parents[perception]
+
+        return actions
 
     @staticmethod
-    def get_state_idx(perceptions: List[Perception],
-                      state: Perception) -> Optional[int]:
-        """
-        Returns the position of state in list of perception.
+    def _transitions_forward(model: Model,
+                             perception: Perception) -> List[Transition]:
+        if isinstance(model, TransitionGraph):
+            return model.forward(perception)
 
-        Parameters
-        ----------
-        perceptions: List[Perception]
-            list of perceptions
-        state: Perception
-            sought perception
+        return [(cl, cl.get_best_anticipation(perception))
+                for cl in model.form_match_set(perception)]
 
-        Returns
-        -------
-        Optional[int]
-            Position of perception, None if perception was not found
-        """
-        try:
-            return perceptions.index(state)
-        except ValueError:
-            return None
+    @staticmethod
+    def _transitions_backward(model: Model,
+                              perception: Perception) -> List[Transition]:
+        if isinstance(model, TransitionGraph):
+            return model.backward(perception)
+
+        transitions = []
+        for cl in model.form_match_set_backwards(perception):
+            anticipation = cl.get_backwards_anticipation(perception)
+            # Backwards anticipation might be impossible to form
+            if anticipation is not None:
+                transitions.append((cl, anticipation))
+        return transitions
@@ -0,0 +1,258 @@
+from bisect import bisect_left
+from typing import Dict, List, Optional, Set, Tuple
+
+from lcs import Perception
+from lcs.agents import ActionPartitionedList
+from lcs.agents.acs2 import Classifier, ClassifiersList, \
+    ProbabilityEnhancedAttribute
+
+# Classifier advocating the transition and the anticipated perception
+Transition = Tuple[Classifier, Perception]
+
+
+class TransitionGraph:
+    """
+    Environmental model used by the action planning, cached between
+    the searches (see `search_goal_sequence`).
+
+    Nodes are interned perceptions, edges are transitions predicted by
+    reliable classifiers (labelled with the classifier, hence its action).
+    Edges leaving the node (forward) and leading to it (backward) are
+    derived on first use and kept, so repeated searches do not scan
+    the model.
+
+    The graph is brought up to date with `update` before each search.
+    The population is not scanned - only classifiers appended, removed
+    or refreshed since the previous update are examined (see
+    `ActionPartitionedList.changes_since` and `refreshed_since`), so
+    classifiers modified in place must be reported with `refresh`.
+    Classifiers which became reliable (or were modified) invalidate only
+    the nodes they match, the ones which lost reliability (or were
+    deleted) only the nodes they contributed to.
+
+    Only `max_size` nodes are kept, the graph is cleared when it grows
+    larger.
+    """
+
+    def __init__(self, max_size: int = 10000) -> None:
+        self.max_size = max_size
+        self._reliable: List[Classifier] = []
+        self._order: List[int] = []
+        self._keys: Dict[int, Tuple[Classifier, tuple, int]] = {}
+        self._stamps: Dict[int, int] = {}
+        self._next_stamp = 0
+        self._population: Optional[ClassifiersList] = None
+        self._generation = 0
+        self._mark = 0
+        self._nodes: Dict[Perception, Perception] = {}
+        self._forward: Dict[Perception, List[Transition]] = {}
+        self._backward: Dict[Perception, List[Transition]] = {}
+        self._sources: Dict[int, Set[Perception]] = {}
+
+    def __len__(self) -> int:
+        """
+        Returns
+        -------
+        int
+            number of reliable classifiers forming the model
+        """
+        return len(self._reliable)
+
+    def update(self, classifiers: ClassifiersList) -> None:
+        """
+        Synchronizes the model with the reliable classifiers from the list.
+
+        Parameters
+        ----------
+        classifiers: ClassifiersList
+            population of classifiers
+        """
+        changes, refreshed = None, None
+        if classifiers is self._population:
+            changes = classifiers.changes_since(self._generation)
+            refreshed = classifiers.refreshed_since(self._mark)
+
+        if changes is None or refreshed is None:
+            self._rebuild(classifiers)
+        else:
+            self._apply(changes, refreshed)
+
+        if self._population is not None:
+            self._generation = self._population.checkpoint()
+            self._mark = self._population.refresh_mark()
+
+    def forward(self, perception: Perception) -> List[Transition]:
+        """
+        Transitions leading from the perception - best anticipations of
+        matching reliable classifiers (see `ClassifiersList.form_match_set`).
+
+        Parameters
+        ----------
+        perception: Perception
+            current perception
+
+        Returns
+        -------
+        List[Transition]
+            classifiers and anticipated (interned) perceptions
+        """
+        transitions = self._forward.get(perception)
+        if transitions is None:
+            transitions = [(cl, self.node(cl.get_best_anticipation(
+                perception))) for cl in self._reliable
+                if cl.does_match(perception)]
+            self._store(self._forward, perception, transitions)
+
+        return transitions
+
+    def backward(self, perception: Perception) -> List[Transition]:
+        """
+        Transitions leading to the perception - backwards anticipations of
+        reliable classifiers matching it backwards
+        (see `ClassifiersList.form_match_set_backwards`).
+
+        Parameters
+        ----------
+        perception: Perception
+            anticipated perception
+
+        Returns
+        -------
+        List[Transition]
+            classifiers and previous (interned) perceptions
+        """
+        transitions = self._backward.get(perception)
+        if transitions is None:
+            transitions = []
+            for cl in self._reliable:
+                if cl.does_match_backwards(perception):
+                    anticipation = cl.get_backwards_anticipation(perception)
+                    if anticipation is not None:
+                        transitions.append((cl, self.node(anticipation)))
+            self._store(self._backward, perception, transitions)
+
+        return transitions
+
+    def node(self, perception: Perception) -> Perception:
+        """
+        Returns
+        -------
+        Perception
+            canonical object of the perception within the graph
+        """
+        return self._nodes.setdefault(perception, perception)
+
+    def clear(self) -> None:
+        self._nodes.clear()
+        self._forward.clear()
+        self._backward.clear()
+        self._sources.clear()
+
+    def _rebuild(self, classifiers: ClassifiersList) -> None:
+        self.clear()
+
+        # Classifiers are ordered as in the population
+        self._stamps = {id(cl): stamp for stamp, cl in enumerate(classifiers)}
+        self._next_stamp = len(classifiers)
+
+        self._reliable, self._order, self._keys = [], [], {}
+        for stamp, cl in enumerate(classifiers):
+            if cl.is_reliable():
+                self._insert(cl, self._key(cl), stamp)
+
+        # Modifications are tracked only if each classifier occurs once
+        tracked = isinstance(classifiers, ActionPartitionedList) \
+            and len(self._stamps) == len(classifiers)
+        self._population = classifiers if tracked else None
+
+    def _apply(self, changes, refreshed: List[Classifier]) -> None:
+        touched: Dict[int, Classifier] = {}
+
+        for appended, cl in changes:
+            if appended:
+                if id(cl) in self._stamps:
+                    self._rebuild(self._population)
+                    return
+
+                self._stamps[id(cl)] = self._next_stamp
+                self._next_stamp += 1
+            else:
+                self._stamps.pop(id(cl), None)
+
+            touched[id(cl)] = cl
+
+        for cl in refreshed:
+            touched.setdefault(id(cl), cl)
+
+        fresh, stale = [], []
+        for cl in touched.values():
+            stamp = self._stamps.get(id(cl))
+            key = self._key(cl) \
+                if stamp is not None and cl.is_reliable() else None
+
+            old = self._keys.get(id(cl))
+            if old is not None:
+                if old[1] == key and old[2] == stamp:
+                    continue
+
+                self._discard(cl, old[2])
+                stale.append(cl)
+
+            if key is not None:
+                self._insert(cl, key, stamp)
+                fresh.append(cl)
+
+        if len(fresh) > len(self._reliable) // 2:
+            self.clear()
+            return
+
+        for cl in stale:
+            for node in self._sources.pop(id(cl), ()):
+                self._invalidate(node)
+
+        for cl in fresh:
+            self._sources.pop(id(cl), None)
+            for node in [n for n in self._forward if cl.does_match(n)]:
+                self._invalidate(node)
+            for node in [n for n in self._backward
+                         if cl.does_match_backwards(n)]:
+                self._invalidate(node)
+
+    def _insert(self, cl: Classifier, key: tuple, stamp: int) -> None:
+        idx = bisect_left(self._order, stamp)
+        self._order.insert(idx, stamp)
+        self._reliable.insert(idx, cl)
+        self._keys[id(cl)] = (cl, key, stamp)
+
+    def _discard(self, cl: Classifier, stamp: int) -> None:
+        idx = bisect_left(self._order, stamp)
+        del self._order[idx]
+        del self._reliable[idx]
+        del self._keys[id(cl)]
+
+    @staticmethod
+    def _key(cl: Classifier) -> tuple:
+        """
+        Snapshot of the classifier parts determining its transitions.
+        Enhanced effect attributes are copied (they are updated in place).
+        """
+        effect = tuple(tuple(sorted(e.items()))
+                       if isinstance(e, ProbabilityEnhancedAttribute) else e
+                       for e in cl.effect)
+        return tuple(cl.condition), cl.action, effect
+
+    def _store(self,
+               edges: Dict[Perception, List[Transition]],
+               perception: Perception,
+               transitions: List[Transition]) -> None:
+        if len(self._nodes) > self.max_size:
+            self.clear()
+
+        perception = self.node(perception)
+        edges[perception] = transitions
+        for cl, _ in transitions:
+            self._sources.setdefault(id(cl), set()).add(perception)
+
+    def _invalidate(self, node: Perception) -> None:
+        self._forward.pop(node, None)
+        self._backward.pop(node, None)
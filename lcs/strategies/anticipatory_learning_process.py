@@ -1,7 +1,9 @@
+from lcs.agents import ActionPartitionedList
 from lcs.strategies.subsumption import does_subsume
 
 
-def add_classifier(child, population, new_list, theta_exp: int) -> None:
+def add_classifier(child, population, new_list, theta_exp: int,
+                   others=()) -> None:
     """
     Looks for subsuming / similar classifiers in the population of classifiers
     and those created in the current ALP run (`new_list`).
@@ -19,6 +21,9 @@ def add_classifier(child, population, new_list, theta_exp: int) -> None:
         A list of newly created classifiers in this ALP run
     theta_exp: int
         experience threshold for subsumption
+    others:
+        other lists containing the examined classifiers (i.e. the whole
+        population), notified when the quality is increased
     """
     # TODO: p0: write tests
     old_cl = None
@@ -31,17 +36,25 @@ def add_classifier(child, population, new_list, theta_exp: int) -> None:
 
     # Check if any similar classifier was in this ALP run
     if old_cl is None:
-        for cl in new_list:
-            if cl == child:
-                old_cl = cl
+        old_cl = _find_last_similar(child, new_list)
 
     # Check if there is similar classifier already
     if old_cl is None:
-        for cl in population:
-            if cl == child:
-                old_cl = cl
+        old_cl = _find_last_similar(child, population)
 
     if old_cl is None:
         new_list.append(child)
     else:
         old_cl.increase_quality()
+        for lst in [population, new_list, *others]:
+            if isinstance(lst, ActionPartitionedList):
+                lst.refresh(old_cl)
+
+
+def _find_last_similar(child, classifiers):
+    if isinstance(classifiers, ActionPartitionedList):
+        similar = classifiers.find_similar(child)
+    else:
+        similar = [cl for cl in classifiers if cl == child]
+
+    return similar[-1] if similar else None
@@ -1,11 +1,15 @@
 import random
-from typing import Callable, Dict
+from typing import Callable
 
 import numpy as np
 
 from lcs import Perception
+from lcs.agents import ActionPartitionedList
 from lcs.strategies.subsumption import find_subsumers
 
+# Probability of considering each micro-classifier for deletion
+DELETION_PROBABILITY = .3
+
 
 def should_apply(action_set, time: int, theta_ga: int) -> bool:
     """
@@ -67,23 +71,43 @@ def roulette_wheel_selection(population, fitnessfunc: Callable):
     Select two objects from population according
     to roulette-wheel selection.
 
+    Fitness values are accumulated once into a cumulative array, both
+    parents are then located in it with a binary search.
+
     Parameters
     ----------
     population
         population of classifiers
     fitnessfunc: Callable
         function evaluating fitness for each classifier. Very often cl.q^3
+
     Returns
     -------
     tuple
-        two classifiers selected as parents
+        two classifiers selected as parents, (None, None) for an empty
+        population
     """
-    choices = {cl: fitnessfunc(cl) for cl in population}
+    population = list(population)
+
+    if len(population) == 0:
+        return None, None
+
+    fitness = np.fromiter((fitnessfunc(cl) for cl in population),
+                          dtype=np.float64, count=len(population))
+
+    cumulative = np.cumsum(fitness)
+    total = cumulative[-1]
 
-    parent1 = _weighted_random_choice(choices)
-    parent2 = _weighted_random_choice(choices)
+    if total > 0:
+        picks = [random.uniform(0, total), random.uniform(0, total)]
+        idx = np.searchsorted(cumulative, picks, side='right')
+        # Rounding errors might point past the last classifier
+        parent1, parent2 = np.minimum(idx, len(population) - 1)
+    else:
+        parent1, parent2 = (random.randrange(len(population))
+                            for _ in range(2))
 
-    return parent1, parent2
+    return population[parent1], population[parent2]
 
 
 def generalizing_mutation(cl, mu: float) -> None:
@@ -92,9 +116,11 @@ def generalizing_mutation(cl, mu: float) -> None:
     Specified attributes in classifier conditions are randomly
     generalized with `mu` probability.
     """
-    for idx, cond in enumerate(cl.condition):
-        if cond != cl.cfg.classifier_wildcard and random.random() < mu:
-            cl.condition.generalize(idx)
+    wildcard = cl.cfg.classifier_wildcard
+    positions = [idx for idx, cond in enumerate(cl.condition)
+                 if cond != wildcard and random.random() < mu]
+
+    cl.condition.update((idx, wildcard) for idx in positions)
 
 
 def two_point_crossover(parent, donor) -> None:
@@ -119,9 +145,8 @@ def two_point_crossover(parent, donor) -> None:
     chromosome2 = donor.condition[left:right]
 
     # Flip them
-    for idx, el in enumerate(range(left, right)):
-        parent.condition[el] = chromosome2[idx]
-        donor.condition[el] = chromosome1[idx]
+    parent.condition.update(zip(range(left, right), chromosome2))
+    donor.condition.update(zip(range(left, right), chromosome1))
 
 
 def add_classifier(cl, p: Perception,
@@ -149,7 +174,14 @@ def add_classifier(cl, p: Perception,
     theta_exp: int
         subsumption experience threshold
     """
-    old_cl = _find_old_classifier(action_set, cl, do_subsumption, theta_exp)
+    if isinstance(population, ActionPartitionedList):
+        # Look up the persistent indexes of the population (the action set
+        # is formed anew in every step)
+        old_cl = _find_old_classifier(population, cl, do_subsumption,
+                                      theta_exp, within=action_set)
+    else:
+        old_cl = _find_old_classifier(action_set, cl, do_subsumption,
+                                      theta_exp)
 
     if old_cl is None:
         population.append(cl)
@@ -159,6 +191,7 @@ def add_classifier(cl, p: Perception,
     else:
         if not old_cl.is_marked():
             old_cl.num += 1
+            _refresh(old_cl, population, match_set, action_set)
 
 
 def delete_classifiers(population, match_set, action_set,
@@ -166,6 +199,14 @@ def delete_classifiers(population, match_set, action_set,
     """
     Make room for new classifiers
 
+    Each micro-classifier in the action set is considered for deletion with
+    probability `DELETION_PROBABILITY` and the worst of the considered ones
+    (see `_is_preferred_to_delete`) is deleted. Since copies of the same
+    macro-classifier never replace each other, only the macro-classifiers
+    are sampled - each with the probability that at least one of its
+    micro-classifiers is considered. Selection distribution stays the same
+    without expanding the action set.
+
     Parameters
     ----------
     population:
@@ -177,27 +218,58 @@ def delete_classifiers(population, match_set, action_set,
         The action set size threshold (θas ∈ N) specifies
         the maximal number of classifiers in an action set.
     """
-    while (insize + sum(cl.num for cl in action_set)) > theta_as:
-        cl_del = None
-
-        while cl_del is None:  # We must delete at least one
-            for cl in action_set.expand():
-                if random.random() < .3:
-                    if cl_del is None:
-                        cl_del = cl
-                    else:
-                        if _is_preferred_to_delete(cl_del, cl):
-                            cl_del = cl
-
-        if cl_del is not None:
-            if cl_del.num > 1:
-                cl_del.num -= 1
-            else:
-                # Removes classifier from population, match set
-                # and current list
-                lists = [x for x in [population, match_set, action_set] if x]
-                for lst in lists:
-                    lst.safe_remove(cl_del)
+    numerosity = sum(cl.num for cl in action_set)
+
+    while insize + numerosity > theta_as and numerosity > 0:
+        cl_del = _select_for_deletion(action_set)
+
+        if cl_del.num > 1:
+            cl_del.num -= 1
+            _refresh(cl_del, population, match_set, action_set)
+        else:
+            # Removes classifier from population, match set
+            # and current list
+            lists = [x for x in [population, match_set, action_set] if x]
+            for lst in lists:
+                lst.safe_remove(cl_del)
+
+        numerosity -= 1
+
+
+def _select_for_deletion(action_set):
+    """
+    Selects the classifier to be deleted (see `delete_classifiers`).
+
+    Parameters
+    ----------
+    action_set:
+        non-empty action set
+
+    Returns
+    -------
+    Classifier
+        classifier to be deleted
+    """
+    classifiers = [cl for cl in action_set if cl.num > 0]
+    nums = np.fromiter((cl.num for cl in classifiers),
+                       dtype=np.float64, count=len(classifiers))
+
+    # Probability of considering at least one micro-classifier
+    probabilities = 1 - (1 - DELETION_PROBABILITY) ** nums
+
+    # We must delete at least one
+    considered = np.empty(0, dtype=np.int64)
+    while considered.size == 0:
+        draws = np.array([random.random() for _ in classifiers])
+        considered = np.flatnonzero(draws < probabilities)
+
+    cl_del = classifiers[considered[0]]
+    for idx in considered[1:]:
+        cl = classifiers[idx]
+        if _is_preferred_to_delete(cl_del, cl):
+            cl_del = cl
+
+    return cl_del
 
 
 def _is_preferred_to_delete(cl_del, cl) -> bool:
@@ -228,32 +300,76 @@ def _is_preferred_to_delete(cl_del, cl) -> bool:
     return False
 
 
+def _refresh(cl, *lists) -> None:
+    """Notifies indexed lists that `cl` was modified in place"""
+    for lst in lists:
+        if isinstance(lst, ActionPartitionedList):
+            lst.refresh(cl)
+
+
 def _find_old_classifier(population,
                          cl,
                          use_subsumption: bool,
-                         theta_exp: int):
+                         theta_exp: int,
+                         within=None):
+    """
+    Looks for the most general subsumer of `cl`, or the first similar
+    classifier if there is no subsumer.
+
+    Parameters
+    ----------
+    population:
+        classifiers to search
+    cl:
+        newly created classifier
+    use_subsumption: bool
+        look for subsumers
+    theta_exp: int
+        subsumption experience threshold
+    within:
+        if given, only its members are considered (i.e. the action set
+        when the indexed population is searched - subsumers are not
+        required to match the same situations as `cl`)
+
+    Returns
+    -------
+    Optional[Classifier]
+        existing classifier, None if not found
+    """
+    members = None
+
+    def _restrict(cls):
+        nonlocal members
+        if within is None or not cls:
+            return cls
+        if members is None:
+            members = {id(el) for el in within}
+        return [el for el in cls if id(el) in members]
 
     old_cl = None
 
     if use_subsumption:
-        subsumers = find_subsumers(cl, population, theta_exp)
+        if isinstance(population, ActionPartitionedList):
+            subsumers = population.find_subsumers(cl, theta_exp)
+        else:
+            subsumers = find_subsumers(cl, population, theta_exp)
 
         # Try to find most general subsumer
         try:
-            old_cl = subsumers[0]
+            old_cl = _restrict(subsumers)[0]
         except IndexError:
             pass
 
     # If there is no subsumer - look for similar classifiers
     if old_cl is None:
-        old_cl = _find_similar(cl, population)
+        old_cl = next(iter(_restrict(_find_similar(cl, population))), None)
 
     return old_cl
 
 
 def _find_similar(other_cl, population):
     """
-    Searches for the first similar classifier `other` and returns it.
+    Searches for classifiers similar to `other`.
     Similarity is distinguished when both C-A-E triple is the same.
 
     Parameters
@@ -263,19 +379,11 @@ def _find_similar(other_cl, population):
 
     Returns
     -------
-    Optional[Classifier]
-        classifier (with the same condition, action, effect),
-        None otherwise
+    List
+        classifiers (with the same condition, action, effect)
+        in the population order
     """
-    return next(filter(lambda cl: cl == other_cl, population), None)
-
-
-def _weighted_random_choice(choices: Dict):
-    max = sum(choices.values())
-    pick = random.uniform(0, max)
-    current = 0
+    if isinstance(population, ActionPartitionedList):
+        return population.find_similar(other_cl)
 
-    for key, value in choices.items():
-        current += value
-        if current > pick:
-            return key
+    return [cl for cl in population if cl == other_cl]
@@ -0,0 +1,56 @@
+import pytest
+
+from lcs.agents.acs import DiscriminationTree
+
+
+class TestDiscriminationTree:
+
+    @pytest.fixture
+    def tree(self):
+        tree = DiscriminationTree()
+        for key in ['####', '1###', '0###', '11#0', '1101']:
+            tree.add(key, key)
+        return tree
+
+    @pytest.mark.parametrize("_p, _matching", [
+        ('1101', {'####', '1###', '1101'}),
+        ('1100', {'####', '1###', '11#0'}),
+        ('0000', {'####', '0###'}),
+        ('#101', {'####', '1###', '0###', '1101'}),
+    ])
+    def test_should_query(self, tree, _p, _matching):
+        assert set(tree.query(_p)) == _matching
+
+    def test_should_keep_items_with_the_same_key(self, tree):
+        # when
+        tree.add('1###', 'other')
+
+        # then
+        assert len(tree) == 6
+        assert {'1###', 'other'} <= set(tree.query('1000'))
+
+    def test_should_remove(self, tree):
+        # when
+        removed = tree.remove('11#0', '11#0')
+
+        # then
+        assert removed is True
+        assert len(tree) == 4
+        assert set(tree.query('1100')) == {'####', '1###'}
+
+    def test_should_not_remove_missing_item(self, tree):
+        assert tree.remove('11#0', 'other') is False
+        assert tree.remove('0000', '0000') is False
+        assert len(tree) == 5
+
+    def test_should_prune_empty_branches(self):
+        # given
+        tree = DiscriminationTree()
+        tree.add('10', 'a')
+
+        # when
+        tree.remove('10', 'a')
+
+        # then
+        assert len(tree) == 0
+        assert tree._root == {}
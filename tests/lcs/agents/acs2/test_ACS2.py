@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from lcs.agents.acs2 import ACS2, Configuration
+
+
+class TestACS2:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(
+            classifier_length=2,
+            number_of_possible_actions=2,
+            do_action_planning=True,
+            action_planning_frequency=3,
+            theta_r=0.7,
+            theta_exp=3,
+            u_max=2,
+            theta_ga=10)
+
+    def test_should_explore_with_action_planning(self, cfg):
+        # given
+        random.seed(42)
+        env = SwitchesEnvMock()
+        agent = ACS2(cfg)
+
+        # when
+        metrics = agent.explore(env, 50)
+
+        # then
+        assert len(metrics) == 50
+        assert env.goals_provided > 0
+
+
+class SwitchesEnvMock:
+    """
+    Two switches, each action toggles one of them. Observations
+    are raw lists, goals are requested every other time.
+    """
+
+    def __init__(self, trial_length=10):
+        self.env = self
+        self.action_space = ActionSpaceMock()
+        self.trial_length = trial_length
+        self.goals_provided = 0
+        self._state = ['0', '0']
+        self._steps = 0
+        self._goal_requests = 0
+
+    def reset(self):
+        self._state = ['0', '0']
+        self._steps = 0
+        return list(self._state)
+
+    def step(self, action):
+        self._state[action] = '1' if self._state[action] == '0' else '0'
+        self._steps += 1
+        return list(self._state), 0, self._steps >= self.trial_length, None
+
+    def get_goal_state(self):
+        self._goal_requests += 1
+        if self._goal_requests % 2 == 0:
+            return None
+
+        self.goals_provided += 1
+        return ['1', '1'] if self._state != ['1', '1'] else ['0', '0']
+
+
+class ActionSpaceMock:
+    def sample(self):
+        return random.randrange(2)
@@ -2,7 +2,7 @@ import pytest
 
 from lcs import Perception
 from lcs.agents.acs2 import Configuration, ClassifiersList, \
-    Classifier
+    Classifier, ProbabilityEnhancedAttribute
 
 
 class TestClassifierList:
@@ -150,3 +150,28 @@ class TestClassifierList:
         assert 2 == len(match_set)
         assert c1 in match_set
         assert c2 in match_set
+
+    def test_should_find_similar_enhanced_classifiers(self, cfg):
+        # given
+        cl_1 = Classifier(condition='1#######', effect='0#######', cfg=cfg)
+        cl_2 = Classifier(condition='1#######', effect='0#######', cfg=cfg)
+        cl_1.effect[1] = ProbabilityEnhancedAttribute({'1': 0.8, '0': 0.2})
+        cl_2.effect[1] = ProbabilityEnhancedAttribute({'1': 0.3, '0': 0.7})
+        population = ClassifiersList(cl_1)
+
+        # then
+        assert population.find_similar(cl_2) == [cl_1]
+
+    def test_should_find_similar_after_refresh(self, cfg):
+        # given
+        cl_1 = Classifier(condition='11######', cfg=cfg)
+        cl_2 = Classifier(condition='1#######', cfg=cfg)
+        population = ClassifiersList(cl_1)
+        assert population.find_similar(cl_2) == []
+
+        # when
+        cl_1.condition.generalize(1)
+        population.refresh(cl_1)
+
+        # then
+        assert population.find_similar(cl_2) == [cl_1]
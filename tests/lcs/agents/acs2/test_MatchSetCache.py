@@ -0,0 +1,144 @@
+import random
+
+import pytest
+
+from lcs import Perception
+from lcs.agents.acs2 import Configuration, Classifier, ClassifiersList, \
+    MatchSetCache, TreeIndexedClassifiersList, VectorizedClassifiersList
+
+
+class TestMatchSetCache:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(
+            classifier_length=4,
+            number_of_possible_actions=4)
+
+    def test_should_reuse_match_set(self, cfg):
+        # given
+        cl_1 = Classifier(condition='1###', cfg=cfg)
+        cl_2 = Classifier(condition='0###', cfg=cfg)
+        population = ClassifiersList(cl_1, cl_2)
+        match_sets = MatchSetCache()
+        p = Perception('1111')
+
+        # when
+        match_set_1 = match_sets(population, p)
+        match_set_1.append(cl_2)
+        match_set_2 = match_sets(population, p)
+
+        # then
+        assert type(match_set_2) is ClassifiersList
+        assert list(match_set_2) == [cl_1]
+        assert match_sets.misses == 1
+        assert match_sets.hits == 1
+
+    def test_should_patch_match_set(self, cfg):
+        # given
+        cl_1 = Classifier(condition='1###', cfg=cfg)
+        cl_2 = Classifier(condition='11##', cfg=cfg)
+        cl_3 = Classifier(condition='0###', cfg=cfg)
+        others = [Classifier(condition='00##', cfg=cfg) for _ in range(3)]
+        population = ClassifiersList(cl_1, *others)
+        match_sets = MatchSetCache()
+        p = Perception('1111')
+        match_sets(population, p)
+
+        # when
+        population.append(cl_2)
+        population.append(cl_3)
+        population.remove(cl_1)
+
+        # then
+        assert list(match_sets(population, p)) == [cl_2]
+        assert match_sets.patches == 1
+        assert match_sets.misses == 1
+
+    def test_should_recompute_after_condition_changed(self, cfg):
+        # given
+        cl = Classifier(condition='0###', cfg=cfg)
+        population = ClassifiersList(cl)
+        match_sets = MatchSetCache()
+        p = Perception('1111')
+        assert len(match_sets(population, p)) == 0
+
+        # when
+        cl.condition.generalize(0)
+        population.refresh(cl)
+
+        # then
+        assert list(match_sets(population, p)) == [cl]
+        assert match_sets.misses == 2
+
+    def test_should_not_cache_when_disabled(self, cfg):
+        # given
+        population = ClassifiersList(Classifier(cfg=cfg))
+        match_sets = MatchSetCache(max_size=0)
+
+        # when
+        match_sets(population, Perception('1111'))
+        match_sets(population, Perception('1111'))
+
+        # then
+        assert len(match_sets) == 0
+        assert match_sets.hits == 0
+
+    @pytest.mark.parametrize('_population', [
+        ClassifiersList, TreeIndexedClassifiersList])
+    def test_should_match_the_same_as_population(self, _population, cfg):
+        # given
+        random.seed(42)
+
+        def random_cl():
+            cond = ''.join(random.choice('01#') for _ in range(4))
+            return Classifier(condition=cond, cfg=cfg)
+
+        population = _population()
+        match_sets = MatchSetCache(max_size=8)
+        perceptions = [Perception(format(i, '04b')) for i in range(16)]
+
+        # when
+        for _ in range(1000):
+            r = random.random()
+            if r < 0.4 or len(population) == 0:
+                population.append(random_cl())
+            elif r < 0.7:
+                population.remove(random.choice(population))
+            elif r < 0.72:
+                cl = random.choice(population)
+                cl.condition.generalize(random.randrange(4))
+                population.refresh(cl)
+
+            p = random.choice(perceptions)
+
+            # then
+            assert list(match_sets(population, p)) == \
+                list(population.form_match_set(p))
+
+        assert match_sets.hits > 0
+        assert match_sets.patches > 0
+
+    @pytest.mark.parametrize('_population', [
+        ClassifiersList, VectorizedClassifiersList,
+        TreeIndexedClassifiersList])
+    def test_should_prefetch_match_sets(self, _population, cfg):
+        # given
+        random.seed(42)
+        population = _population(*[
+            Classifier(condition=''.join(random.choice('01#')
+                                         for _ in range(4)), cfg=cfg)
+            for _ in range(50)])
+        match_sets = MatchSetCache()
+        perceptions = [Perception(format(i, '04b')) for i in range(16)]
+        match_sets(population, perceptions[0])
+
+        # when
+        match_sets.prefetch(population, perceptions + perceptions)
+
+        # then
+        assert match_sets.misses == 16
+        for p in perceptions:
+            assert list(match_sets(population, p)) == \
+                list(population.form_match_set(p))
+        assert match_sets.hits == 16
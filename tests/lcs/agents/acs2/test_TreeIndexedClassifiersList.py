@@ -0,0 +1,120 @@
+import random
+
+import pytest
+
+from lcs import Perception
+from lcs.agents.acs2 import Configuration, Classifier, ClassifiersList, \
+    TreeIndexedClassifiersList, ProbabilityEnhancedAttribute
+
+
+class TestTreeIndexedClassifiersList:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(
+            classifier_length=8,
+            number_of_possible_actions=4)
+
+    def test_should_form_match_set(self, cfg):
+        # given
+        cl_1 = Classifier(cfg=cfg)
+        cl_2 = Classifier(condition='1###0###', cfg=cfg)
+        cl_3 = Classifier(condition='0###1###', cfg=cfg)
+        population = TreeIndexedClassifiersList(cl_1, cl_2, cl_3)
+
+        # when
+        match_set = population.form_match_set(Perception('11110000'))
+
+        # then
+        assert type(match_set) is ClassifiersList
+        assert list(match_set) == [cl_1, cl_2]
+
+    def test_should_form_match_set_backwards(self, cfg):
+        # given
+        c1 = Classifier(cfg=cfg)
+        c2 = Classifier(condition='0##0####', effect='1##1####', cfg=cfg)
+        c3 = Classifier(condition='0###1###', effect='1######0', cfg=cfg)
+        c4 = Classifier(condition='0###0###', effect='1###1###', cfg=cfg)
+        population = TreeIndexedClassifiersList(c1, c2, c3, c4)
+
+        # when
+        match_set = population.form_match_set_backwards(
+            Perception('11110000'))
+
+        # then
+        assert list(match_set) == [c1, c2]
+
+    def test_should_not_match_enhanced_effect_backwards(self, cfg):
+        # given
+        pee = ProbabilityEnhancedAttribute({'1': 0.5, '0': 0.5})
+        cl = Classifier(effect=[pee] + ['#'] * 7, cfg=cfg)
+        population = TreeIndexedClassifiersList(cl)
+
+        # then
+        assert len(population.form_match_set_backwards(
+            Perception('11110000'))) == 0
+
+    def test_should_refresh_condition_modified_in_place(self, cfg):
+        # given
+        cl = Classifier(condition='0#######', cfg=cfg)
+        population = TreeIndexedClassifiersList(cl)
+        p = Perception('11111111')
+
+        # when
+        cl.condition.generalize(0)
+        population.refresh(cl)
+
+        # then
+        assert list(population.form_match_set(p)) == [cl]
+
+    def test_should_keep_population_order(self, cfg):
+        # given
+        cl_1 = Classifier(condition='1#######', cfg=cfg)
+        cl_2 = Classifier(condition='11######', cfg=cfg)
+        cl_3 = Classifier(condition='111#####', cfg=cfg)
+        population = TreeIndexedClassifiersList(cl_1, cl_3)
+        p = Perception('11111111')
+
+        # when
+        population.insert(1, cl_2)
+
+        # then
+        assert list(population.form_match_set(p)) == [cl_1, cl_2, cl_3]
+
+        # when
+        population[0] = cl_3
+        del population[-1]
+
+        # then
+        assert list(population.form_match_set(p)) == [cl_3, cl_2]
+
+    def test_should_match_the_same_as_plain_list(self, cfg):
+        # given
+        random.seed(42)
+
+        def random_cl():
+            cond = ''.join(random.choice('01#') for _ in range(8))
+            effect = ''.join(random.choice('01##') for _ in range(8))
+            return Classifier(condition=cond, effect=effect,
+                              action=random.randrange(4), cfg=cfg)
+
+        indexed = TreeIndexedClassifiersList()
+        plain = ClassifiersList()
+
+        for _ in range(300):
+            cl = random_cl()
+            indexed.append(cl)
+            plain.append(cl)
+
+        for _ in range(100):
+            cl = random.choice(plain)
+            indexed.safe_remove(cl)
+            plain.safe_remove(cl)
+
+        # then
+        for _ in range(50):
+            p = Perception([random.choice('01') for _ in range(8)])
+            assert list(indexed.form_match_set(p)) == \
+                list(plain.form_match_set(p))
+            assert list(indexed.form_match_set_backwards(p)) == \
+                list(plain.form_match_set_backwards(p))
@@ -0,0 +1,116 @@
+import random
+
+import pytest
+
+from lcs import Perception
+from lcs.agents.acs2 import Configuration, Classifier, ClassifiersList, \
+    VectorizedClassifiersList
+
+
+class TestVectorizedClassifiersList:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(
+            classifier_length=8,
+            number_of_possible_actions=4)
+
+    def test_should_form_match_set(self, cfg):
+        # given
+        cl_1 = Classifier(cfg=cfg)
+        cl_2 = Classifier(condition='1###0###', cfg=cfg)
+        cl_3 = Classifier(condition='0###1###', cfg=cfg)
+        population = VectorizedClassifiersList(*[cl_1, cl_2, cl_3])
+
+        # when
+        match_set = population.form_match_set(Perception('11110000'))
+
+        # then
+        assert type(match_set) is ClassifiersList
+        assert len(match_set) == 2
+        assert cl_1 in match_set
+        assert cl_2 in match_set
+
+    def test_should_not_match_unknown_symbols(self, cfg):
+        # given
+        cl_1 = Classifier(condition='1#######', cfg=cfg)
+        cl_2 = Classifier(condition='#1######', cfg=cfg)
+        population = VectorizedClassifiersList(cl_1, cl_2)
+
+        # when
+        match_set = population.form_match_set(Perception('91111111'))
+
+        # then
+        assert len(match_set) == 1
+        assert cl_2 in match_set
+
+    def test_should_form_empty_match_set_from_empty_population(self):
+        assert len(VectorizedClassifiersList().form_match_set(
+            Perception('11110000'))) == 0
+
+    def test_should_stay_in_sync_when_modified(self, cfg):
+        # given
+        population = VectorizedClassifiersList()
+        cl_1 = Classifier(condition='1#######', cfg=cfg)
+        cl_2 = Classifier(condition='11######', cfg=cfg)
+        cl_3 = Classifier(condition='111#####', cfg=cfg)
+        p = Perception('11111111')
+
+        # when
+        population.append(cl_1)
+        population.insert(0, cl_2)
+        population.append(cl_3)
+        population.safe_remove(cl_2)
+
+        # then
+        assert list(population.form_match_set(p)) == [cl_1, cl_3]
+
+        # when
+        population[0] = cl_2
+        del population[-1]
+
+        # then
+        assert list(population.form_match_set(p)) == [cl_2]
+
+    def test_should_refresh_condition_modified_in_place(self, cfg):
+        # given
+        cl = Classifier(condition='0#######', cfg=cfg)
+        population = VectorizedClassifiersList(cl)
+        p = Perception('11111111')
+        assert len(population.form_match_set(p)) == 0
+
+        # when
+        cl.condition.generalize(0)
+        population.refresh(cl)
+
+        # then
+        assert len(population.form_match_set(p)) == 1
+
+    def test_should_match_the_same_as_plain_list(self, cfg):
+        # given
+        random.seed(42)
+
+        def random_cl():
+            cond = ''.join(random.choice('01#') for _ in range(8))
+            return Classifier(condition=cond,
+                              action=random.randrange(4),
+                              cfg=cfg)
+
+        vectorized = VectorizedClassifiersList()
+        plain = ClassifiersList()
+
+        for _ in range(300):
+            cl = random_cl()
+            vectorized.append(cl)
+            plain.append(cl)
+
+        for _ in range(100):
+            cl = random.choice(plain)
+            vectorized.safe_remove(cl)
+            plain.safe_remove(cl)
+
+        # then
+        for _ in range(50):
+            p = Perception([random.choice('01') for _ in range(8)])
+            assert list(vectorized.form_match_set(p)) == \
+                list(plain.form_match_set(p))
@@ -39,6 +39,51 @@ class TestACS2ER:
         assert len(agent.get_population()) > 0
         assert len(agent.replay_memory) == 100
 
+    def test_explore_with_batch_replay(self, cfg):
+        # Arrange
+        steps = []
+        env = EnvMock(steps, 3)
+        cfg.er_batch_replay = True
+        cfg.er_samples_number = 8
+        agent = ACS2ER(cfg)
+
+        # Act
+        _ = agent.explore(env, 50)
+
+        # Assert
+        assert len(agent.get_population()) > 0
+        assert agent.match_sets.hits > 0
+
+    def test_explore_with_deduplicated_transitions(self, cfg):
+        # Arrange
+        steps = []
+        env = EnvMock(steps, 3)
+        cfg.er_deduplicate = True
+        agent = ACS2ER(cfg)
+
+        # Act
+        _ = agent.explore(env, 50)
+
+        # Assert
+        assert len(agent.get_population()) > 0
+        assert len(agent.replay_memory) < 100
+        assert agent.replay_memory.observations == 150
+
+    def test_explore_with_prioritized_replay(self, cfg):
+        # Arrange
+        steps = []
+        env = EnvMock(steps, 3)
+        cfg.er_prioritized = True
+        agent = ACS2ER(cfg)
+
+        # Act
+        _ = agent.explore(env, 50)
+
+        # Assert
+        assert len(agent.get_population()) > 0
+        assert len(agent.replay_memory) == 100
+        assert agent.replay_memory.max_priority >= 1.0
+
 class EnvMock:
     def __init__(self, steps, trial_length):
         self.steps = steps
@@ -0,0 +1,69 @@
+import random
+
+from lcs.Perception import Perception
+
+from lcs.agents.acs2er.PrioritizedReplayMemory import PrioritizedReplayMemory
+from lcs.agents.acs2er.ReplayMemorySample import ReplayMemorySample
+
+
+class TestPrioritizedReplayMemory:
+
+    @staticmethod
+    def _sample(action):
+        return ReplayMemorySample(
+            Perception(['0']), action, 0, Perception(['1']), False)
+
+    def test_should_give_new_samples_max_priority(self):
+        # Arrange
+        rm = PrioritizedReplayMemory(max_size=3)
+        rm.update(self._sample(0))
+        rm.update_priorities([0], [4.0])
+
+        # Act
+        rm.update(self._sample(1))
+
+        # Assert
+        assert rm._priorities[1] == 4.0
+        assert rm._priorities.total == 8.0
+
+    def test_should_draw_samples_proportionally_to_priorities(self):
+        # Arrange
+        random.seed(42)
+        rm = PrioritizedReplayMemory(max_size=4)
+        for action in range(4):
+            rm.update(self._sample(action))
+        rm.update_priorities([0, 1, 2, 3], [0.01, 0.01, 0.01, 10.0])
+
+        # Act
+        drawn = [s.action for _ in range(50) for s in rm.sample(2)]
+
+        # Assert
+        assert drawn.count(3) > 90
+
+    def test_should_overwrite_oldest_sample(self):
+        # Arrange
+        rm = PrioritizedReplayMemory(max_size=2)
+        for action in range(3):
+            rm.update(self._sample(action))
+
+        # Act
+        slots, samples = rm.draw(2)
+
+        # Assert
+        assert [s.action for s in rm] == [1, 2]
+        assert {s.action for s in samples} <= {1, 2}
+        assert set(slots) <= {0, 1}
+
+    def test_should_not_draw_removed_samples(self):
+        # Arrange
+        rm = PrioritizedReplayMemory(max_size=3)
+        for action in range(3):
+            rm.update(self._sample(action))
+
+        # Act
+        del rm[0]
+        rm.pop()
+
+        # Assert
+        assert rm._priorities.total == 1.0
+        assert [s.action for s in rm.sample(3)] == [1, 1, 1]
@@ -1,3 +1,5 @@
+import pytest
+
 from lcs.Perception import Perception
 
 from lcs.agents.acs2er.ReplayMemory import ReplayMemory
@@ -35,3 +37,65 @@ class TestReplayMemory:
         assert rm[0].action == 2
         assert rm[1].action == 3
         assert rm[2].action == 4
+
+    def test_should_store_samples_in_preallocated_buffer(self):
+        # Arrange
+        rm: ReplayMemory = ReplayMemory(max_size=4, perception_length=2)
+        nbytes = rm.nbytes
+
+        # Act
+        for i in range(10):
+            rm.update(ReplayMemorySample(
+                Perception([str(i), '1']), i, i / 2,
+                Perception(['1', str(i)]), i % 2 == 0))
+
+        # Assert
+        assert rm.nbytes == nbytes
+        assert [s.action for s in rm] == [6, 7, 8, 9]
+        assert rm[-1] == ReplayMemorySample(
+            Perception(['9', '1']), 9, 4.5, Perception(['1', '9']), False)
+        assert [s.action for s in rm[1:3]] == [7, 8]
+
+    def test_sample_should_return_distinct_samples(self):
+        # Arrange
+        rm: ReplayMemory = ReplayMemory(max_size=5)
+        for i in range(7):
+            rm.update(ReplayMemorySample(
+                Perception(['0']), i, 0, Perception(['1']), False))
+
+        # Act
+        samples = rm.sample(5)
+
+        # Assert
+        assert sorted(s.action for s in samples) == [2, 3, 4, 5, 6]
+
+    def test_should_keep_mutable_sequence_interface(self):
+        # Arrange
+        rm: ReplayMemory = ReplayMemory(max_size=4)
+        samples = [ReplayMemorySample(
+            Perception(['0']), i, 0, Perception(['1']), False)
+            for i in range(5)]
+
+        # Act
+        rm.extend(samples[:3])
+        rm.append(samples[3])
+        rm[1] = samples[4]
+        oldest = rm.pop(0)
+        newest = rm.pop()
+        rm.safe_remove(samples[0])
+        rm.insert(len(rm), samples[0])
+
+        # Assert
+        assert oldest == samples[0]
+        assert newest == samples[3]
+        assert [s.action for s in rm] == [4, 2, 0]
+
+        with pytest.raises(NotImplementedError):
+            rm.insert(0, samples[1])
+        with pytest.raises(NotImplementedError):
+            del rm[1]
+        with pytest.raises(TypeError):
+            rm.append('sample')
+
+        rm.clear()
+        assert len(rm) == 0
@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from lcs import Perception, PerceptionInterner
+from lcs.agents.acs2er.ReplayMemorySample import ReplayMemorySample
+from lcs.agents.acs2er.TransitionMemory import TransitionMemory
+
+
+class TestTransitionMemory:
+
+    @staticmethod
+    def _sample(action, state='0'):
+        return ReplayMemorySample(
+            Perception([state]), action, 0, Perception(['1']), False)
+
+    def test_should_store_distinct_transitions_once(self):
+        # Arrange
+        tm = TransitionMemory(max_size=5)
+
+        # Act
+        tm.update(self._sample(0))
+        tm.update(self._sample(1))
+        tm.update(self._sample(0))
+
+        # Assert
+        assert len(tm) == 2
+        assert tm.observations == 3
+        assert tm.count(self._sample(0)) == 2
+        assert tm.last_seen(self._sample(0)) == 3
+        assert tm.last_seen(self._sample(1)) == 2
+        assert [s.action for s in tm] == [1, 0]
+
+    def test_should_drop_least_recently_seen_transition(self):
+        # Arrange
+        tm = TransitionMemory(max_size=2)
+
+        # Act
+        tm.update(self._sample(0))
+        tm.update(self._sample(1))
+        tm.update(self._sample(0))
+        tm.update(self._sample(2))
+
+        # Assert
+        assert len(tm) == 2
+        assert self._sample(1) not in tm
+        assert tm.observations == 3
+
+    def test_should_intern_perceptions(self):
+        # Arrange
+        interner = PerceptionInterner()
+        tm = TransitionMemory(max_size=5, perceptions=interner)
+
+        # Act
+        tm.update(self._sample(0))
+        tm.update(self._sample(1))
+
+        # Assert
+        first, second = list(tm)
+        assert first.state is second.state
+        assert first.next_state is interner(['1'])
+
+    @pytest.mark.parametrize("weighting, expected", [
+        ('count', 0), ('recency', 1)])
+    def test_should_draw_weighted_samples(self, weighting, expected):
+        # Arrange
+        random.seed(42)
+        tm = TransitionMemory(max_size=5,
+                              weighting=weighting,
+                              recency_rate=1.0)
+        for _ in range(20):
+            tm.update(self._sample(0))
+        tm.update(self._sample(1))
+
+        # Act
+        drawn = [s.action for s in tm.sample(200)]
+
+        # Assert
+        assert drawn.count(expected) > 100
+
+    def test_should_rebase_recency_weights(self):
+        # Arrange
+        random.seed(42)
+        tm = TransitionMemory(max_size=5,
+                              weighting='recency',
+                              recency_rate=1.0)
+        tm.update(self._sample(0))
+        for _ in range(100):
+            tm.update(self._sample(2))
+        tm.update(self._sample(1))
+
+        # Act
+        drawn = [s.action for s in tm.sample(200)]
+
+        # Assert
+        assert tm.last_seen(self._sample(1)) == 102
+        assert 0 not in drawn
+        assert drawn.count(1) > 100
+
+    def test_should_reject_unknown_weighting(self):
+        with pytest.raises(ValueError):
+            TransitionMemory(max_size=5, weighting='unknown')
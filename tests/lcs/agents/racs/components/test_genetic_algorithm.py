@@ -5,7 +5,8 @@ import pytest
 
 from lcs.agents.racs import Classifier, Configuration, Condition, Effect
 from lcs.agents.racs.components.genetic_algorithm import mutate, crossover, \
-    _flatten, _unflatten
+    _flatten, _unflatten, genome, mutate_genome, crossover_genomes, \
+    specificity, materialize
 from lcs.representations import UBR
 from lcs.representations.RealValueEncoder import RealValueEncoder
 
@@ -125,3 +126,68 @@ class TestGeneticAlgorithm:
     ])
     def test_should_unflatten(self, _flat, _result):
         assert _unflatten(_flat) == _result
+
+    def test_should_create_genome(self, cfg):
+        # given
+        cl = Classifier(
+            condition=Condition([UBR(1, 3), UBR(0, 15)], cfg),
+            effect=Effect([UBR(5, 4), UBR(0, 15)], cfg),
+            cfg=cfg)
+
+        # when
+        g = genome(cl)
+
+        # then
+        assert g.tolist() == [[1, 3, 0, 15], [5, 4, 0, 15]]
+        assert specificity(g, cfg) == 1
+
+    def test_should_mutate_genome_specified_attributes_only(self, cfg):
+        # given
+        cfg.mutation_noise = 0.5
+        g = np.array([[2, 5, 0, 15, 3, 4], [2, 5, 6, 7, 15, 0]])
+        original = g.copy()
+
+        # when
+        mutate_genome(g, cfg, 1.0)
+
+        # then
+        assert (g[:, 2:] == original[:, 2:]).all()
+        assert (g >= 0).all() and (g <= 15).all()
+
+    def test_should_crossover_genomes_in_place(self, cfg):
+        # given
+        p_genome = np.ones((2, 6), dtype=np.int64)
+        d_genome = np.full((2, 6), 2, dtype=np.int64)
+
+        # when
+        np.random.seed(12345)  # left: 3, right: 6
+        left, right = crossover_genomes(p_genome, d_genome)
+
+        # then
+        assert (left, right) == (3, 6)
+        assert p_genome.tolist() == [[1, 1, 1, 2, 2, 2]] * 2
+        assert d_genome.tolist() == [[2, 2, 2, 1, 1, 1]] * 2
+
+    def test_should_materialize_classifier(self, cfg):
+        # given
+        parent = Classifier(
+            condition=Condition([UBR(1, 3), UBR(0, 15)], cfg),
+            action=1,
+            effect=Effect([UBR(5, 4), UBR(0, 15)], cfg),
+            quality=0.7,
+            reward=3.0,
+            tav=2.0,
+            cfg=cfg)
+        g = genome(parent)
+        g[0, 2:] = [6, 8]
+
+        # when
+        cl = materialize(g, parent, 10)
+
+        # then
+        assert cl.condition == Condition([UBR(1, 3), UBR(6, 8)], cfg)
+        assert cl.effect == parent.effect
+        assert cl.action == 1
+        assert (cl.q, cl.r, cl.tav) == (0.7, 3.0, 2.0)
+        assert (cl.tga, cl.talp) == (10, 10)
+        assert cl.is_marked() is False
@@ -177,6 +177,10 @@ class TestClassifier:
         assert cl.action == copied_cl.action
         assert cl.effect == copied_cl.effect
         assert cl.effect is not copied_cl.effect
+        assert all(c0 is not c1 for c0, c1
+                   in zip(cl.condition, copied_cl.condition))
+        assert all(e0 is not e1 for e0, e1
+                   in zip(cl.effect, copied_cl.effect))
         assert copied_cl.is_marked() is False
         assert cl.r == copied_cl.r
         assert cl.q == copied_cl.q
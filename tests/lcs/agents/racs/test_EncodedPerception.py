@@ -0,0 +1,83 @@
+from unittest.mock import patch
+
+import pytest
+
+from lcs import Perception
+from lcs.agents.racs import Configuration, Condition, ClassifierList, \
+    Classifier, EncodedPerception
+from lcs.agents.racs.EncodedPerception import encode
+from lcs.representations import UBR
+from lcs.representations.RealValueEncoder import RealValueEncoder
+
+
+class TestEncodedPerception:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(classifier_length=2,
+                             number_of_possible_actions=2,
+                             encoder=RealValueEncoder(4))
+
+    def test_should_encode_once(self, cfg):
+        # when
+        p = EncodedPerception([.5, 1.], cfg.encoder)
+
+        # then
+        assert p == Perception([.5, 1.], oktypes=(float,))
+        assert p.encoded == (8, 15)
+        assert encode(p, cfg.encoder) is p.encoded
+        assert EncodedPerception.of(p, cfg.encoder) is p
+
+    def test_should_encode_raw_perception(self, cfg):
+        # given
+        p = Perception([.5, 1.], oktypes=(float,))
+
+        # then
+        assert list(encode(p, cfg.encoder)) == [8, 15]
+        assert EncodedPerception.of(p, cfg.encoder).encoded == (8, 15)
+
+    def test_should_reencode_with_other_encoder(self, cfg):
+        # given
+        p = EncodedPerception([.5, 1.], cfg.encoder)
+
+        # when
+        other = EncodedPerception.of(p, RealValueEncoder(2))
+
+        # then
+        assert other.encoded == (2, 3)
+
+    def test_should_deny_encoding_illegal_values(self, cfg):
+        with pytest.raises(ValueError):
+            EncodedPerception([.5, 1.5], cfg.encoder)
+
+    def test_should_form_match_set_encoding_situation_once(self, cfg):
+        # given
+        population = ClassifierList(*[
+            Classifier(condition=Condition([UBR(0, i), UBR(0, 15)], cfg),
+                       cfg=cfg)
+            for i in range(10)])
+        p = Perception([.5, .5], oktypes=(float,))
+
+        # when
+        with patch.object(cfg.encoder, 'encode',
+                          wraps=cfg.encoder.encode) as encoder:
+            match_set = population.form_match_set(p)
+
+        # then
+        assert len(match_set) == 2
+        assert encoder.call_count == len(p)
+
+    def test_should_behave_like_perception(self, cfg):
+        # given
+        p = EncodedPerception([.5, 1.], cfg.encoder)
+        raw = Perception([.5, 1.], oktypes=(float,))
+
+        # then
+        assert p.oktypes == (float,)
+        assert repr(p) == repr(raw) == '0.5 1.0'
+        assert p == raw
+        assert hash(p) == hash(raw)
+        assert len(p) == 2
+        assert p[1] == 1.
+        assert list(p) == [.5, 1.]
+        assert p.uid is None
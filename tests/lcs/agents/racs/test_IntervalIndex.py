@@ -0,0 +1,65 @@
+import random
+
+from lcs.agents.racs.IntervalIndex import IntervalIndex
+
+
+class TestIntervalIndex:
+
+    def test_should_find_containing_rectangles(self):
+        # given
+        index = IntervalIndex(2, (0, 15))
+        index.add(((0, 15), (0, 15)), 'generic')
+        index.add(((2, 5), (7, 7)), 'narrow')
+        index.add(((6, 9), (0, 15)), 'other')
+
+        # then
+        assert sorted(index.query((3, 7))) == ['generic', 'narrow']
+        assert sorted(index.query((3, 8))) == ['generic']
+        assert sorted(index.query((9, 0))) == ['generic', 'other']
+
+    def test_should_reindex_and_remove(self):
+        # given
+        item = 'item'
+        index = IntervalIndex(1, (0, 7))
+        index.add(((0, 3),), item)
+
+        # when
+        index.add(((4, 7),), item)
+
+        # then
+        assert len(index) == 1
+        assert index.bounds(item) == ((4, 7),)
+        assert index.query((2,)) == []
+        assert index.query((5,)) == [item]
+
+        # when
+        index.remove(item)
+
+        # then
+        assert len(index) == 0
+        assert index.query((5,)) == []
+
+    def test_should_query_the_same_as_scan(self):
+        # given
+        random.seed(42)
+        index = IntervalIndex(3, (0, 31))
+        rectangles = {}
+
+        for i in range(200):
+            bounds = tuple(tuple(sorted((random.randint(0, 31),
+                                         random.randint(0, 31))))
+                           for _ in range(3))
+            rectangles[i] = bounds
+            index.add(bounds, i)
+
+        for i in range(0, 200, 3):
+            index.remove(i)
+            del rectangles[i]
+
+        # then
+        for _ in range(100):
+            point = [random.randint(0, 31) for _ in range(3)]
+            expected = [i for i, bounds in rectangles.items()
+                        if all(lo <= p <= up
+                               for p, (lo, up) in zip(point, bounds))]
+            assert sorted(index.query(point)) == expected
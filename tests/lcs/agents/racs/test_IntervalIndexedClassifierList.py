@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+from lcs import Perception
+from lcs.agents.racs import Configuration, Classifier, ClassifierList, \
+    Condition, IntervalIndexedClassifierList
+from lcs.agents.racs.components.genetic_algorithm import mutate, crossover
+from lcs.representations import UBR
+from lcs.representations.RealValueEncoder import RealValueEncoder
+
+
+class TestIntervalIndexedClassifierList:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(classifier_length=2,
+                             number_of_possible_actions=2,
+                             encoder=RealValueEncoder(4))
+
+    @staticmethod
+    def _random_cl(cfg):
+        cond = Condition([UBR(random.randint(0, 15), random.randint(0, 15))
+                          for _ in range(cfg.classifier_length)], cfg)
+        return Classifier(condition=cond,
+                          action=random.randrange(2),
+                          cfg=cfg)
+
+    def test_should_form_match_set_in_population_order(self, cfg):
+        # given
+        cl_1 = Classifier(condition=Condition([UBR(0, 8), UBR(15, 10)], cfg),
+                          cfg=cfg)
+        cl_2 = Classifier(cfg=cfg)
+        cl_3 = Classifier(condition=Condition([UBR(9, 15), UBR(0, 15)], cfg),
+                          cfg=cfg)
+        population = IntervalIndexedClassifierList(cl_1, cl_2, cl_3)
+
+        # when
+        match_set = population.form_match_set(
+            Perception([.5, .75], oktypes=(float,)))
+
+        # then
+        assert type(match_set) is ClassifierList
+        assert list(match_set) == [cl_1, cl_2]
+
+    def test_should_form_empty_match_set_from_empty_population(self):
+        assert len(IntervalIndexedClassifierList().form_match_set(
+            Perception([.5, .5], oktypes=(float,)))) == 0
+
+    def test_should_refresh_condition_modified_in_place(self, cfg):
+        # given
+        cl = Classifier(condition=Condition([UBR(0, 2), UBR(0, 15)], cfg),
+                        cfg=cfg)
+        population = IntervalIndexedClassifierList(cl)
+        p = Perception([.5, .5], oktypes=(float,))
+        assert len(population.form_match_set(p)) == 0
+
+        # when
+        cl.condition.generalize(0)
+        population.refresh(cl)
+
+        # then
+        assert len(population.form_match_set(p)) == 1
+
+    def test_should_behave_the_same_as_plain_list(self, cfg):
+        # given
+        random.seed(42)
+        indexed = IntervalIndexedClassifierList()
+        plain = ClassifierList()
+
+        for _ in range(300):
+            cl = self._random_cl(cfg)
+            indexed.append(cl)
+            plain.append(cl)
+
+        for _ in range(100):
+            cl = random.choice(plain)
+            indexed.safe_remove(cl)
+            plain.safe_remove(cl)
+
+        # when
+        for cl in random.sample(list(plain), 50):
+            mutate(cl, 1.0)
+            indexed.refresh(cl)
+
+        for cl1, cl2 in zip(plain[:20], plain[20:40]):
+            crossover(cl1, cl2)
+            indexed.refresh(cl1)
+            indexed.refresh(cl2)
+
+        # then
+        for _ in range(50):
+            p = Perception([random.random(), random.random()],
+                           oktypes=(float,))
+            assert list(indexed.form_match_set(p)) == \
+                list(plain.form_match_set(p))
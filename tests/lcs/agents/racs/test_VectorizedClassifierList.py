@@ -0,0 +1,109 @@
+import random
+
+import pytest
+
+from lcs import Perception
+from lcs.agents.racs import Configuration, Classifier, ClassifierList, \
+    Condition, VectorizedClassifierList
+from lcs.agents.racs.metrics import count_averaged_regions
+from lcs.representations import UBR
+from lcs.representations.RealValueEncoder import RealValueEncoder
+
+
+class TestVectorizedClassifierList:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(classifier_length=2,
+                             number_of_possible_actions=2,
+                             encoder=RealValueEncoder(4))
+
+    @staticmethod
+    def _random_cl(cfg):
+        cond = Condition([UBR(random.randint(0, 15), random.randint(0, 15))
+                          for _ in range(cfg.classifier_length)], cfg)
+        return Classifier(condition=cond,
+                          action=random.randrange(2),
+                          cfg=cfg)
+
+    def test_should_form_match_set(self, cfg):
+        # given
+        cl_1 = Classifier(cfg=cfg)
+        cl_2 = Classifier(condition=Condition([UBR(0, 8), UBR(15, 10)], cfg),
+                          cfg=cfg)
+        cl_3 = Classifier(condition=Condition([UBR(9, 15), UBR(0, 15)], cfg),
+                          cfg=cfg)
+        population = VectorizedClassifierList(cl_1, cl_2, cl_3)
+
+        # when
+        match_set = population.form_match_set(
+            Perception([.5, .75], oktypes=(float,)))
+
+        # then
+        assert type(match_set) is ClassifierList
+        assert list(match_set) == [cl_1, cl_2]
+
+    def test_should_form_empty_match_set_from_empty_population(self):
+        assert len(VectorizedClassifierList().form_match_set(
+            Perception([.5, .5], oktypes=(float,)))) == 0
+
+    def test_should_refresh_condition_modified_in_place(self, cfg):
+        # given
+        cl = Classifier(condition=Condition([UBR(0, 2), UBR(0, 15)], cfg),
+                        cfg=cfg)
+        population = VectorizedClassifierList(cl)
+        p = Perception([.5, .5], oktypes=(float,))
+        assert len(population.form_match_set(p)) == 0
+
+        # when
+        cl.condition.generalize(0)
+        population.refresh(cl)
+
+        # then
+        assert len(population.form_match_set(p)) == 1
+
+    def test_should_find_incorporating_and_incorporated(self, cfg):
+        # given
+        cl_1 = Classifier(cfg=cfg)
+        cl_2 = Classifier(condition=Condition([UBR(2, 8), UBR(0, 15)], cfg),
+                          cfg=cfg)
+        cl_3 = Classifier(condition=Condition([UBR(4, 5), UBR(1, 2)], cfg),
+                          cfg=cfg)
+        population = VectorizedClassifierList(cl_1, cl_2, cl_3)
+
+        # then
+        assert list(population.find_incorporating(cl_2.condition)) == \
+            [cl_1, cl_2]
+        assert list(population.find_incorporated(cl_2.condition)) == \
+            [cl_2, cl_3]
+
+    def test_should_behave_the_same_as_plain_list(self, cfg):
+        # given
+        random.seed(42)
+        vectorized = VectorizedClassifierList()
+        plain = ClassifierList()
+
+        for _ in range(300):
+            cl = self._random_cl(cfg)
+            vectorized.append(cl)
+            plain.append(cl)
+
+        for _ in range(100):
+            cl = random.choice(plain)
+            vectorized.safe_remove(cl)
+            plain.safe_remove(cl)
+
+        # then
+        for _ in range(50):
+            p = Perception([random.random(), random.random()],
+                           oktypes=(float,))
+            assert list(vectorized.form_match_set(p)) == \
+                list(plain.form_match_set(p))
+
+        condition = self._random_cl(cfg).condition
+        assert list(vectorized.find_incorporating(condition)) == \
+            [cl for cl in plain if cl.condition.subsumes(condition)]
+        assert vectorized.cover_ratios().tolist() == \
+            pytest.approx([cl.condition.cover_ratio for cl in plain])
+        assert count_averaged_regions(vectorized) == \
+            pytest.approx(count_averaged_regions(plain))
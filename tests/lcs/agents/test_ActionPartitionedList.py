@@ -0,0 +1,235 @@
+import random
+
+import pytest
+
+from lcs.agents import ActionPartitionedList
+from lcs.agents.acs2 import Configuration, Classifier, ClassifiersList
+from lcs.strategies.subsumption import find_subsumers
+
+
+class TestActionPartitionedList:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(
+            classifier_length=4,
+            number_of_possible_actions=4)
+
+    def test_should_group_by_action(self, cfg):
+        # given
+        cl_1 = Classifier(action=0, cfg=cfg)
+        cl_2 = Classifier(action=1, cfg=cfg)
+        cl_3 = Classifier(action=0, cfg=cfg)
+        lst = ActionPartitionedList(cl_1, cl_2, cl_3, oktypes=(Classifier,))
+
+        # then
+        assert lst.actions == {0, 1}
+        assert lst.by_action(0) == [cl_1, cl_3]
+        assert lst.by_action(1) == [cl_2]
+        assert lst.by_action(2) == []
+        assert lst.partition() == {0: [cl_1, cl_3], 1: [cl_2]}
+
+    def test_should_stay_in_sync_when_modified(self, cfg):
+        # given
+        cl_1 = Classifier(action=0, cfg=cfg)
+        cl_2 = Classifier(action=1, cfg=cfg)
+        cl_3 = Classifier(action=0, cfg=cfg)
+        lst = ClassifiersList(cl_1)
+        assert lst.by_action(0) == [cl_1]
+
+        # when
+        lst.append(cl_2)
+        lst.insert(0, cl_3)
+
+        # then
+        assert lst.by_action(0) == [cl_3, cl_1]
+
+        # when
+        lst.safe_remove(cl_2)
+        lst[0] = cl_2
+
+        # then
+        assert lst.actions == {0, 1}
+        assert lst.by_action(0) == [cl_1]
+        assert lst.by_action(1) == [cl_2]
+
+        # when
+        lst.sort(key=lambda cl: -cl.action)
+        del lst[:1]
+
+        # then
+        assert lst.actions == {0}
+
+    def test_should_find_similar(self, cfg):
+        # given
+        cl_1 = Classifier(condition='1###', action=0, cfg=cfg)
+        cl_2 = Classifier(condition='1###', action=1, cfg=cfg)
+        cl_3 = Classifier(condition='1###', action=0, cfg=cfg)
+        lst = ClassifiersList(cl_1, cl_2)
+
+        # then
+        assert lst.find_similar(cl_3) == [cl_1]
+
+        # when
+        lst.append(cl_3)
+        lst.remove(cl_1)
+
+        # then
+        assert lst.find_similar(cl_1) == [cl_3]
+        assert lst.find_similar(cl_2) == [cl_2]
+
+    def test_should_form_action_set_as_plain_scan(self, cfg):
+        # given
+        random.seed(42)
+        population = ClassifiersList()
+        for _ in range(200):
+            population.append(
+                Classifier(action=random.randrange(4), cfg=cfg))
+        population.form_action_set(0)
+
+        for _ in range(50):
+            population.remove(random.choice(population))
+
+        # then
+        for action in range(4):
+            expected = [cl for cl in population if cl.action == action]
+            action_set = population.form_action_set(action)
+            assert type(action_set) is ClassifiersList
+            assert list(action_set) == expected
+
+    def test_should_find_subsumers(self, cfg):
+        # given
+        cl = Classifier(condition='11#1', action=0, effect='0###', cfg=cfg)
+        sub_1 = Classifier(condition='1##1', action=0, effect='0###',
+                           quality=0.95, experience=30, cfg=cfg)
+        sub_2 = Classifier(condition='1###', action=0, effect='0###',
+                           quality=0.95, experience=30, cfg=cfg)
+        other_effect = Classifier(condition='1###', action=0, effect='1###',
+                                  quality=0.95, experience=30, cfg=cfg)
+        inexperienced = Classifier(condition='####', action=0, effect='0###',
+                                   quality=0.95, cfg=cfg)
+        lst = ClassifiersList(sub_1, other_effect, inexperienced, sub_2)
+
+        # then
+        assert lst.find_subsumers(cl, cfg.theta_exp) == [sub_2, sub_1]
+
+        # when
+        inexperienced.exp = 30
+        lst.refresh(inexperienced)
+        lst.remove(sub_2)
+
+        # then
+        assert lst.find_subsumers(cl, cfg.theta_exp) == [inexperienced, sub_1]
+
+    def test_should_find_subsumers_as_plain_scan(self, cfg):
+        # given
+        random.seed(42)
+        population = ClassifiersList()
+        for _ in range(300):
+            population.append(Classifier(
+                condition=''.join(random.choice('01#') for _ in range(4)),
+                action=random.randrange(2),
+                effect=''.join(random.choice('01#') for _ in range(4)),
+                quality=random.random(),
+                experience=random.randrange(40),
+                cfg=cfg))
+
+        # when
+        for cl in random.sample(list(population), 100):
+            cl.q = random.random()
+            cl.exp += 10
+            population.refresh(cl)
+
+        # then
+        for cl in random.sample(list(population), 50):
+            assert population.find_subsumers(cl, cfg.theta_exp) == \
+                find_subsumers(cl, population, cfg.theta_exp)
+
+    def test_should_remove_as_plain_list(self, cfg):
+        # given
+        random.seed(42)
+
+        def random_cl():
+            return Classifier(
+                condition=''.join(random.choice('01#') for _ in range(4)),
+                action=random.randrange(4),
+                cfg=cfg)
+
+        population = ClassifiersList()
+        plain = []
+
+        # when
+        for step in range(2000):
+            # grow the list first, then shrink it (to compact tombstones)
+            p_append = 0.7 if step < 1000 else 0.3
+            if random.random() < p_append or len(plain) == 0:
+                cl = random_cl()
+                population.append(cl)
+                plain.append(cl)
+            else:
+                # equal (not necessarily the same) classifier is removed
+                cl = random_cl() if random.random() < 0.5 \
+                    else random.choice(plain)
+                population.safe_remove(cl)
+                if cl in plain:
+                    plain.remove(cl)
+
+            # then
+            assert len(population) == len(plain)
+
+        assert all(a is b for a, b in zip(population, plain))
+
+    def test_should_journal_changes(self, cfg):
+        # given
+        cl_1 = Classifier(condition='1###', cfg=cfg)
+        cl_2 = Classifier(condition='0###', cfg=cfg)
+        lst = ClassifiersList(cl_1)
+        generation = lst.checkpoint()
+        assert lst.changes_since(generation) == []
+
+        # when
+        lst.append(cl_2)
+        lst.remove(cl_1)
+
+        # then
+        assert lst.changes_since(generation) == [(True, cl_2), (False, cl_1)]
+
+        # when
+        generation = lst.checkpoint()
+        cl_2.q = 0.9
+        lst.refresh(cl_2)
+
+        # then
+        assert lst.generation == generation
+
+        # when
+        cl_2.condition.generalize(0)
+        lst.refresh(cl_2)
+
+        # then
+        assert lst.generation > generation
+        assert lst.changes_since(generation) is None
+
+    def test_should_record_refreshed(self, cfg):
+        # given
+        cl_1 = Classifier(condition='1###', cfg=cfg)
+        cl_2 = Classifier(condition='0###', cfg=cfg)
+        lst = ClassifiersList(cl_1, cl_2)
+        lst.refresh(cl_1)
+        mark = lst.refresh_mark()
+        assert lst.refreshed_since(mark) == []
+
+        # when
+        lst.refresh(cl_2)
+        lst.refresh(cl_1)
+
+        # then
+        assert lst.refreshed_since(mark) == [cl_2, cl_1]
+
+        # when
+        for _ in range(2000):
+            lst.refresh(cl_1)
+
+        # then
+        assert lst.refreshed_since(mark) is None
+        assert lst.refreshed_since(lst.refresh_mark()) == []
@@ -1,3 +1,5 @@
+from copy import copy
+
 from lcs.agents import ImmutableSequence
 
 
@@ -5,3 +7,44 @@ class TestImmutableSequence:
     def test_should_hash(self):
         assert hash(ImmutableSequence('111')) == hash(ImmutableSequence('111'))
         assert hash(ImmutableSequence('111')) != hash(ImmutableSequence('112'))
+
+    def test_should_rehash_after_write(self):
+        # given
+        seq = ImmutableSequence('111')
+        assert hash(seq) == hash(ImmutableSequence('111'))
+
+        # when
+        seq[2] = '2'
+
+        # then
+        assert seq == ImmutableSequence('112')
+        assert hash(seq) == hash(ImmutableSequence('112'))
+
+    def test_should_update_many(self):
+        # given
+        seq = ImmutableSequence('1111')
+
+        # when
+        seq.update({0: '#', 3: '0'})
+        seq.update([(1, '#')])
+
+        # then
+        assert seq == ImmutableSequence('##10')
+        assert seq[1:3] == ('#', '1')
+        assert list(seq) == ['#', '#', '1', '0']
+
+    def test_should_not_share_writes_with_copies(self):
+        # given
+        seq = ImmutableSequence('111')
+        seq[0] = '0'
+
+        # when
+        copied = copy(seq)
+        constructed = ImmutableSequence(seq)
+        copied[1] = '0'
+        constructed[2] = '0'
+
+        # then
+        assert seq == ImmutableSequence('011')
+        assert copied == ImmutableSequence('001')
+        assert constructed == ImmutableSequence('010')
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from copy import copy
@@ -53,6 +55,12 @@ class TestClassifiersList:
             assert c.numerosity == 1
         assert classifiers_list_diff_actions[4] == cl
 
+    def test_insert_population_duplicate(self, classifiers_list_diff_actions, cfg, situation):
+        cl = Classifier(cfg=cfg, condition=Condition(situation), action=2, time_stamp=0)
+        classifiers_list_diff_actions.insert_in_population(cl)
+        assert len(classifiers_list_diff_actions) == 4
+        assert classifiers_list_diff_actions[2].numerosity == 2
+
     def test_covering(self, cfg):
         classifiers_list = ClassifiersList(cfg)
         covering_cl = classifiers_list.generate_covering_classifier(Perception("1111"), 0, 0)
@@ -69,18 +77,17 @@ class TestClassifiersList:
         classifiers_list.delete_from_population()
         assert sum(cl.numerosity for cl in classifiers_list) <= cfg.max_population
 
-    def test_removes_correct_one(self, cfg):
+    def test_removes_correct_one(self, cfg, monkeypatch):
+        cfg.max_population = 4
         classifiers_list = ClassifiersList(cfg)
         classifiers_list.insert_in_population(Classifier(cfg, Condition("1111"), 0, 0))
         classifiers_list.insert_in_population(Classifier(cfg, Condition("1110"), 1, 0))
         classifiers_list.insert_in_population(Classifier(cfg, Condition("0000"), 0, 0))
         classifiers_list.insert_in_population(Classifier(cfg, Condition("1100"), 2, 0))
         classifiers_list.insert_in_population(Classifier(cfg, Condition("1000"), 3, 0))
-        deletion_votes = []
-        for _ in range(len(classifiers_list)):
-            deletion_votes.append(1)
-        selector = sum(deletion_votes) / 2
-        classifiers_list._remove_based_on_votes(deletion_votes, selector)
+        # equal votes, the selector points at the middle of the wheel
+        monkeypatch.setattr(random, "uniform", lambda a, b: (a + b) / 2)
+        classifiers_list.delete_from_population()
         assert not any(cl.does_match("0000") for cl in classifiers_list)
         assert len(classifiers_list) == 4
 
@@ -124,3 +131,38 @@ class TestClassifiersList:
             assert c.experience > 0
             assert c.prediction != cl.prediction
             assert c.error != cl.error
+
+    def test_should_keep_running_totals(self, cfg, classifiers_list_diff_actions):
+        population = classifiers_list_diff_actions
+        assert population.numerosity == 4
+
+        cl = Classifier(cfg, Condition("1111"), 0, 0)
+        cl.fitness = 0.5
+        population.insert_in_population(cl)
+        population.insert_in_population(Classifier(cfg, Condition("1111"), 0, 0))
+        assert population.numerosity == 6
+
+        cl.fitness = 1.5
+        population.refresh(cl)
+        population.safe_remove(population[0])
+        assert population.numerosity == 5
+        assert population.fitness == pytest.approx(
+            sum(c.fitness for c in population))
+
+        population.update_set(0.2)
+        assert population.fitness == pytest.approx(
+            sum(c.fitness for c in population))
+
+    def test_should_delete_from_large_population(self, cfg):
+        classifiers_list = ClassifiersList(cfg)
+        for i in range(cfg.max_population):
+            classifiers_list.insert_in_population(
+                Classifier(cfg, Condition(format(i, '08b')), 0, 0))
+        classifiers_list.delete_from_population()
+        assert len(classifiers_list) == cfg.max_population
+
+        for i in range(50):
+            cl = Classifier(cfg, Condition(format(i, '08b')), 1, 0)
+            classifiers_list.insert_in_population(cl)
+            classifiers_list.delete_from_population()
+            assert classifiers_list.numerosity == cfg.max_population
@@ -142,6 +142,8 @@ class TestXCS:
         assert id(child2) != id(classifiers_list_diff_actions[0])
         assert id(child1) != id(classifiers_list_diff_actions[1])
         assert id(child2) != id(classifiers_list_diff_actions[1])
+        assert child1.condition is not classifiers_list_diff_actions[0].condition
+        assert child2.condition is not classifiers_list_diff_actions[1].condition
 
     def test_do_ga_subsumption_does_subsume_true(self, cfg, classifiers_list_diff_actions, situation):
         cfg.do_GA_subsumption = True
@@ -46,6 +46,63 @@ class TestRealValueEncoder:
     def test_should_encode(self, _bits, _val, _encoded):
         assert RealValueEncoder(_bits).encode(_val) == _encoded
 
+    @pytest.mark.parametrize("_bits", range(1, 11))
+    def test_should_encode_into_the_same_buckets_as_splits(self, _bits):
+        # given
+        encoder = RealValueEncoder(_bits)
+        values = [random.random() for _ in range(200)] + encoder.splits + \
+            [np.nextafter(x, 0) for x in encoder.splits[1:]]
+
+        def encode_with_splits(val):
+            # bucket `i` spans [splits[i], splits[i + 1])
+            for i, (x1, x2) in enumerate(zip(encoder.splits,
+                                             encoder.splits[1:])):
+                if x1 <= val < x2:
+                    return i
+            return encoder.upper_max
+
+        # when
+        encoded = [encoder.encode(val) for val in values]
+
+        # then
+        assert encoded == [encode_with_splits(val) for val in values]
+        assert encoder.encode_batch(np.array(values)).tolist() == encoded
+
+    @pytest.mark.parametrize("_noise", [0.0, 0.1, -0.1])
+    def test_should_encode_batch_with_noise(self, _noise):
+        # given
+        encoder = RealValueEncoder(4)
+        values = np.random.random((10, 3))
+
+        # when
+        encoded = encoder.encode_batch(values, _noise)
+
+        # then
+        assert encoded.shape == (10, 3)
+        assert encoded.tolist() == [[encoder.encode(v, _noise) for v in row]
+                                    for row in values]
+
+    def test_should_deny_encoding_illegal_values_in_batch(self):
+        # given
+        encoder = RealValueEncoder(2)
+
+        # then
+        with pytest.raises(ValueError):
+            encoder.encode_batch(np.array([0.2, 1.1]))
+
+    def test_should_decode_batch(self):
+        # given
+        encoder = RealValueEncoder(4)
+
+        # when
+        decoded = encoder.decode_batch(np.array([0, 8, 15]))
+
+        # then
+        assert decoded.tolist() == [encoder.decode(v) for v in [0, 8, 15]]
+
+        with pytest.raises(ValueError):
+            encoder.decode_batch(np.array([16]))
+
     def test_should_decode_values(self):
         # given
         bits = 4
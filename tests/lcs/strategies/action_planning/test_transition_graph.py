@@ -0,0 +1,171 @@
+import random
+from unittest.mock import patch
+
+import pytest
+
+from lcs import Perception
+from lcs.agents.acs2 import Configuration, ClassifiersList, Classifier, \
+    Effect, ProbabilityEnhancedAttribute
+from lcs.strategies.action_planning.goal_sequence_searcher \
+    import GoalSequenceSearcher
+from lcs.strategies.action_planning.transition_graph import TransitionGraph
+
+
+class TestTransitionGraph:
+
+    @pytest.fixture
+    def cfg(self):
+        return Configuration(
+            classifier_length=4,
+            number_of_possible_actions=4,
+            theta_r=0.9)
+
+    @staticmethod
+    def _random_cl(cfg):
+        condition = ''.join(random.choice('01##') for _ in range(4))
+        effect = ''.join(random.choice('01##') for _ in range(4))
+        return Classifier(condition=condition,
+                          action=random.randrange(4),
+                          effect=effect,
+                          quality=random.random(),
+                          cfg=cfg)
+
+    def test_should_form_transitions_of_reliable_classifiers(self, cfg):
+        # given
+        cl_1 = Classifier(condition="0###", action=1, effect="1###",
+                          quality=0.95, cfg=cfg)
+        cl_2 = Classifier(condition="0###", action=2, effect="#1##",
+                          quality=0.5, cfg=cfg)
+        cl_3 = Classifier(condition="##0#", action=3, effect="##1#",
+                          quality=0.95, cfg=cfg)
+        graph = TransitionGraph()
+
+        # when
+        graph.update(ClassifiersList(cl_1, cl_2, cl_3))
+
+        # then
+        assert len(graph) == 2
+        assert graph.forward(Perception('0000')) == \
+            [(cl_1, Perception('1000')), (cl_3, Perception('0010'))]
+        assert graph.backward(Perception('1010')) == \
+            [(cl_1, Perception('0010')), (cl_3, Perception('1000'))]
+
+    def test_should_intern_anticipations(self, cfg):
+        # given
+        cl_1 = Classifier(condition="0###", action=1, effect="1###",
+                          quality=0.95, cfg=cfg)
+        cl_2 = Classifier(condition="#0##", action=2, effect="1###",
+                          quality=0.95, cfg=cfg)
+        graph = TransitionGraph()
+        graph.update(ClassifiersList(cl_1, cl_2))
+
+        # when
+        (_, p1), (_, p2) = graph.forward(Perception('0000'))
+
+        # then
+        assert p1 is p2
+        assert graph.node(Perception('1000')) is p1
+
+    def test_should_update_transitions(self, cfg):
+        # given
+        cl_1 = Classifier(condition="0###", action=1, effect="1###",
+                          quality=0.95, cfg=cfg)
+        cl_2 = Classifier(condition="0###", action=2, effect="#1##",
+                          quality=0.5, cfg=cfg)
+        population = ClassifiersList(cl_1, cl_2)
+        graph = TransitionGraph()
+        graph.update(population)
+        p0 = Perception('0000')
+        assert [cl for cl, _ in graph.forward(p0)] == [cl_1]
+
+        # when & then (becomes reliable)
+        cl_2.q = 0.95
+        population.refresh(cl_2)
+        graph.update(population)
+        assert [cl for cl, _ in graph.forward(p0)] == [cl_1, cl_2]
+
+        # when & then (loses reliability)
+        cl_1.q = 0.5
+        population.refresh(cl_1)
+        graph.update(population)
+        assert [cl for cl, _ in graph.forward(p0)] == [cl_2]
+
+        # when & then (gets deleted)
+        population.safe_remove(cl_2)
+        graph.update(population)
+        assert graph.forward(p0) == []
+
+    def test_should_update_enhanced_effect_in_place(self, cfg):
+        # given
+        cl = Classifier(condition="0###", action=1, quality=0.95,
+                        effect=Effect([ProbabilityEnhancedAttribute(
+                            {'1': 0.6, '0': 0.4}), '#', '#', '#']),
+                        cfg=cfg)
+        population = ClassifiersList(cl)
+        graph = TransitionGraph()
+        graph.update(population)
+        p0 = Perception('0000')
+        assert graph.forward(p0) == [(cl, Perception('1000'))]
+
+        # when
+        cl.effect.update_enhanced_effect_probs(p0, 0.5)
+        population.refresh(cl)
+        graph.update(population)
+
+        # then
+        assert graph.forward(p0) == [(cl, Perception('0000'))]
+
+    def test_should_examine_only_modified_classifiers(self, cfg):
+        # given
+        random.seed(42)
+        population = ClassifiersList(
+            *[self._random_cl(cfg) for _ in range(100)])
+        graph = TransitionGraph()
+        graph.update(population)
+
+        cl_1, cl_2 = population[10], population[20]
+        cl_1.q, cl_2.q = 0.95, 0.5
+        population.refresh(cl_1)
+        population.refresh(cl_2)
+        cl_3 = self._random_cl(cfg)
+        population.append(cl_3)
+
+        # when
+        with patch.object(Classifier, 'is_reliable', autospec=True,
+                          side_effect=lambda cl: cl.q > cfg.theta_r) \
+                as is_reliable:
+            graph.update(population)
+
+        # then
+        assert sorted(id(c.args[0]) for c in is_reliable.call_args_list) \
+            == sorted(id(cl) for cl in [cl_1, cl_2, cl_3])
+        assert len(graph) == \
+            sum(1 for cl in population if cl.is_reliable())
+
+    def test_should_search_the_same_as_classifiers_list(self, cfg):
+        # given
+        random.seed(42)
+        population = ClassifiersList(
+            *[self._random_cl(cfg) for _ in range(100)])
+        graph = TransitionGraph()
+
+        for _ in range(50):
+            # when
+            start = Perception(random.choices('01', k=4))
+            goal = Perception(random.choices('01', k=4))
+
+            graph.update(population)
+            reliable = ClassifiersList(
+                *[cl for cl in population if cl.is_reliable()])
+
+            # then
+            assert GoalSequenceSearcher().search_goal_sequence(
+                graph, start, goal) == GoalSequenceSearcher()\
+                .search_goal_sequence(reliable, start, goal)
+
+            # the model changes between the searches
+            for cl in random.sample(list(population), 10):
+                cl.q = random.random()
+                population.refresh(cl)
+            population.safe_remove(random.choice(population))
+            population.append(self._random_cl(cfg))
@@ -1,4 +1,5 @@
 import itertools
+import random
 from dataclasses import dataclass
 
 import numpy as np
@@ -6,6 +7,7 @@ import pytest
 
 import lcs.agents.acs as acs
 import lcs.agents.acs2 as acs2
+import lcs.strategies.anticipatory_learning_process as alp
 import lcs.strategies.genetic_algorithms as ga
 from lcs import Perception
 
@@ -51,6 +53,48 @@ class TestGeneticAlgorithms:
 
         assert stats[cl1.id] > stats[cl2.id] * 10 > stats[cl3.id] * 10
 
+    def test_roulette_wheel_selection_by_quality(self):
+        # given
+        cfg = acs2.Configuration(
+            classifier_length=4, number_of_possible_actions=2)
+        cl1 = acs2.Classifier(
+            condition='1###', quality=.9, numerosity=1, cfg=cfg)
+        cl2 = acs2.Classifier(
+            condition='2###', quality=.5, numerosity=2, cfg=cfg)
+        cl3 = acs2.Classifier(
+            condition='3###', quality=.0, numerosity=5, cfg=cfg)
+        pop = [cl1, cl2, cl3]
+
+        # when
+        results = []
+        for _ in range(1000):
+            results.extend(ga.roulette_wheel_selection(
+                pop, lambda cl: pow(cl.q, 3) * cl.num))
+
+        # then
+        assert results.count(cl1) > results.count(cl2) > 0
+        assert results.count(cl3) == 0
+
+    def test_roulette_wheel_selection_with_equal_classifiers(self):
+        # given
+        cl1 = IdClassifier(1, 0.5)
+        cl2 = IdClassifier(1, 0.5)
+        cl3 = IdClassifier(2, 0.5)
+        pop = [cl1, cl2, cl3]
+
+        # when
+        results = []
+        for _ in range(1000):
+            results.extend(ga.roulette_wheel_selection(pop, lambda cl: cl.q))
+
+        # then
+        # each object keeps its own share of the wheel
+        assert sum(1 for cl in results if cl is cl2) > 500
+
+    def test_roulette_wheel_selection_from_empty_population(self):
+        assert ga.roulette_wheel_selection([], lambda cl: cl.q) == \
+            (None, None)
+
     @pytest.mark.parametrize("_mu, _cond1, _cond2", [
         (0.0, '1234', '1234'),
         (1.0, '1234', '####')
@@ -153,6 +197,70 @@ class TestGeneticAlgorithms:
         assert sum(cl.num for cl in population) == 18
         assert sum(cl.num for cl in action_set) == 8
 
+    def test_should_select_for_deletion_as_expanded_action_set(self):
+        # given
+        cfg = acs2.Configuration(
+            classifier_length=4, number_of_possible_actions=2)
+        clss = [acs2.Classifier(quality=q, numerosity=num, cfg=cfg)
+                for q, num in [(.2, 1), (.5, 4), (.8, 10), (.25, 2)]]
+        action_set = acs2.ClassifiersList(*clss)
+
+        def select_expanded():
+            # original selection over all micro-classifiers
+            cl_del = None
+            while cl_del is None:
+                for cl in action_set.expand():
+                    if random.random() < ga.DELETION_PROBABILITY:
+                        if cl_del is None or \
+                                ga._is_preferred_to_delete(cl_del, cl):
+                            cl_del = cl
+            return cl_del
+
+        # when
+        random.seed(42)
+        expected = [select_expanded() for _ in range(5000)]
+        selected = [ga._select_for_deletion(action_set)
+                    for _ in range(5000)]
+
+        # then
+        for cl in clss:
+            assert abs(selected.count(cl) - expected.count(cl)) < 250
+
+    def test_should_select_for_deletion_reproducibly(self):
+        # given
+        cfg = acs2.Configuration(
+            classifier_length=4, number_of_possible_actions=2)
+        action_set = acs2.ClassifiersList(
+            *[acs2.Classifier(quality=q, numerosity=num, cfg=cfg)
+              for q, num in [(.2, 1), (.5, 4), (.8, 10), (.25, 2)]])
+
+        def select():
+            return [id(ga._select_for_deletion(action_set))
+                    for _ in range(50)]
+
+        # when
+        random.seed(42)
+        selected = select()
+        random.seed(42)
+
+        # then
+        assert select() == selected
+
+    def test_should_delete_from_highly_numerous_classifiers(self):
+        # given
+        cfg = acs2.Configuration(
+            classifier_length=4, number_of_possible_actions=2)
+        clss = [acs2.Classifier(action=1, numerosity=10 ** 6, cfg=cfg),
+                acs2.Classifier(action=1, numerosity=10 ** 6, cfg=cfg)]
+        population = acs2.ClassifiersList(*clss)
+        action_set = population.form_action_set(1)
+
+        # when
+        ga.delete_classifiers(population, None, action_set, 2, 2 * 10 ** 6)
+
+        # then
+        assert sum(cl.num for cl in action_set) == 2 * 10 ** 6 - 2
+
     def test_should_not_find_old_classifier(self):
         # given
         cfg = acs2.Configuration(
@@ -319,3 +427,65 @@ class TestGeneticAlgorithms:
         assert acs2.ClassifiersList(*[cl_1, cl_2, cl_3]) == population
         assert acs2.ClassifiersList(*[cl_1]) == match_set
         assert acs2.ClassifiersList(*[cl_1]) == action_set
+
+    def test_should_find_subsumer_refreshed_in_population(self):
+        # given
+        cfg = acs2.Configuration(
+            classifier_length=8, number_of_possible_actions=4)
+
+        subsumer = acs2.Classifier(
+            condition='1#######',
+            action=1,
+            experience=30,
+            quality=0.895,
+            cfg=cfg)
+        population = acs2.ClassifiersList(subsumer)
+        action_set = acs2.ClassifiersList(subsumer)
+
+        cl = acs2.Classifier(condition='11######', action=1, cfg=cfg)
+        assert population.find_subsumers(cl, cfg.theta_exp) == []
+
+        # when (becomes reliable during the ALP)
+        alp.add_classifier(
+            acs2.Classifier(condition='1#######', action=1, cfg=cfg),
+            action_set, acs2.ClassifiersList(), cfg.theta_exp, [population])
+
+        # then
+        assert subsumer.is_reliable()
+        assert population.find_subsumers(cl, cfg.theta_exp) == [subsumer]
+
+        # when
+        ga.add_classifier(cl, Perception('11000000'),
+                          population, None, action_set,
+                          do_subsumption=True, theta_exp=cfg.theta_exp)
+
+        # then
+        assert subsumer.num == 2
+        assert population == acs2.ClassifiersList(subsumer)
+
+    def test_should_ignore_subsumers_outside_action_set(self):
+        # given
+        cfg = acs2.Configuration(
+            classifier_length=8, number_of_possible_actions=4)
+
+        subsumer = acs2.Classifier(
+            condition='1##1####',
+            action=1,
+            experience=30,
+            quality=0.95,
+            cfg=cfg)
+        population = acs2.ClassifiersList(subsumer)
+        action_set = acs2.ClassifiersList()
+
+        cl = acs2.Classifier(condition='11##0###', action=1, cfg=cfg)
+        assert population.find_subsumers(cl, cfg.theta_exp) == [subsumer]
+
+        # when
+        ga.add_classifier(cl, Perception('11000000'),
+                          population, None, action_set,
+                          do_subsumption=True, theta_exp=cfg.theta_exp)
+
+        # then
+        assert subsumer.num == 1
+        assert population == acs2.ClassifiersList(subsumer, cl)
+        assert action_set == acs2.ClassifiersList(cl)
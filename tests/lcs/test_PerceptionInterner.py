@@ -0,0 +1,53 @@
+from lcs import Perception, PerceptionInterner
+
+
+class TestPerceptionInterner:
+
+    def test_should_return_canonical_perception(self):
+        # given
+        interner = PerceptionInterner()
+
+        # when
+        p1 = interner(['1', '0'])
+        p2 = interner(('1', '0'))
+        p3 = interner(Perception('10'))
+        p4 = interner('11')
+
+        # then
+        assert p1 is p2
+        assert p1 is p3
+        assert p1 == Perception('10')
+        assert p4 is not p1
+        assert p1.uid == 0
+        assert p4.uid == 1
+        assert interner.hits == 2
+        assert interner.misses == 2
+
+    def test_should_evict_least_recently_used(self):
+        # given
+        interner = PerceptionInterner(max_size=2)
+        p1 = interner('00')
+        interner('01')
+
+        # when
+        interner('00')
+        interner('10')
+
+        # then
+        assert len(interner) == 2
+        assert interner('00') is p1
+        assert interner('01').uid == 3
+
+    def test_should_not_intern_when_disabled(self):
+        # given
+        interner = PerceptionInterner(max_size=0)
+
+        # when
+        p1 = interner('00')
+        p2 = interner('00')
+
+        # then
+        assert p1 == p2
+        assert p1 is not p2
+        assert p1.uid is None
+        assert len(interner) == 0
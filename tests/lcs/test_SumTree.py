@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from lcs import SumTree
+
+
+class TestSumTree:
+
+    def test_should_compute_prefix_sums(self):
+        # given
+        tree = SumTree(capacity=2)
+
+        # when
+        for weight in [1.0, 2.0, 0.0, 3.0, 4.0]:
+            tree.append(weight)
+        tree[1] = 5.0
+
+        # then
+        assert len(tree) == 5
+        assert tree[1] == 5.0
+        assert tree.total == 13.0
+        assert tree.prefix(2) == 6.0
+
+    @pytest.mark.parametrize("value, index", [
+        (0.5, 0), (1.0, 0), (1.5, 1), (3.0, 1), (3.5, 3), (6.0, 3), (7.0, 4)
+    ])
+    def test_should_find_slot(self, value, index):
+        # given
+        tree = SumTree()
+        for weight in [1.0, 2.0, 0.0, 3.0]:
+            tree.append(weight)
+
+        # then
+        assert tree.find(value) == index
+
+    def test_should_find_the_same_slot_as_linear_scan(self):
+        # given
+        random.seed(42)
+        tree = SumTree()
+        weights = []
+        for _ in range(1000):
+            weight = random.choice([0, random.random()])
+            tree.append(weight)
+            weights.append(weight)
+
+        # then
+        for _ in range(100):
+            value = random.uniform(0, sum(weights))
+            cumulative = 0
+            for idx, weight in enumerate(weights):
+                cumulative += weight
+                if cumulative >= value:
+                    break
+            assert tree.find(value) == idx
@@ -132,3 +132,31 @@ class TestTypedList:
         # then
         sorted_lst = TypedList(*[1, 3, 5, 8], oktypes=(int,))
         assert lst == sorted_lst
+
+    def test_should_create_trusted_list(self):
+        # given
+        elems = [1, 2, "3"]
+
+        # when
+        lst = TypedList.from_trusted(*elems, oktypes=(int,))
+
+        # then
+        assert len(lst) == 3
+
+        with pytest.raises(TypeError):
+            lst.append("4")
+
+        # other lists are still checked
+        with pytest.raises(TypeError):
+            TypedList(*elems, oktypes=(int,))
+
+    def test_should_check_lists_built_by_trusted_constructor(self):
+        # given
+        class NestingList(TypedList):
+            def __init__(self, *args):
+                self.nested = TypedList("1", oktypes=(int,))
+                super().__init__(*args, oktypes=(int,))
+
+        # when & then
+        with pytest.raises(TypeError):
+            NestingList.from_trusted(1, 2)